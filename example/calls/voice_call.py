@@ -1,8 +1,6 @@
-import time
-
 import sdbus
 
-from sdbus_block.modemmanager import MMCall, MMModems
+from sdbus_block.modemmanager import MMCall, MMCallState, MMModems, MMSignalDispatcher
 
 # Enter your phone number here.
 phone_number = '*************'
@@ -34,22 +32,16 @@ def main():
 	print(f'Audio format: {call.audio_format}')
 
 	print('--- Start call ---')
-	start_time = time.monotonic()
-	call.start()
-	while True:
-		time.sleep(1)
-		current_state = call.state_text
-		print(f'Current call state: {current_state}')
-
+	with MMSignalDispatcher() as dispatcher:
+		dispatcher.on_call_state_changed(call, lambda old, new, reason: print(f'Current call state: {MMCallState(new).name}'))
+		call.start()
 		# Call termination check.
-		if current_state == 'MM_CALL_STATE_TERMINATED':
-			break
-
-		# Hangup call.
-		if time.monotonic() - start_time >= hangup_timeout:
+		try:
+			call.wait_for_state([MMCallState.MM_CALL_STATE_TERMINATED], hangup_timeout, dispatcher=dispatcher)
+		except TimeoutError:
+			# Hangup call.
 			print('Stopping call, hangup time.')
 			modem.voice.hangup_all()
-			break
 	print('--- Stop call ---')
 
 	modem.voice.delete_call(call_path)
@@ -0,0 +1,29 @@
+import asyncio
+import sys
+import time
+import sdbus
+from sdbus_async.modemmanager import MMEventHub, MMModems
+
+# Counts the signal messages read off the bus by a hub matching every ModemManager signal and by hubs scoped to the
+# first 1, 2, ... modems, each on its own connection to the system bus. Every message read wakes the process up,
+# whether or not the hub delivers an event for it. Signals not matching the scoped rules are dropped by the bus daemon.
+
+
+async def main(seconds: float):
+	paths = sorted(modem._dbus.object_path for modem in await MMModems(sdbus.sd_bus_open_system()).get_modems())
+	if not paths:
+		print('no modem found')
+		return
+	hubs = {'broad': MMEventHub(sdbus.sd_bus_open_system())}
+	for count in range(1, len(paths) + 1):
+		hubs[f'scoped to {count}'] = MMEventHub(sdbus.sd_bus_open_system(), modems=paths[:count])
+	for hub in hubs.values():
+		await hub.start()
+	started = time.monotonic()
+	await asyncio.sleep(seconds)
+	elapsed = time.monotonic() - started
+	for name, hub in hubs.items():
+		print(f'{name}: {len(hub.match_rules)} rules, {hub.received} messages read, {hub.received / elapsed:.1f}/s')
+		hub.stop()
+
+asyncio.run(main(float(sys.argv[1]) if len(sys.argv) > 1 else 30))
@@ -1,22 +1,47 @@
 from __future__ import annotations
 
-from .enums import MMModemState, MMModemMode, MMModemPowerState, MMCallDirection, MMCallState, MMCallStateReason
+from .enums import MMModemState, MMModemMode, MMModemPowerState, MMSimType, MMSimEsimStatus, MMSimRemovability, MMCallDirection, MMCallState, MMCallStateReason, MMModem3gppRegistrationState, MMModemBand, MMSmsState, MMSmsPduType, MMSmsDeliveryState, MMBearerIpFamily, enum_name, flag_members, flag_names
 from .interfaces_bearer import MMBearerInterfaceAsync
 from .interfaces_call import MMCallInterfaceAsync
 from .interfaces_modem import MMModemInterfaceAsync, MMModemMessagingInterfaceAsync, MMModemSimpleInterfaceAsync, MMModemSignalInterfaceAsync, MMModemsInterfaceAsync, MMModemVoiceInterfaceAsync
 from .interfaces_root import MMInterfaceAsync
 from .interfaces_sim import MMSimInterfaceAsync
 from .interfaces_sms import MMSmsInterfaceAsync
-from .objects import MM, MMBearer, MMCall, MMModem, MMModems, MMModemMessaging, MMModemSignal, MMModemSimple, MMModemVoice, MMSim, MMSms
+from .cache import MMPropertyCache
+from .delivery import DeliveryLatency, DeliveryRecord, MMDeliveryIndex, normalize_number
+from .events import CallAdded, CallDeleted, CallStateChanged, DtmfReceived, Event, InterfacesAdded, InterfacesRemoved, MMEventHub, MMEventSubscription, ModemAdded, ModemRemoved, ModemStateChanged, OverflowPolicy, PropertiesChanged, SmsAdded, SmsDeleted, coalesce_key
+from .index import MMModemIndex
+from .matches import match_rule
+from .properties import parse_interfaces, parse_properties
+from .objects import CallStateTransition, MM, MMBearer, MMCall, MMModem, MMModems, MMModemMessaging, MMModemSignal, MMModemSimple, MMModemVoice, MMSim, MMSms
+from .purge import PURGED_STATES, JsonLinesSink, PurgeReport, SqliteSink, purge_messages, sms_json
+from .registry import MMModemRegistry
+from .segments import GSM7, UCS2, SmsPlan, encode_gsm7, gsm7_septets, is_gsm7, plan_sms, transliterate_gsm7
+from .sender import MMSmsSender, is_transient, is_unanswered
+from .signal_records import SIGNAL_RECORDS, CdmaSignal, EvdoSignal, GsmSignal, LteSignal, Nr5gSignal, SignalRecord, UmtsSignal
+from .snapshots import BearerSnapshot, CallSnapshot, ModemSnapshot, SimSnapshot, SmsSnapshot
+from .variants import unwrap_variant, unwrap_variants
 
 __all__ = (
 	# .enums
 	'MMModemState',
 	'MMModemMode',
 	'MMModemPowerState',
+	'MMSimType',
+	'MMSimEsimStatus',
+	'MMSimRemovability',
 	'MMCallDirection',
 	'MMCallState',
 	'MMCallStateReason',
+	'MMModem3gppRegistrationState',
+	'MMModemBand',
+	'MMSmsState',
+	'MMSmsPduType',
+	'MMSmsDeliveryState',
+	'MMBearerIpFamily',
+	'enum_name',
+	'flag_members',
+	'flag_names',
 	# .interfaces_bearer
 	'MMBearerInterfaceAsync',
 	# .interfaces_call
@@ -34,7 +59,40 @@ __all__ = (
 	'MMSimInterfaceAsync',
 	# .interfaces_sms
 	'MMSmsInterfaceAsync',
+	# .cache
+	'MMPropertyCache',
+	# .delivery
+	'MMDeliveryIndex',
+	'DeliveryRecord',
+	'DeliveryLatency',
+	'normalize_number',
+	# .events
+	'MMEventHub',
+	'MMEventSubscription',
+	'OverflowPolicy',
+	'coalesce_key',
+	'Event',
+	'ModemAdded',
+	'ModemRemoved',
+	'InterfacesAdded',
+	'InterfacesRemoved',
+	'PropertiesChanged',
+	'ModemStateChanged',
+	'SmsAdded',
+	'SmsDeleted',
+	'CallAdded',
+	'CallDeleted',
+	'CallStateChanged',
+	'DtmfReceived',
+	# .index
+	'MMModemIndex',
+	# .matches
+	'match_rule',
+	# .properties
+	'parse_interfaces',
+	'parse_properties',
 	# .objects
+	'CallStateTransition',
 	'MM',
 	'MMModems',
 	'MMModem',
@@ -46,4 +104,44 @@ __all__ = (
 	'MMSms',
 	'MMBearer',
 	'MMCall',
+	# .purge
+	'purge_messages',
+	'PurgeReport',
+	'JsonLinesSink',
+	'SqliteSink',
+	'PURGED_STATES',
+	'sms_json',
+	# .registry
+	'MMModemRegistry',
+	# .segments
+	'plan_sms',
+	'SmsPlan',
+	'GSM7',
+	'UCS2',
+	'is_gsm7',
+	'gsm7_septets',
+	'encode_gsm7',
+	'transliterate_gsm7',
+	# .sender
+	'MMSmsSender',
+	'is_transient',
+	'is_unanswered',
+	# .signal_records
+	'SIGNAL_RECORDS',
+	'SignalRecord',
+	'CdmaSignal',
+	'EvdoSignal',
+	'GsmSignal',
+	'UmtsSignal',
+	'LteSignal',
+	'Nr5gSignal',
+	# .snapshots
+	'ModemSnapshot',
+	'SimSnapshot',
+	'BearerSnapshot',
+	'SmsSnapshot',
+	'CallSnapshot',
+	# .variants
+	'unwrap_variant',
+	'unwrap_variants',
 )
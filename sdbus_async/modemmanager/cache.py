@@ -0,0 +1,128 @@
+from functools import lru_cache
+from time import monotonic
+from typing import Any, Dict, Optional, Set, Tuple
+
+from sdbus import DbusInterfaceCommonAsync
+from sdbus.sd_bus_internals import SdBusMessage, SdBusSlot
+
+from .matches import match_rule
+from .objects import MODEM_MANAGER_SERVICE_NAME
+from .properties import PROPERTIES_INTERFACE_NAME, interface_name, parse_properties, property_names
+
+
+@lru_cache(maxsize=None)
+def _property_interfaces(proxy_class: type) -> Dict[str, Dict[str, str]]:
+	"""Maps the D-Bus interfaces of a proxy class declaring properties to their D-Bus to python property names."""
+	interfaces: Dict[str, Dict[str, str]] = {}
+	for cls in proxy_class.__mro__:
+		names = property_names(cls)
+		if names:
+			interfaces.setdefault(interface_name(cls), {}).update(names)
+	return interfaces
+
+
+class MMPropertyCache:
+	"""
+	Serves the properties of a proxy from memory, kept current from the PropertiesChanged signals of its object.
+
+	Warmed with a single GetAll per interface once subscribed, so that no change is missed in between.
+	Invalidated properties are read again on their next access.
+
+	Usage::
+
+		async with MMPropertyCache(modem) as cache:
+			state = await cache.get('state')
+	"""
+
+	def __init__(self, proxy: DbusInterfaceCommonAsync, max_age: Optional[Dict[str, float]] = None) -> None:
+		"""
+		:param proxy: Proxy object of this package, for example :py:class:`MMModem` or :py:class:`MMBearer`.
+		:param max_age: Seconds after which the given properties are read again, \
+			for properties whose changes are not signalled.
+		"""
+		self.proxy = proxy
+		self.max_age = max_age if max_age is not None else {}
+		self._interfaces = _property_interfaces(type(proxy))
+		self._values: Dict[str, Tuple[Any, float]] = {}
+		self._slot: Optional[SdBusSlot] = None
+		#: D-Bus match rule of the PropertiesChanged signals of the object, once started
+		self.match_rule: Optional[str] = None
+		# Properties invalidated while the cache is warmed up, whose GetAll values may be older
+		self._invalidated: Optional[Set[str]] = None
+
+	async def start(self) -> None:
+		"""Subscribes to the PropertiesChanged signals of the object, then warms the cache."""
+		bus = self.proxy._dbus.attached_bus
+		path = self.proxy._dbus.object_path
+		self._slot = await bus.match_signal_async(MODEM_MANAGER_SERVICE_NAME, path, PROPERTIES_INTERFACE_NAME, 'PropertiesChanged', self._on_properties_changed)
+		self.match_rule = match_rule(MODEM_MANAGER_SERVICE_NAME, path, PROPERTIES_INTERFACE_NAME, 'PropertiesChanged')
+		# Properties read before the subscription, such as MMModem.interfaces, may have changed since
+		self._invalidated = set()
+		try:
+			for interface in self._interfaces:
+				properties = parse_properties(interface, await self.proxy._properties_get_all(interface))
+				now = monotonic()
+				for name, value in properties.items():
+					# Values signalled or invalidated while GetAll was in flight are newer
+					if name not in self._invalidated:
+						self._values.setdefault(name, (value, now))
+		finally:
+			self._invalidated = None
+
+	def stop(self) -> None:
+		"""Unsubscribes from the signals. Cached values are kept but no longer updated."""
+		if self._slot is not None:
+			self._slot.close()
+			self._slot = None
+			self.match_rule = None
+
+	async def __aenter__(self) -> 'MMPropertyCache':
+		await self.start()
+		return self
+
+	async def __aexit__(self, *args: Any) -> None:
+		self.stop()
+
+	async def get(self, name: str) -> Any:
+		"""
+		Returns a property, from memory unless it is not cached, invalidated or older than its :py:attr:`max_age`.
+
+		:param name: Python attribute name of the property, for example ``'signal_quality'``.
+		"""
+		entry = self._values.get(name)
+		if entry is not None and (name not in self.max_age or monotonic() - entry[1] < self.max_age[name]):
+			return entry[0]
+		value = await getattr(self.proxy, name)
+		self._values[name] = (value, monotonic())
+		return value
+
+	def invalidate(self, *names: str) -> None:
+		"""Drops the given properties, or all of them, so that they are read again on their next access."""
+		if not names:
+			self._values.clear()
+			names = tuple(name for properties in self._interfaces.values() for name in properties.values())
+		for name in names:
+			self._values.pop(name, None)
+		if self._invalidated is not None:
+			self._invalidated.update(names)
+
+	@property
+	def values(self) -> Dict[str, Any]:
+		"""The currently cached properties, by python attribute name."""
+		return {name: entry[0] for name, entry in self._values.items()}
+
+	def __contains__(self, name: str) -> bool:
+		return name in self._values
+
+	def _on_properties_changed(self, message: SdBusMessage) -> None:
+		interface, changed, invalidated = message.get_contents()
+		names = self._interfaces.get(interface)
+		if names is None:
+			return
+		now = monotonic()
+		for name, value in parse_properties(interface, changed).items():
+			self._values[name] = (value, now)
+		for name in invalidated:
+			self._values.pop(names.get(name, name), None)
+			if self._invalidated is not None:
+				self._invalidated.add(names.get(name, name))
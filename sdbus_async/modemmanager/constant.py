@@ -0,0 +1,52 @@
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+from sdbus import DbusPropertyConstFlag
+from sdbus.dbus_common_elements import DbusRemoteObjectMeta
+from sdbus.dbus_proxy_async_property import DbusPropertyAsync, DbusProxyPropertyAsync
+
+T = TypeVar('T')
+
+
+class DbusConstantProxyPropertyAsync(DbusProxyPropertyAsync[T]):
+	"""Bound constant property of a proxy, read from the bus on first access only."""
+
+	def __init__(self, dbus_property: DbusPropertyAsync[T], proxy: Any) -> None:
+		super().__init__(dbus_property, proxy._dbus)
+		self.proxy = proxy
+
+	async def get_async(self) -> T:
+		# Looked up on each read, as forget_constants() replaces the values
+		values: Dict[Tuple[str, str], Any] = self.proxy.__dict__.setdefault('_dbus_constants', {})
+		key = (self.dbus_property.interface_name, self.dbus_property.property_name)
+		try:
+			return values[key]
+		except KeyError:
+			value = values[key] = await super().get_async()
+			return value
+
+
+class DbusConstantPropertyAsync(DbusPropertyAsync[T]):
+	"""D-Bus property that never changes for the lifetime of the object path, cached by each proxy object."""
+
+	def __get__(self, obj: Any, obj_class: Optional[type] = None) -> Any:
+		if obj is not None and isinstance(obj._dbus, DbusRemoteObjectMeta):
+			return DbusConstantProxyPropertyAsync(self, obj)
+		return super().__get__(obj, obj_class)
+
+
+def forget_constants(proxy: Any) -> None:
+	"""Drops the constant properties cached by a proxy object, once its object path is removed, as ModemManager reuses paths."""
+	proxy.__dict__.pop('_dbus_constants', None)
+
+
+def dbus_property_async_constant(
+	property_signature: str = '',
+	flags: int = 0,
+	property_name: Optional[str] = None,
+) -> Callable[[Callable[[Any], T]], DbusPropertyAsync[T]]:
+	"""Declares a property like :py:func:`sdbus.dbus_property_async`, flagged constant and read once per proxy object."""
+
+	def property_decorator(function: Callable[[Any], T]) -> DbusPropertyAsync[T]:
+		return DbusConstantPropertyAsync(property_name, property_signature, function, None, flags | DbusPropertyConstFlag)
+
+	return property_decorator
@@ -0,0 +1,240 @@
+from collections import OrderedDict, deque
+from datetime import datetime
+from time import time
+from typing import Deque, Dict, Iterator, Optional, Tuple
+
+from sdbus.sd_bus_internals import SdBus
+
+from .enums import MMSmsDeliveryState, MMSmsPduType
+from .events import Event, PropertiesChanged, SmsAdded
+from .interfaces_sms import MMSmsInterfaceAsync
+from .objects import MMSms, _proxy
+from .properties import interface_name
+from .snapshots import SmsSnapshot
+
+SMS_INTERFACE_NAME = interface_name(MMSmsInterfaceAsync)
+
+# Delivery states from which the service center is still trying, and from which it gave up
+_TEMPORARY = 0x20
+_FAILED = 0x40
+
+_Key = Tuple[str, int, str]
+
+
+def normalize_number(number: str) -> str:
+	"""Returns the digits of a phone number, as status reports may not format it as it was sent."""
+	return ''.join(c for c in number if c.isdigit())
+
+
+def _timestamp(value: str) -> Optional[float]:
+	"""Converts an ISO 8601 timestamp of ModemManager to seconds since the epoch, ``None`` if empty or malformed."""
+	try:
+		return datetime.fromisoformat(value).timestamp() if value else None
+	except ValueError:
+		return None
+
+
+class DeliveryRecord:
+	"""An SMS sent through a modem and the state of its delivery, from its status reports."""
+	__slots__ = ('modem_path', 'number', 'message_reference', 'sms_path', 'sent_at', 'delivery_state', 'discharge_timestamp', 'reported_at')
+
+	def __init__(self, modem_path: str, number: str, message_reference: int, sms_path: Optional[str], sent_at: float) -> None:
+		self.modem_path = modem_path
+		self.number = number
+		self.message_reference = message_reference
+		self.sms_path = sms_path
+		#: Seconds since the epoch
+		self.sent_at = sent_at
+		self.delivery_state: Optional[int] = None
+		self.discharge_timestamp = ''
+		#: Seconds since the epoch the final status report was received at
+		self.reported_at: Optional[float] = None
+
+	@property
+	def done(self) -> bool:
+		"""Whether the service center stopped trying to deliver the message."""
+		return self.delivery_state is not None and not _TEMPORARY <= self.delivery_state < _FAILED
+
+	@property
+	def delivered(self) -> bool:
+		"""Whether the message reached its recipient."""
+		return self.delivery_state is not None and self.delivery_state < _TEMPORARY
+
+	@property
+	def latency(self) -> Optional[float]:
+		"""
+		Seconds from sending to delivery, once done. Measured to the ``discharge_timestamp`` of the service center
+		when the report carries one, to the reception of the report otherwise.
+		"""
+		if self.reported_at is None:
+			return None
+		delivered_at = _timestamp(self.discharge_timestamp)
+		return (delivered_at if delivered_at is not None else self.reported_at) - self.sent_at
+
+	def __repr__(self) -> str:
+		state = self.delivery_state
+		if state is not None:
+			try:
+				state = MMSmsDeliveryState(state)
+			except ValueError:
+				pass
+		return f'{type(self).__name__}({self.modem_path!r}, {self.number!r}, {self.message_reference!r}, {state!r})'
+
+
+class DeliveryLatency:
+	"""Delivery statistics of the messages of one modem. Percentiles are computed on the ``window`` last deliveries."""
+
+	def __init__(self, window: int = 1024) -> None:
+		self.delivered = 0
+		self.failed = 0
+		self.total = 0.0
+		self.minimum: Optional[float] = None
+		self.maximum: Optional[float] = None
+		self._recent: Deque[float] = deque(maxlen=window)
+
+	def add(self, record: DeliveryRecord) -> None:
+		"""Counts a message whose delivery is done."""
+		latency = record.latency
+		if not record.delivered or latency is None:
+			self.failed += 1
+			return
+		self.delivered += 1
+		self.total += latency
+		self.minimum = latency if self.minimum is None else min(self.minimum, latency)
+		self.maximum = latency if self.maximum is None else max(self.maximum, latency)
+		self._recent.append(latency)
+
+	@property
+	def mean(self) -> Optional[float]:
+		return self.total / self.delivered if self.delivered else None
+
+	def percentile(self, percent: float) -> Optional[float]:
+		"""Returns the latency under which ``percent`` of the recent deliveries were done, for example ``95``."""
+		if not self._recent:
+			return None
+		ordered = sorted(self._recent)
+		return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+	def __repr__(self) -> str:
+		return f'{type(self).__name__}(delivered={self.delivered}, failed={self.failed}, mean={self.mean}, p95={self.percentile(95)})'
+
+
+class MMDeliveryIndex:
+	"""
+	Sent messages indexed by modem, ``message_reference`` and number, to match status reports in constant time.
+
+	ModemManager updates the ``delivery_state`` of the sent message when it is still stored, and exposes the status
+	report as a received message with the ``MM_SMS_PDU_TYPE_STATUS_REPORT`` type otherwise. :py:meth:`handle`
+	takes both from the events of a :py:class:`MMEventHub`.
+	Records are evicted once ``maxsize`` messages are indexed, and ``max_age`` seconds after they were sent.
+
+	Usage::
+
+		index = MMDeliveryIndex()
+		async with MMSmsSender(modem.messaging, index=index) as sender:
+			async for event in hub.events(kinds=(PropertiesChanged, SmsAdded)):
+				await index.handle(event, bus)
+	"""
+
+	def __init__(self, maxsize: int = 65536, max_age: float = 3 * 24 * 3600.0, window: int = 1024) -> None:
+		"""
+		:param window: Number of recent deliveries of each modem the latency percentiles are computed on.
+		"""
+		self.maxsize = maxsize
+		self.max_age = max_age
+		self.window = window
+		self._records: 'OrderedDict[_Key, DeliveryRecord]' = OrderedDict()
+		self._paths: Dict[str, _Key] = {}
+		self._latencies: Dict[str, DeliveryLatency] = {}
+
+	def add(self, modem_path: str, number: str, message_reference: int, sms_path: Optional[str] = None, sent_at: Optional[float] = None) -> DeliveryRecord:
+		"""
+		Indexes a sent message. A record with the same reference and number, which wrap around, is replaced.
+
+		:param sent_at: Seconds since the epoch, now if ``None``.
+		"""
+		key = (modem_path, message_reference, normalize_number(number))
+		self._remove(key)
+		record = self._records[key] = DeliveryRecord(modem_path, number, message_reference, sms_path, sent_at if sent_at is not None else time())
+		if sms_path is not None:
+			self._paths[sms_path] = key
+		self.expire()
+		return record
+
+	def get(self, modem_path: str, message_reference: int, number: str) -> Optional[DeliveryRecord]:
+		return self._records.get((modem_path, message_reference, normalize_number(number)))
+
+	def get_by_path(self, sms_path: str) -> Optional[DeliveryRecord]:
+		key = self._paths.get(sms_path)
+		return self._records.get(key) if key is not None else None
+
+	def report(self, modem_path: str, message_reference: int, number: str, delivery_state: int, discharge_timestamp: str = '') -> Optional[DeliveryRecord]:
+		"""Applies a status report to the matching sent message, ``None`` if it is not indexed."""
+		record = self.get(modem_path, message_reference, number)
+		if record is not None:
+			self._report(record, delivery_state, discharge_timestamp)
+		return record
+
+	def latency(self, modem_path: str) -> DeliveryLatency:
+		"""Returns the delivery statistics of a modem."""
+		latency = self._latencies.get(modem_path)
+		if latency is None:
+			latency = self._latencies[modem_path] = DeliveryLatency(self.window)
+		return latency
+
+	@property
+	def latencies(self) -> Dict[str, DeliveryLatency]:
+		"""Delivery statistics by modem path."""
+		return dict(self._latencies)
+
+	def expire(self, now: Optional[float] = None) -> int:
+		"""Evicts the records beyond ``maxsize`` and those older than ``max_age``. Returns the number of evicted records."""
+		deadline = (now if now is not None else time()) - self.max_age
+		evicted = 0
+		while self._records:
+			key, record = next(iter(self._records.items()))
+			if len(self._records) <= self.maxsize and record.sent_at >= deadline:
+				break
+			self._remove(key)
+			evicted += 1
+		return evicted
+
+	async def handle(self, event: Event, bus: Optional[SdBus] = None) -> Optional[DeliveryRecord]:
+		"""
+		Applies the status report carried by an event, returning the matched record.
+
+		:param event: :py:class:`PropertiesChanged` of a sent message, or :py:class:`SmsAdded` of a received message, \
+			which is read with one GetAll to find status reports.
+		:param bus: Bus of the messages, the default bus if ``None``.
+		"""
+		if isinstance(event, PropertiesChanged):
+			if event.interface != SMS_INTERFACE_NAME or 'delivery_state' not in event.changed:
+				return None
+			record = self.get_by_path(event.object_path)
+			if record is not None:
+				self._report(record, event.changed['delivery_state'], event.changed.get('discharge_timestamp', record.discharge_timestamp))
+			return record
+		if isinstance(event, SmsAdded) and event.received:
+			sms = await SmsSnapshot.from_proxy(_proxy(MMSms, event.sms_path, bus))
+			if sms.pdu_type == MMSmsPduType.MM_SMS_PDU_TYPE_STATUS_REPORT:
+				return self.report(event.object_path, sms.message_reference, sms.number, sms.delivery_state, sms.discharge_timestamp)
+		return None
+
+	def __len__(self) -> int:
+		return len(self._records)
+
+	def __iter__(self) -> Iterator[DeliveryRecord]:
+		return iter(list(self._records.values()))
+
+	def _report(self, record: DeliveryRecord, delivery_state: int, discharge_timestamp: str) -> None:
+		was_done = record.done
+		record.delivery_state = delivery_state
+		record.discharge_timestamp = discharge_timestamp
+		if record.done and not was_done:
+			record.reported_at = time()
+			self.latency(record.modem_path).add(record)
+
+	def _remove(self, key: _Key) -> None:
+		record = self._records.pop(key, None)
+		if record is not None and record.sms_path is not None and self._paths.get(record.sms_path) == key:
+			del self._paths[record.sms_path]
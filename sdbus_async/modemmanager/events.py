@@ -0,0 +1,608 @@
+from asyncio import Future, Task, gather, get_running_loop
+from collections import deque
+from enum import Enum
+from typing import Any, AsyncIterator, Callable, Deque, Dict, Iterable, List, Optional, Set, Tuple, Type
+
+from sdbus import get_default_bus
+from sdbus.dbus_proxy_async_signal import DbusSignalAsync
+from sdbus.sd_bus_internals import SdBus, SdBusMessage, SdBusSlot
+
+from .interfaces_call import MMCallInterfaceAsync
+from .interfaces_modem import MMModemInterfaceAsync, MMModemMessagingInterfaceAsync, MMModemVoiceInterfaceAsync
+from .matches import match_rule
+from .objects import MODEM_INTERFACE_NAME, MODEM_MANAGER_SERVICE_NAME, MMModems
+from .properties import PROPERTIES_INTERFACE_NAME, parse_interfaces, parse_properties
+from .registry import OBJECT_MANAGER_INTERFACE_NAME
+
+MODEM_MANAGER_PATH = '/org/freedesktop/ModemManager1'
+MODEM_PATH_PREFIX = '/org/freedesktop/ModemManager1/Modem/'
+
+
+class Event:
+	"""
+	Signal emitted by ModemManager, decoded by :py:class:`MMEventHub`.
+
+	:py:attr:`object_path` is the object emitting the signal and :py:attr:`modem_path` the modem it belongs to,
+	``None`` for SMS, call, bearer or SIM objects the hub has not seen being attached to a modem.
+	"""
+	__slots__ = ('object_path', 'modem_path')
+	_fields: Tuple[str, ...] = ()
+
+	def __init__(self, object_path: str, modem_path: Optional[str], *values: Any) -> None:
+		self.object_path = object_path
+		self.modem_path = modem_path
+		for name, value in zip(self._fields, values):
+			setattr(self, name, value)
+
+	def as_dict(self) -> Dict[str, Any]:
+		"""Returns the arguments of the signal by name."""
+		return {name: getattr(self, name) for name in self._fields}
+
+	def __eq__(self, other: object) -> bool:
+		if type(other) is not type(self):
+			return NotImplemented
+		return (self.object_path, self.modem_path, self.as_dict()) == (other.object_path, other.modem_path, other.as_dict())  # type: ignore[attr-defined]
+
+	__hash__ = None  # type: ignore[assignment]
+
+	def __repr__(self) -> str:
+		return f'{type(self).__name__}({self.object_path!r}, {self.modem_path!r}, {self.as_dict()!r})'
+
+
+class ModemAdded(Event):
+	"""A modem appeared, with its interfaces and properties as returned by :py:func:`parse_interfaces`."""
+	__slots__ = _fields = ('interfaces', )
+
+
+class ModemRemoved(Event):
+	"""A modem vanished."""
+	__slots__ = ()
+
+
+class InterfacesAdded(Event):
+	"""A modem started exporting interfaces, with their properties as returned by :py:func:`parse_interfaces`."""
+	__slots__ = _fields = ('interfaces', )
+
+
+class InterfacesRemoved(Event):
+	"""A modem stopped exporting interfaces."""
+	__slots__ = _fields = ('interfaces', )
+
+
+class PropertiesChanged(Event):
+	"""Properties of an interface changed, ``changed`` by python property name as returned by :py:func:`parse_properties`."""
+	__slots__ = _fields = ('interface', 'changed', 'invalidated')
+
+
+class ModemStateChanged(Event):
+	"""The modem state changed, see :py:class:`MMModemState`."""
+	__slots__ = _fields = ('old', 'new', 'reason')
+
+
+class SmsAdded(Event):
+	"""An SMS was received or created. ``object_path`` is the modem, ``sms_path`` the new message."""
+	__slots__ = _fields = ('sms_path', 'received')
+
+
+class SmsDeleted(Event):
+	"""An SMS was deleted. ``object_path`` is the modem."""
+	__slots__ = _fields = ('sms_path', )
+
+
+class CallAdded(Event):
+	"""A call was received or created. ``object_path`` is the modem, ``call_path`` the new call."""
+	__slots__ = _fields = ('call_path', )
+
+
+class CallDeleted(Event):
+	"""A call was deleted. ``object_path`` is the modem."""
+	__slots__ = _fields = ('call_path', )
+
+
+class CallStateChanged(Event):
+	"""The state of a call changed, see :py:class:`MMCallState` and :py:class:`MMCallStateReason`."""
+	__slots__ = _fields = ('old', 'new', 'reason')
+
+
+class DtmfReceived(Event):
+	"""A DTMF tone was received during a call."""
+	__slots__ = _fields = ('dtmf', )
+
+
+def _signal(signal: DbusSignalAsync, event: Type[Event]) -> Tuple[Tuple[str, str], Type[Event]]:
+	return (signal.interface_name, signal.signal_name), event
+
+
+# Signals decoded by their arguments in order
+_SIGNAL_EVENTS: Dict[Tuple[str, str], Type[Event]] = dict((
+	_signal(MMModemInterfaceAsync.state_changed, ModemStateChanged),
+	_signal(MMModemMessagingInterfaceAsync.added, SmsAdded),
+	_signal(MMModemMessagingInterfaceAsync.deleted, SmsDeleted),
+	_signal(MMModemVoiceInterfaceAsync.call_added, CallAdded),
+	_signal(MMModemVoiceInterfaceAsync.call_deleted, CallDeleted),
+	_signal(MMCallInterfaceAsync.state_changed, CallStateChanged),
+	_signal(MMCallInterfaceAsync.dtmf_received, DtmfReceived),
+))
+
+
+class OverflowPolicy(Enum):
+	"""
+	What a full :py:class:`MMEventSubscription` does with a new event.
+
+	* UNBOUNDED: Keeps every event. Signals are dispatched by the bus and cannot wait for the consumer,
+	  so events beyond the bound are queued anyway and counted in :py:attr:`MMEventSubscription.overflowed`.
+	* DROP_OLDEST: Drops the oldest queued event.
+	* COALESCE: Merges an event into the queued event of the same object and interface, see :py:func:`coalesce_key`,
+	  keeping the latest value of each property. When nothing can be merged, drops the oldest queued event that cannot be merged
+	  either, or the oldest queued event if all of them can.
+	"""
+	UNBOUNDED = 'unbounded'
+	DROP_OLDEST = 'drop-oldest'
+	COALESCE = 'coalesce'
+
+
+def coalesce_key(event: Event) -> Optional[Tuple[Any, ...]]:
+	"""Key of the events merged by :py:attr:`OverflowPolicy.COALESCE`, ``None`` for events that are never merged."""
+	if isinstance(event, PropertiesChanged):
+		return PropertiesChanged, event.object_path, event.interface  # type: ignore[attr-defined]
+	if isinstance(event, ModemStateChanged):
+		return ModemStateChanged, event.object_path
+	return None
+
+
+def _merge(queued: Event, event: Event) -> Event:
+	if isinstance(event, PropertiesChanged):
+		changed = dict(queued.changed)  # type: ignore[attr-defined]
+		changed.update(event.changed)  # type: ignore[attr-defined]
+		invalidated = list(dict.fromkeys(queued.invalidated + event.invalidated))  # type: ignore[attr-defined]
+		return PropertiesChanged(event.object_path, event.modem_path, event.interface, changed, invalidated)  # type: ignore[attr-defined]
+	return type(event)(event.object_path, event.modem_path, queued.old, event.new, event.reason)  # type: ignore[attr-defined]
+
+
+class MMEventSubscription:
+	"""
+	Bounded queue of the events of :py:class:`MMEventHub` accepted by a filter, returned by :py:meth:`MMEventHub.subscribe`.
+
+	Usage::
+
+		with hub.subscribe(maxsize=64, policy=OverflowPolicy.COALESCE) as subscription:
+			async for event in subscription:
+				print(event, subscription.coalesced)
+
+	With ``debounce``, property changes of an object interface are held until they have been quiet for ``debounce`` seconds,
+	or for at most ``max_latency`` seconds after the first of them, and delivered as one merged :py:class:`PropertiesChanged`.
+	"""
+
+	def __init__(
+		self,
+		hub: 'MMEventHub',
+		modems: Optional[Iterable[str]] = None,
+		kinds: Optional[Iterable[Type[Event]]] = None,
+		maxsize: int = 1024,
+		policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+		debounce: float = 0,
+		max_latency: Optional[float] = None,
+	) -> None:
+		"""
+		:param modems: Object paths of the modems to receive the events of, all modems by default.
+		:param kinds: Event classes to receive, all events by default.
+		:param maxsize: Number of queued events beyond which ``policy`` applies, unbounded if 0.
+		:param policy: What to do with an event when the queue is full, the oldest event is dropped by default.
+		:param debounce: Quiet window of property changes in seconds, not debounced if 0.
+		:param max_latency: Longest delay of a debounced property change in seconds, unbounded by default.
+		"""
+		self.hub = hub
+		self.modems = frozenset(modems) if modems is not None else None
+		self.kinds = tuple(kinds) if kinds is not None else None
+		self.maxsize = maxsize
+		self.policy = policy
+		self.debounce = debounce
+		self.max_latency = max_latency
+		#: Events dropped by :py:attr:`OverflowPolicy.DROP_OLDEST` or :py:attr:`OverflowPolicy.COALESCE`
+		self.dropped = 0
+		#: Events merged into a queued event by :py:attr:`OverflowPolicy.COALESCE`
+		self.coalesced = 0
+		#: Events queued beyond ``maxsize`` by :py:attr:`OverflowPolicy.UNBOUNDED`
+		self.overflowed = 0
+		#: Property changes merged into a held change by ``debounce``
+		self.debounced = 0
+		#: Whether :py:meth:`close` was called, after which the iteration ends once the queue is drained
+		self.closed = False
+		# Queued [event, coalesce key] cells, and the cells events of the same key are merged into
+		self._queue: Deque[List[Any]] = deque()
+		self._pending: Dict[Tuple[Any, ...], List[Any]] = {}
+		# Futures of the concurrent get() calls waiting for an event
+		self._waiters: List['Future[None]'] = []
+		# Held property changes: [merged event, time of the first change, release timer]
+		self._held: Dict[Tuple[Any, ...], List[Any]] = {}
+
+	def accepts(self, event: Event) -> bool:
+		return (self.modems is None or event.modem_path in self.modems) and (self.kinds is None or isinstance(event, self.kinds))
+
+	def put(self, event: Event) -> None:
+		"""Queues an event according to :py:attr:`policy`, or holds it for ``debounce``. Called by the hub."""
+		if self.debounce and isinstance(event, PropertiesChanged):
+			self._hold(event)
+		else:
+			self._enqueue(event)
+
+	def _enqueue(self, event: Event) -> None:
+		key = coalesce_key(event) if self.policy is OverflowPolicy.COALESCE else None
+		if key is not None:
+			cell = self._pending.get(key)
+			if cell is not None:
+				cell[0] = _merge(cell[0], event)
+				self.coalesced += 1
+				return
+		if self.maxsize and len(self._queue) >= self.maxsize:
+			if self.policy is OverflowPolicy.UNBOUNDED:
+				self.overflowed += 1
+			else:
+				self._drop()
+				self.dropped += 1
+		cell = [event, key]
+		self._queue.append(cell)
+		if key is not None:
+			self._pending[key] = cell
+		self._wake()
+
+	async def get(self) -> Event:
+		"""Waits for the next event. Raises :py:exc:`StopAsyncIteration` once the subscription is closed and drained."""
+		while not self._queue:
+			if self.closed:
+				raise StopAsyncIteration
+			waiter = get_running_loop().create_future()
+			self._waiters.append(waiter)
+			try:
+				await waiter
+			finally:
+				if waiter in self._waiters:
+					self._waiters.remove(waiter)
+		cell = self._queue.popleft()
+		self._forget(cell)
+		return cell[0]
+
+	def close(self) -> None:
+		"""
+		Stops receiving events. Queued and held events can still be read with :py:meth:`get`,
+		then the iteration ends and waiting :py:meth:`get` calls raise :py:exc:`StopAsyncIteration`.
+		"""
+		if self in self.hub._subscriptions:
+			self.hub._subscriptions.remove(self)
+		for key in list(self._held):
+			self._held[key][2].cancel()
+			self._release(key)
+		self.closed = True
+		self._wake()
+
+	def __len__(self) -> int:
+		return len(self._queue)
+
+	def __aiter__(self) -> 'MMEventSubscription':
+		return self
+
+	async def __anext__(self) -> Event:
+		return await self.get()
+
+	def __enter__(self) -> 'MMEventSubscription':
+		return self
+
+	def __exit__(self, *args: Any) -> None:
+		self.close()
+
+	def _hold(self, event: Event) -> None:
+		loop = get_running_loop()
+		now = loop.time()
+		key = coalesce_key(event)
+		held = self._held.get(key)  # type: ignore[arg-type]
+		if held is None:
+			held = self._held[key] = [event, now, None]  # type: ignore[index]
+		else:
+			held[0] = _merge(held[0], event)
+			held[2].cancel()
+			self.debounced += 1
+		delay = self.debounce
+		if self.max_latency is not None:
+			delay = max(min(delay, held[1] + self.max_latency - now), 0)
+		held[2] = loop.call_later(delay, self._release, key)
+
+	def _release(self, key: Tuple[Any, ...]) -> None:
+		self._enqueue(self._held.pop(key)[0])
+
+	def _wake(self) -> None:
+		# Each waiter checks the queue again, one of them takes the event
+		for waiter in self._waiters:
+			if not waiter.done():
+				waiter.set_result(None)
+		self._waiters.clear()
+
+	def _drop(self) -> None:
+		# Coalesced events hold the latest state of their object, and events that cannot be merged are dropped first
+		if self.policy is OverflowPolicy.COALESCE:
+			for index, cell in enumerate(self._queue):
+				if cell[1] is None:
+					del self._queue[index]
+					return
+		self._forget(self._queue.popleft())
+
+	def _forget(self, cell: List[Any]) -> None:
+		if cell[1] is not None and self._pending.get(cell[1]) is cell:
+			del self._pending[cell[1]]
+
+
+class MMEventHub:
+	"""
+	Single stream of the signals of all modems and their objects.
+
+	One match rule covers every signal of ModemManager, or, for a hub scoped to some ``modems``, one rule per object
+	of these modems; signals are demultiplexed by interface and member into :py:class:`Event` objects
+	and delivered to the subscribers whose filters accept them. The installed rules are listed by :py:attr:`match_rules`.
+
+	A scoped hub falls back to the rule of every signal, filtering the signals of other modems itself, once it would
+	install more than ``max_rules`` rules, or when the bus refuses one of them, typically for the limit of match rules
+	of a connection. The errors of the refused rules are kept in :py:attr:`errors`.
+
+	Usage::
+
+		async with MMEventHub() as hub:
+			async for event in hub.events(kinds=(ModemStateChanged, CallAdded)):
+				print(event.modem_path, event)
+	"""
+
+	def __init__(self, bus: Optional[SdBus] = None, modems: Optional[Iterable[str]] = None, max_rules: int = 256) -> None:
+		"""
+		:param bus: You probably want to set default bus to system bus \
+			or pass system bus directly.
+		:param modems: Object paths of the modems to install path-scoped match rules for, with their SMS, call, bearer and SIM objects, \
+			so that the bus does not wake the process up for the signals of other modems. All modems by default.
+		:param max_rules: Number of path-scoped match rules beyond which the rule of every signal is installed instead.
+		"""
+		self.bus = bus if bus is not None else get_default_bus()
+		self.modems = set(modems) if modems is not None else None
+		self.max_rules = max_rules
+		#: Errors of the match rules the bus refused
+		self.errors: List[BaseException] = []
+		#: Signal messages read off the bus for the match rules of the hub, including those of other modems it filtered out
+		self.received = 0
+		# Whether the rule of every signal is installed, or to be
+		self._broad = modems is None
+		# Object paths, None for the rule of all objects, to their slot and rule
+		self._matches: Dict[Optional[str], Tuple[SdBusSlot, str]] = {}
+		# Object paths whose rule is being added
+		self._adding: Set[Optional[str]] = set()
+		self._tasks: Set['Task[None]'] = set()
+		self._subscriptions: List[MMEventSubscription] = []
+		# SMS, call, bearer and SIM object paths to the path of their modem
+		self._owners: Dict[str, str] = {}
+		self._decoders: Dict[Tuple[str, str], Callable[[SdBusMessage], Optional[Event]]] = {
+			(PROPERTIES_INTERFACE_NAME, 'PropertiesChanged'): self._properties_changed,
+			(OBJECT_MANAGER_INTERFACE_NAME, 'InterfacesAdded'): self._interfaces_added,
+			(OBJECT_MANAGER_INTERFACE_NAME, 'InterfacesRemoved'): self._interfaces_removed,
+		}
+
+	async def start(self) -> None:
+		"""Installs the match rules of the hub, then learns the SIM and bearer objects of the modems already present."""
+		if self._matches:
+			return
+		if self._broad:
+			await self._match(None)
+		else:
+			await self._match(MODEM_MANAGER_PATH, OBJECT_MANAGER_INTERFACE_NAME)
+			for object_path in list(self.modems):  # type: ignore[arg-type]
+				await self._match(object_path)
+		for object_path, interfaces in (await MMModems(self.bus).get_managed_objects()).items():
+			if MODEM_INTERFACE_NAME in interfaces:
+				self._own(object_path, parse_properties(MODEM_INTERFACE_NAME, interfaces[MODEM_INTERFACE_NAME]))
+		if self._tasks:
+			await gather(*self._tasks, return_exceptions=True)
+
+	def stop(self) -> None:
+		"""Removes the match rules and closes the subscriptions, whose iterators end once their queued events are read."""
+		for slot, _ in self._matches.values():
+			slot.close()
+		self._matches.clear()
+		for task in self._tasks:
+			task.cancel()
+		for subscription in list(self._subscriptions):
+			subscription.close()
+
+	@property
+	def match_rules(self) -> List[str]:
+		"""The D-Bus match rules currently installed by the hub."""
+		return [rule for _, rule in self._matches.values()]
+
+	async def add_modem(self, object_path: str) -> None:
+		"""Installs the match rules of another modem and of its known objects, on a hub scoped to ``modems``."""
+		if self.modems is None or object_path in self.modems:
+			return
+		self.modems.add(object_path)
+		for path in [object_path] + [path for path, owner in self._owners.items() if owner == object_path]:
+			await self._match(path)
+
+	def remove_modem(self, object_path: str) -> None:
+		"""Removes the match rules of a modem and of its objects, on a hub scoped to ``modems``."""
+		if self.modems is None or object_path not in self.modems:
+			return
+		self.modems.discard(object_path)
+		for path in [object_path] + [path for path, owner in self._owners.items() if owner == object_path]:
+			self._unwatch(path)
+
+	async def __aenter__(self) -> 'MMEventHub':
+		await self.start()
+		return self
+
+	async def __aexit__(self, *args: Any) -> None:
+		self.stop()
+
+	def subscribe(
+		self,
+		modems: Optional[Iterable[str]] = None,
+		kinds: Optional[Iterable[Type[Event]]] = None,
+		maxsize: int = 1024,
+		policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+		debounce: float = 0,
+		max_latency: Optional[float] = None,
+	) -> MMEventSubscription:
+		"""Starts queueing the events accepted by the filters, see :py:class:`MMEventSubscription` for the parameters."""
+		subscription = MMEventSubscription(self, modems, kinds, maxsize, policy, debounce, max_latency)
+		self._subscriptions.append(subscription)
+		return subscription
+
+	async def events(
+		self,
+		modems: Optional[Iterable[str]] = None,
+		kinds: Optional[Iterable[Type[Event]]] = None,
+		maxsize: int = 1024,
+		policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+		debounce: float = 0,
+		max_latency: Optional[float] = None,
+	) -> AsyncIterator[Event]:
+		"""
+		Yields the events accepted by the filters, in the order the signals were received.
+
+		:param modems: Object paths of the modems to receive the events of, all modems by default.
+		:param kinds: Event classes to receive, all events by default.
+		:param maxsize: Bound of the queue of the iterator, see :py:class:`MMEventSubscription` for it and the other parameters.
+		"""
+		with self.subscribe(modems, kinds, maxsize, policy, debounce, max_latency) as subscription:
+			async for event in subscription:
+				yield event
+
+	def modem_path(self, object_path: str) -> Optional[str]:
+		"""Returns the path of the modem an object belongs to, if known."""
+		if object_path.startswith(MODEM_PATH_PREFIX):
+			return object_path
+		return self._owners.get(object_path)
+
+	def _on_signal(self, message: SdBusMessage) -> None:
+		self.received += 1
+		# Signals of other modems, delivered once the rule of every signal replaced the path-scoped ones
+		if self.modems is not None and not self._follows(message.path):
+			return
+		key = (message.interface, message.member)
+		decoder = self._decoders.get(key)
+		if decoder is not None:
+			event = decoder(message)
+		else:
+			event_class = _SIGNAL_EVENTS.get(key)
+			if event_class is None:
+				return
+			object_path = message.path
+			event = event_class(object_path, self.modem_path(object_path), *message.parse_to_tuple())
+			self._track(event)
+		if event is not None:
+			self._publish(event)
+
+	async def _match(self, path: Optional[str], interface: Optional[str] = None) -> None:
+		if path in self._matches or path in self._adding or not self._wanted(path):
+			return
+		if path is not None and len(self._matches) + len(self._adding) >= self.max_rules:
+			await self._broaden()
+			return
+		self._adding.add(path)
+		try:
+			slot = await self.bus.match_signal_async(MODEM_MANAGER_SERVICE_NAME, path, interface, None, self._on_signal)
+		except Exception as error:
+			self.errors.append(error)
+			if path is None:
+				raise
+			await self._broaden()
+			return
+		finally:
+			self._adding.discard(path)
+		# The object can be deleted, the rule installed twice, or all rules replaced by the rule of every signal, while the rule is being added
+		if path in self._matches or not self._wanted(path):
+			slot.close()
+			return
+		self._matches[path] = slot, match_rule(MODEM_MANAGER_SERVICE_NAME, path, interface)
+
+	async def _broaden(self) -> None:
+		"""Replaces the path-scoped rules by the rule of every signal."""
+		if self._broad:
+			return
+		self._broad = True
+		try:
+			await self._match(None)
+		except Exception:
+			# No room for it beside the path-scoped rules, signals are missed until it is added
+			self._unwatch_scoped()
+			await self._match(None)
+		self._unwatch_scoped()
+
+	def _unwatch_scoped(self) -> None:
+		for path in [path for path in self._matches if path is not None]:
+			self._unwatch(path)
+
+	def _follows(self, path: str) -> bool:
+		return self.modems is None or path == MODEM_MANAGER_PATH or path in self.modems or self._owners.get(path) in self.modems  # type: ignore[arg-type]
+
+	def _wanted(self, path: Optional[str]) -> bool:
+		if path is None:
+			return self._broad
+		return not self._broad and self._follows(path)
+
+	def _watch(self, path: str) -> None:
+		if path in self._matches or not self._wanted(path):
+			return
+		task = get_running_loop().create_task(self._match(path))
+		self._tasks.add(task)
+		task.add_done_callback(self._match_done)
+
+	def _match_done(self, task: 'Task[None]') -> None:
+		self._tasks.discard(task)
+		# The error is kept in errors by _match, the signals of the object are missed
+		if not task.cancelled():
+			task.exception()
+
+	def _unwatch(self, path: str) -> None:
+		entry = self._matches.pop(path, None)
+		if entry is not None:
+			entry[0].close()
+
+	def _publish(self, event: Event) -> None:
+		for subscription in self._subscriptions:
+			if subscription.accepts(event):
+				subscription.put(event)
+
+	def _track(self, event: Event) -> None:
+		if isinstance(event, (SmsAdded, CallAdded)):
+			path = event.sms_path if isinstance(event, SmsAdded) else event.call_path  # type: ignore[attr-defined]
+			self._owners[path] = event.object_path
+			self._watch(path)
+		elif isinstance(event, (SmsDeleted, CallDeleted)):
+			path = event.sms_path if isinstance(event, SmsDeleted) else event.call_path  # type: ignore[attr-defined]
+			self._owners.pop(path, None)
+			self._unwatch(path)
+
+	def _own(self, modem_path: str, properties: Dict[str, Any]) -> None:
+		paths = list(properties.get('bearer_object_paths', ()))
+		if properties.get('sim_object_path', '/') != '/':
+			paths.append(properties['sim_object_path'])
+		for path in paths:
+			self._owners[path] = modem_path
+			self._watch(path)
+
+	def _properties_changed(self, message: SdBusMessage) -> PropertiesChanged:
+		interface, changed, invalidated = message.get_contents()
+		object_path = message.path
+		properties = parse_properties(interface, changed)
+		if interface == MODEM_INTERFACE_NAME:
+			self._own(object_path, properties)
+		return PropertiesChanged(object_path, self.modem_path(object_path), interface, properties, invalidated)
+
+	def _interfaces_added(self, message: SdBusMessage) -> Event:
+		object_path, interfaces = message.get_contents()
+		interfaces = parse_interfaces(interfaces)
+		if MODEM_INTERFACE_NAME not in interfaces:
+			return InterfacesAdded(object_path, object_path, interfaces)
+		self._own(object_path, interfaces[MODEM_INTERFACE_NAME])
+		return ModemAdded(object_path, object_path, interfaces)
+
+	def _interfaces_removed(self, message: SdBusMessage) -> Event:
+		object_path, interfaces = message.get_contents()
+		if MODEM_INTERFACE_NAME not in interfaces:
+			return InterfacesRemoved(object_path, object_path, interfaces)
+		for path in [path for path, owner in self._owners.items() if owner == object_path]:
+			del self._owners[path]
+			self._unwatch(path)
+		return ModemRemoved(object_path, object_path)
@@ -2,6 +2,8 @@ from typing import Any, Dict, List, Tuple
 
 from sdbus import DbusInterfaceCommonAsync, DbusObjectManagerInterfaceAsync, dbus_method_async, dbus_property_async, dbus_signal_async
 
+from .constant import dbus_property_async_constant
+
 
 class MMModemsInterfaceAsync(DbusObjectManagerInterfaceAsync):
 	"""
@@ -129,17 +131,17 @@ class MMModemInterfaceAsync(DbusInterfaceCommonAsync, interface_name='org.freede
 	def max_active_multiplexed_bearers(self) -> int:
 		raise NotImplementedError
 
-	@dbus_property_async(property_signature='s')
+	@dbus_property_async_constant(property_signature='s')
 	def manufacturer(self) -> str:
 		"""The equipment manufacturer, as reported by the modem."""
 		raise NotImplementedError
 
-	@dbus_property_async(property_signature='s')
+	@dbus_property_async_constant(property_signature='s')
 	def model(self) -> str:
 		"""The equipment model, as reported by the modem."""
 		raise NotImplementedError
 
-	@dbus_property_async(property_signature='s')
+	@dbus_property_async_constant(property_signature='s')
 	def revision(self) -> str:
 		"""The revision identification of the software, as reported by the modem."""
 		raise NotImplementedError
@@ -152,12 +154,12 @@ class MMModemInterfaceAsync(DbusInterfaceCommonAsync, interface_name='org.freede
 	def carrier_configuration_revision(self) -> str:
 		raise NotImplementedError
 
-	@dbus_property_async(property_signature='s')
+	@dbus_property_async_constant(property_signature='s')
 	def hardware_revision(self) -> str:
 		"""The revision identification of the hardware, as reported by the modem."""
 		raise NotImplementedError
 
-	@dbus_property_async(property_signature='s')
+	@dbus_property_async_constant(property_signature='s')
 	def device_identifier(self) -> str:
 		"""
 		A best-effort device identifier based on various device information like model name, firmware revision, 
@@ -172,11 +174,11 @@ class MMModemInterfaceAsync(DbusInterfaceCommonAsync, interface_name='org.freede
 	def device(self) -> str:
 		raise NotImplementedError
 
-	@dbus_property_async(property_signature='as')
+	@dbus_property_async_constant(property_signature='as')
 	def drivers(self) -> List[str]:
 		raise NotImplementedError
 
-	@dbus_property_async(property_signature='s')
+	@dbus_property_async_constant(property_signature='s')
 	def plugin(self) -> str:
 		raise NotImplementedError
 
@@ -189,7 +191,7 @@ class MMModemInterfaceAsync(DbusInterfaceCommonAsync, interface_name='org.freede
 	def ports(self) -> List[Tuple[str, int]]:
 		raise NotImplementedError
 
-	@dbus_property_async(property_signature='s')
+	@dbus_property_async_constant(property_signature='s')
 	def equipment_identifier(self) -> str:
 		"""
 		The identity of the device.
@@ -0,0 +1,10 @@
+from typing import Optional
+
+
+def match_rule(sender: Optional[str] = None, path: Optional[str] = None, interface: Optional[str] = None, member: Optional[str] = None) -> str:
+	"""Returns the D-Bus match rule of a signal match, as sd-bus builds it for ``match_signal_async``."""
+	rule = "type='signal'"
+	for key, value in (('sender', sender), ('path', path), ('interface', interface), ('member', member)):
+		if value is not None:
+			rule += f",{key}='{value}'"
+	return rule
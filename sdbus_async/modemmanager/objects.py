@@ -1,16 +1,62 @@
-from typing import Dict, List, Optional
-
-from sdbus.sd_bus_internals import SdBus
-
-from .enums import MMCallDirection, MMCallState, MMCallStateReason
+from asyncio import Queue, Semaphore, gather, wait_for
+from time import monotonic
+from typing import Any, AsyncIterator, Awaitable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Type, TypeVar
+from weakref import WeakValueDictionary
+
+from sdbus import get_default_bus
+from sdbus.dbus_proxy_async_property import DbusBoundPropertyAsyncBase
+from sdbus.dbus_proxy_async_signal import DbusSignalAsync
+from sdbus.exceptions import SdBusBaseError
+from sdbus.sd_bus_internals import SdBus, SdBusMessage, SdBusSlot
+
+from .constant import forget_constants
+from .enums import MMCallDirection, MMCallState, MMCallStateReason, MMSmsState, enum_name
 from .interfaces_bearer import MMBearerInterfaceAsync
 from .interfaces_call import MMCallInterfaceAsync
 from .interfaces_modem import MMModemInterfaceAsync, MMModemMessagingInterfaceAsync, MMModemSimpleInterfaceAsync, MMModemSignalInterfaceAsync, MMModemsInterfaceAsync, MMModemVoiceInterfaceAsync
 from .interfaces_root import MMInterfaceAsync
 from .interfaces_sim import MMSimInterfaceAsync
 from .interfaces_sms import MMSmsInterfaceAsync
+from .index import MODEM_INDEX_KEYS, MMModemIndex
+from .properties import PROPERTIES_INTERFACE_NAME, interface_name, parse_interfaces, parse_properties, property_names
+from .signal_records import SIGNAL_RECORDS, SignalRecord
+from .snapshots import ModemSnapshot, SmsSnapshot
+from .variants import plain_values, unwrap_variant, unwrap_variants
 
 MODEM_MANAGER_SERVICE_NAME = 'org.freedesktop.ModemManager1'
+MODEM_INTERFACE_NAME = 'org.freedesktop.ModemManager1.Modem'
+SIM_INTERFACE_NAME = 'org.freedesktop.ModemManager1.Sim'
+
+T = TypeVar('T')
+
+_proxies: Dict[SdBus, 'WeakValueDictionary[Tuple[type, str], Any]'] = {}
+
+
+def _proxy(proxy_class: Type[T], object_path: str, bus: Optional[SdBus] = None) -> T:
+	"""Returns the live proxy of the object path on the bus, creating it if there is none."""
+	proxies = _proxies.setdefault(bus if bus is not None else get_default_bus(), WeakValueDictionary())
+	proxy = proxies.get((proxy_class, object_path))
+	if proxy is None:
+		proxy = proxies[proxy_class, object_path] = proxy_class(object_path=object_path, bus=bus)
+	return proxy
+
+
+def _evict(proxy_class: type, object_path: str, bus: Optional[SdBus] = None) -> None:
+	"""Forgets the proxy of a deleted object, so that a new proxy is created if the path is reused."""
+	proxies = _proxies.get(bus if bus is not None else get_default_bus())
+	if proxies is not None:
+		proxy = proxies.pop((proxy_class, object_path), None)
+		if proxy is not None:
+			forget_constants(proxy)
+
+
+async def _evict_on(signal: DbusSignalAsync, object_path: str, proxy_class: type, bus: SdBus) -> SdBusSlot:
+	"""Evicts the proxies of the object paths carried by a deletion signal of the object."""
+
+	def callback(message: SdBusMessage) -> None:
+		_evict(proxy_class, message.get_contents(), bus)
+
+	return await bus.match_signal_async(MODEM_MANAGER_SERVICE_NAME, object_path, signal.interface_name, signal.signal_name, callback)
 
 
 class MM(MMInterfaceAsync):
@@ -51,23 +97,139 @@ class MMModemMessaging(MMModemMessagingInterfaceAsync):
 	def __init__(self, object_path: str, bus: Optional[SdBus] = None) -> None:
 		super().__init__()
 		self._connect(MODEM_MANAGER_SERVICE_NAME, object_path, bus)
+		self._deleted_slot: Optional[SdBusSlot] = None
+
+	async def get_sms(self, object_path: str) -> MMSms:
+		"""
+		Returns the message object of the given path. The same proxy is returned while it is alive,
+		until the message is deleted.
+		"""
+		if self._deleted_slot is None:
+			self._deleted_slot = await _evict_on(MMModemMessagingInterfaceAsync.deleted, self._dbus.object_path, MMSms, self._dbus.attached_bus)
+		return _proxy(MMSms, object_path, self._dbus.attached_bus)
+
+	async def get_messages(self) -> List[MMSms]:
+		return [await self.get_sms(path) for path in await self.messages]
 
-	async def create_sms(self, number: str, text: str = None, data: bytes = None) -> MMSms:
-		"""Creates a new message object."""
+	async def create_sms(self, number: str, text: str = None, data: bytes = None, delivery_report_request: bool = False) -> MMSms:
+		"""
+		Creates a new message object.
+
+		:param delivery_report_request: Request a status report of the delivery of the message.
+		"""
 		args = {"number": ("s", number)}
 		if text:
 			args["text"] = ("s", text)
 		elif data:
 			args["data"] = ("ay", data)
+		if delivery_report_request:
+			args["delivery-report-request"] = ("b", True)
 
-		return MMSms(self.create(properties=args))
+		return await self.get_sms(await self.create(properties=args))
 
 	async def delete_sms(self, sms: MMSms) -> None:
 		"""Delete an SMS message."""
-		self.delete(sms._dbus.object_path)
+		await self.delete(sms._dbus.object_path)
+		_evict(MMSms, sms._dbus.object_path, self._dbus.attached_bus)
+
+	async def inbox(self, delete: bool = False, existing: bool = False) -> AsyncIterator[SmsSnapshot]:
+		"""
+		Yields the received messages once complete, each read with one GetAll call.
+
+		Multipart messages are announced by the Added signal when their first part arrives,
+		they are yielded when their state becomes ``MM_SMS_STATE_RECEIVED``.
+
+		Usage::
+
+			async for sms in modem.messaging.inbox(delete=True):
+				print(sms.number, sms.text)
+
+		:param delete: Delete each message from the modem when the next one is requested, \
+			which acknowledges it. A message is kept if the loop is left while handling it.
+			Messages deleted by another client meanwhile are skipped.
+		:param existing: Also yield the received messages already stored on the modem.
+		"""
+		bus = self._dbus.attached_bus
+		sms_interface = interface_name(MMSmsInterfaceAsync)
+		# Messages to yield, with the match of their PropertiesChanged signal while their parts are being received
+		incoming: Dict[str, Optional[SdBusSlot]] = {}
+		ready: 'Queue[str]' = Queue()
+
+		def added(message: SdBusMessage) -> None:
+			path, received = message.get_contents()
+			if received and path not in incoming:
+				incoming[path] = None
+				ready.put_nowait(path)
+
+		def forget(path: str) -> None:
+			slot = incoming.pop(path, None)
+			if slot is not None:
+				slot.close()
+
+		def deleted(message: SdBusMessage) -> None:
+			forget(message.get_contents())
+
+		def properties_changed(message: SdBusMessage) -> None:
+			interface, changed, _ = message.get_contents()
+			if interface == sms_interface and changed.get('State', (None, None))[1] == MMSmsState.MM_SMS_STATE_RECEIVED:
+				ready.put_nowait(message.path)
+
+		messaging = interface_name(MMModemMessagingInterfaceAsync)
+		slots = [
+			await bus.match_signal_async(MODEM_MANAGER_SERVICE_NAME, self._dbus.object_path, messaging, 'Added', added),
+			await bus.match_signal_async(MODEM_MANAGER_SERVICE_NAME, self._dbus.object_path, messaging, 'Deleted', deleted),
+		]
+		try:
+			if existing:
+				for path in await self.messages:
+					incoming[path] = None
+					ready.put_nowait(path)
+			while True:
+				path = await ready.get()
+				if path not in incoming:
+					continue
+				try:
+					sms = await SmsSnapshot.from_proxy(await self.get_sms(path))
+				except SdBusBaseError:
+					# Deleted by another client, its Deleted signal not received yet
+					forget(path)
+					_evict(MMSms, path, bus)
+					continue
+				if sms.state == MMSmsState.MM_SMS_STATE_RECEIVING:
+					# Still receiving parts: the change of state is matched on the path of the message, which is read again once matched
+					if incoming[path] is None:
+						slot = await bus.match_signal_async(MODEM_MANAGER_SERVICE_NAME, path, PROPERTIES_INTERFACE_NAME, 'PropertiesChanged', properties_changed)
+						if path in incoming:
+							incoming[path] = slot
+							ready.put_nowait(path)
+						else:
+							slot.close()
+					continue
+				forget(path)
+				if sms.state != MMSmsState.MM_SMS_STATE_RECEIVED:
+					continue
+				yield sms
+				if delete:
+					try:
+						await self.delete(path)
+					except SdBusBaseError:
+						# Already deleted by another client
+						pass
+					_evict(MMSms, path, bus)
+		finally:
+			for slot in slots:
+				slot.close()
+			for path in list(incoming):
+				forget(path)
 
 
 class MMModemSignal(MMModemSignalInterfaceAsync):
+	cdma_values = plain_values('cdma')
+	evdo_values = plain_values('evdo')
+	gsm_values = plain_values('gsm')
+	umts_values = plain_values('umts')
+	lte_values = plain_values('lte')
+	nr5g_values = plain_values('nr5g')
 
 	def __init__(self, object_path: str, bus: Optional[SdBus] = None) -> None:
 		"""
@@ -77,6 +239,24 @@ class MMModemSignal(MMModemSignalInterfaceAsync):
 		super().__init__()
 		self._connect(MODEM_MANAGER_SERVICE_NAME, object_path, bus)
 
+	async def get_record(self, technology: str) -> SignalRecord:
+		"""
+		Reads the signal of one access technology into a record.
+
+		:param technology: Property name of the access technology, for example ``'lte'``.
+		"""
+		return SIGNAL_RECORDS[technology].decode(await getattr(self, technology))
+
+	async def get_records(self) -> Dict[str, SignalRecord]:
+		"""Reads the signal of all access technologies with one GetAll call, omitting technologies without values."""
+		names = property_names(MMModemSignalInterfaceAsync)
+		records: Dict[str, SignalRecord] = {}
+		for dbus_name, (_, values) in (await self._properties_get_all(interface_name(MMModemSignalInterfaceAsync))).items():
+			technology = names.get(dbus_name)
+			if values and technology in SIGNAL_RECORDS:
+				records[technology] = SIGNAL_RECORDS[technology].decode(values)
+		return records
+
 
 class MMModemSimple(MMModemSimpleInterfaceAsync):
 
@@ -84,64 +264,263 @@ class MMModemSimple(MMModemSimpleInterfaceAsync):
 		super().__init__()
 		self._connect(MODEM_MANAGER_SERVICE_NAME, object_path, bus)
 
+	async def get_status_values(self) -> Dict[str, Any]:
+		"""``get_status`` with plain values instead of variants."""
+		return unwrap_variants(await self.get_status())
+
 
 class MMModemVoice(MMModemVoiceInterfaceAsync):
 
 	def __init__(self, object_path: str, bus: Optional[SdBus] = None) -> None:
 		super().__init__()
 		self._connect(MODEM_MANAGER_SERVICE_NAME, object_path, bus)
+		self._deleted_slot: Optional[SdBusSlot] = None
+
+	async def get_call(self, object_path: str) -> 'MMCall':
+		"""
+		Returns the call object of the given path. The same proxy is returned while it is alive,
+		until the call is deleted.
+		"""
+		if self._deleted_slot is None:
+			self._deleted_slot = await _evict_on(MMModemVoiceInterfaceAsync.call_deleted, self._dbus.object_path, MMCall, self._dbus.attached_bus)
+		return _proxy(MMCall, object_path, self._dbus.attached_bus)
+
+	async def remove_call(self, call: 'MMCall') -> None:
+		"""Delete a call, hanging it up if it is active."""
+		await self.delete_call(call._dbus.object_path)
+		_evict(MMCall, call._dbus.object_path, self._dbus.attached_bus)
+
+	async def get_calls(self) -> List['MMCall']:
+		return [await self.get_call(path) for path in await self.call_object_paths]
+
+
+class _ModemInterface:
+	"""
+	Sub-interface proxy of :py:class:`MMModem`, created on first access.
+
+	``None`` when the interfaces exported by the modem are known and do not include it.
+	"""
 
-	async def get_calls(self):
-		return [MMCall(path) for path in self.call_object_paths]
+	def __init__(self, proxy_class: type) -> None:
+		self.proxy_class = proxy_class
+		self.interface_name = interface_name(proxy_class)
+
+	def __set_name__(self, owner: type, name: str) -> None:
+		self.name = name
+
+	def __get__(self, modem: Optional['MMModem'], owner: Optional[type] = None) -> Any:
+		if modem is None:
+			return self
+		if modem.interfaces and self.interface_name not in modem.interfaces:
+			return None
+		proxy = self.proxy_class(object_path=modem._dbus.object_path, bus=modem._dbus.attached_bus)
+		modem.__dict__[self.name] = proxy
+		return proxy
+
+
+class _HydratedProperty(DbusBoundPropertyAsyncBase[Any]):
+	"""Modem interface property of a hydrated :py:class:`MMModem`, read from :py:attr:`MMModem.interfaces` while they hold it."""
+
+	def __init__(self, modem: 'MMModem', name: str) -> None:
+		self.modem = modem
+		self.name = name
+		self.bound = getattr(type(modem), name).__get__(modem, type(modem))
+		self.__doc__ = self.bound.__doc__
+
+	async def get_async(self) -> Any:
+		properties = self.modem.interfaces.get(MODEM_INTERFACE_NAME)
+		if properties and self.name in properties:
+			return properties[self.name]
+		return await self.bound.get_async()
+
+	async def set_async(self, complete_object: Any) -> None:
+		await self.bound.set_async(complete_object)
+
+
+_MODEM_PROPERTIES = frozenset(property_names(MMModemInterfaceAsync).values())
 
 
 class MMModem(MMModemInterfaceAsync):
+	messaging = _ModemInterface(MMModemMessaging)
+	simple = _ModemInterface(MMModemSimple)
+	signal = _ModemInterface(MMModemSignal)
+	voice = _ModemInterface(MMModemVoice)
 
 	def __init__(
 		self,
 		object_path: str,
 		bus: Optional[SdBus] = None,
+		interfaces: Optional[Dict[str, Dict[str, Any]]] = None,
 	) -> None:
 		"""
 		:param bus: You probably want to set default bus to system bus \
 			or pass system bus directly.
+		:param interfaces: Interfaces exported by the modem and their properties, if already known to the caller, \
+			as returned by :py:func:`parse_interfaces`. Sub-interface proxies of interfaces not listed are ``None``, \
+			and the Modem interface properties listed are read from there instead of the bus.
 		"""
 		super().__init__()
 		self._connect(MODEM_MANAGER_SERVICE_NAME, object_path, bus)
-		self.messaging = MMModemMessaging(object_path=object_path, bus=bus)
-		self.simple = MMModemSimple(object_path=object_path, bus=bus)
-		self.signal = MMModemSignal(object_path=object_path, bus=bus)
-		self.voice = MMModemVoice(object_path=object_path, bus=bus)
 		self.sim: Optional[MMSim] = None
 		self.bearers: List[MMBearer] = []
+		self.interfaces: Dict[str, Dict[str, Any]] = interfaces if interfaces is not None else {}
+		self._hydrate()
+
+	def set_interfaces(self, interfaces: Dict[str, Dict[str, Any]]) -> None:
+		"""Replaces :py:attr:`interfaces`, dropping the sub-interface proxies of interfaces no longer exported."""
+		self.interfaces = interfaces
+		self.remove_interfaces([name for name in self._interface_attributes() if name not in interfaces])
+		self._hydrate()
+
+	def _hydrate(self) -> None:
+		# D-Bus properties are not data descriptors, the instance attributes take precedence over them
+		for name in self.interfaces.get(MODEM_INTERFACE_NAME, ()):
+			if name in _MODEM_PROPERTIES and name not in self.__dict__:
+				self.__dict__[name] = _HydratedProperty(self, name)
+
+	def remove_interfaces(self, names: Iterable[str]) -> None:
+		"""Forgets interfaces the modem stopped exporting, with their properties and sub-interface proxies."""
+		attributes = self._interface_attributes()
+		for name in names:
+			self.interfaces.pop(name, None)
+			if name in attributes:
+				self.__dict__.pop(attributes[name], None)
+
+	@classmethod
+	def _interface_attributes(cls) -> Dict[str, str]:
+		return {attr.interface_name: attr.name for attr in vars(cls).values() if isinstance(attr, _ModemInterface)}
+
+	async def get_cell_info_values(self) -> List[Dict[str, Any]]:
+		"""``get_cell_info`` with plain values instead of variants."""
+		return unwrap_variant('aa{sv}', await self.get_cell_info())
 
 	async def set_sim(self, object_path: str):
-		self.sim = MMSim(object_path=object_path)
+		self.sim = _proxy(MMSim, object_path, self._dbus.attached_bus)
 
 	async def set_bearers(self, object_paths: List[str]):
-		for p in object_paths:
-			b = MMBearer(p)
-			self.bearers.append(b)
+		self.bearers = [_proxy(MMBearer, p, self._dbus.attached_bus) for p in object_paths]
 
 
 class MMModems(MMModemsInterfaceAsync):
-	modems: List[MMModem] = []
 
 	def __init__(self, bus: Optional[SdBus] = None) -> None:
 		super().__init__()
 		self._connect(service_name=MODEM_MANAGER_SERVICE_NAME, object_path='/org/freedesktop/ModemManager1', bus=bus)
+		self.modems_by_path: Dict[str, MMModem] = {}
+		self.index = MMModemIndex()
+
+	@property
+	def modems(self) -> List[MMModem]:
+		"""The currently known modems, see :py:meth:`get_modems`."""
+		return list(self.modems_by_path.values())
 
-	async def get_modems(self) -> List[MMModem]:
+	async def get_modems(self, hydrate: bool = False) -> List[MMModem]:
+		"""
+		Refreshes the known modems. Proxies of the modems still present are reused and vanished ones are dropped.
+
+		:param hydrate: Keep the properties returned by GetManagedObjects in :py:attr:`MMModem.interfaces`, \
+			and read the Modem interface properties from there, without another D-Bus call per property. \
+			The values are those of this call, until the next one or as kept current by :py:class:`MMModemRegistry`. \
+			The names of the exported interfaces are recorded either way.
+		"""
 		objects = await self.get_managed_objects()
+		for path in [p for p in self.modems_by_path if MODEM_INTERFACE_NAME not in objects.get(p, ())]:
+			forget_constants(self.modems_by_path.pop(path))
+			self.index.discard(path)
 		for k, v in objects.items():
-			m: MMModem = MMModem(object_path=k)
-			self.modems.append(m)
+			if MODEM_INTERFACE_NAME not in v:
+				continue
+			interfaces = parse_interfaces(v) if hydrate else {name: {} for name in v}
+			m = self.modems_by_path.get(k)
+			if m is None:
+				self.modems_by_path[k] = MMModem(object_path=k, bus=self._dbus.attached_bus, interfaces=interfaces)
+			else:
+				m.set_interfaces(interfaces)
+			if hydrate:
+				self.index.update(k, interfaces[MODEM_INTERFACE_NAME])
 		return self.modems
 
+	def get(self, object_path: str) -> Optional[MMModem]:
+		"""Returns the known modem of the given object path, if any."""
+		return self.modems_by_path.get(object_path)
+
+	async def fetch_properties(self, names: Optional[Sequence[str]] = None, limit: int = 16, return_exceptions: bool = False) -> Dict[str, Any]:
+		"""
+		Reads properties of the Modem interface of all the known modems concurrently,
+		listed with :py:meth:`get_modems` first when none is known.
+
+		:param names: Python property names to read with one Get each, or ``None`` to read all with one GetAll per modem.
+		:param limit: Maximum number of D-Bus calls in flight.
+		:param return_exceptions: Return the exception of a modem failing to reply in place of its properties, \
+			instead of raising it, as :py:func:`asyncio.gather` does.
+		:returns: Dictionary of modem object paths to dictionaries of python property names and values.
+		"""
+		semaphore = Semaphore(limit)
+
+		async def call(awaitable: Awaitable[T]) -> T:
+			async with semaphore:
+				return await awaitable
+
+		async def fetch(modem: MMModem) -> Dict[str, Any]:
+			if names is None:
+				return parse_properties(MODEM_INTERFACE_NAME, await call(modem._properties_get_all(MODEM_INTERFACE_NAME)))
+			return dict(zip(names, await gather(*(call(getattr(modem, name)) for name in names))))
+
+		if not self.modems_by_path:
+			await self.get_modems()
+		modems = self.modems
+		results = await gather(*(fetch(m) for m in modems), return_exceptions=return_exceptions)
+		return {m._dbus.object_path: r for m, r in zip(modems, results)}
+
+	async def fetch_snapshots(self, limit: int = 16, return_exceptions: bool = False) -> Dict[str, Any]:
+		"""
+		Reads a :py:class:`ModemSnapshot` of all the known modems concurrently, with one GetAll per modem.
+
+		See :py:meth:`fetch_properties` for the parameters.
+		"""
+		results = await self.fetch_properties(limit=limit, return_exceptions=return_exceptions)
+		return {path: r if isinstance(r, BaseException) else ModemSnapshot(path, r) for path, r in results.items()}
+
+	async def build_index(self) -> None:
+		"""Refreshes the modems with their properties and indexes them, with the identifiers of their SIM cards."""
+		await self.get_modems(hydrate=True)
+		await gather(*(self.index_modem(m) for m in self.modems))
+
+	async def index_modem(self, modem: MMModem) -> None:
+		"""
+		Indexes a modem under its identifiers and those of its SIM card, reading the properties not already known.
+
+		Sets :py:attr:`MMModem.sim` and hydrates the Modem interface properties of the modem.
+		"""
+		properties = modem.interfaces.get(MODEM_INTERFACE_NAME)
+		if not properties:
+			properties = modem.interfaces[MODEM_INTERFACE_NAME] = parse_properties(MODEM_INTERFACE_NAME, await modem._properties_get_all(MODEM_INTERFACE_NAME))
+		values = {key: properties.get(key) for key in MODEM_INDEX_KEYS}
+		sim_path = properties.get('sim_object_path')
+		if sim_path and sim_path != '/':
+			modem.sim = _proxy(MMSim, sim_path, self._dbus.attached_bus)
+			values.update(parse_properties(SIM_INTERFACE_NAME, await modem.sim._properties_get_all(SIM_INTERFACE_NAME)))
+		else:
+			modem.sim = None
+			values.update(sim_identifier=None, imsi=None)
+		if modem._dbus.object_path in self.modems_by_path:
+			self.index.update(modem._dbus.object_path, values)
+
+	def find(self, key: str, value: Any) -> Optional[MMModem]:
+		"""
+		Returns the modem with the given identifier, for example ``find('equipment_identifier', imei)``.
+
+		The index is filled by :py:meth:`build_index`, the Modem interface identifiers also by ``get_modems(hydrate=True)``.
+
+		:param key: One of ``equipment_identifier``, ``device_identifier``, ``primary_port``, ``sim_identifier`` or ``imsi``.
+		"""
+		object_path = self.index.find(key, value)
+		return self.modems_by_path.get(object_path) if object_path is not None else None
+
 	async def get_first(self) -> Optional[MMModem]:
-		if len(self.modems) <= 0:
+		if not self.modems_by_path:
 			await self.get_modems()
-		return self.modems[0] if len(self.modems) >= 1 else None
+		return next(iter(self.modems_by_path.values()), None)
 
 
 class MMSim(MMSimInterfaceAsync):
@@ -160,6 +539,10 @@ class MMSim(MMSimInterfaceAsync):
 
 
 class MMBearer(MMBearerInterfaceAsync):
+	ip4_config_values = plain_values('ip4_config')
+	ip6_config_values = plain_values('ip6_config')
+	stats_values = plain_values('stats')
+	properties_values = plain_values('properties')
 
 	def __init__(
 		self,
@@ -174,7 +557,16 @@ class MMBearer(MMBearerInterfaceAsync):
 		self._connect(MODEM_MANAGER_SERVICE_NAME, object_path, bus)
 
 
+class CallStateTransition(NamedTuple):
+	"""A StateChanged signal of a call, with the :py:func:`time.monotonic` time it was received at."""
+	old: int
+	new: int
+	reason: int
+	timestamp: float
+
+
 class MMCall(MMCallInterfaceAsync):
+	audio_format_values = plain_values('audio_format')
 
 	def __init__(
 		self,
@@ -191,14 +583,46 @@ class MMCall(MMCallInterfaceAsync):
 	@property
 	def state_text(self) -> str:
 		"""A MMCallState name, describing the state of the call."""
-		return MMCallState(self.state).name
+		return enum_name(MMCallState, self.state)
 
 	@property
 	def state_reason_text(self) -> str:
 		"""A MMCallStateReason name, describing why the state is changed."""
-		return MMCallStateReason(self.state_reason).name
+		return enum_name(MMCallStateReason, self.state_reason)
 
 	@property
 	def direction_text(self) -> str:
 		"""A MMCallDirection name, describing the direction of the call."""
-		return MMCallDirection(self.direction).name
+		return enum_name(MMCallDirection, self.direction)
+
+	async def wait_for_state(self, states: Iterable[int], timeout: Optional[float] = None, history: Optional[List[CallStateTransition]] = None) -> int:
+		"""
+		Waits for the call to reach one of ``states``, :py:class:`MMCallState` values, from its StateChanged signals.
+
+		:param timeout: Seconds to wait, forever if ``None``. :py:class:`asyncio.TimeoutError` is raised after it.
+		:param history: List to which the transitions received while waiting are appended.
+		:return: The state reached, which is the current state if it is already one of ``states``.
+		"""
+		wanted = set(states)
+		bus = self._dbus.attached_bus
+		transitions: 'Queue[CallStateTransition]' = Queue()
+
+		def callback(message: SdBusMessage) -> None:
+			transitions.put_nowait(CallStateTransition(*message.get_contents(), monotonic()))
+
+		async def wait() -> int:
+			state = await self.state
+			while state not in wanted:
+				transition = await transitions.get()
+				if history is not None:
+					history.append(transition)
+				state = transition.new
+			return state
+
+		# The match is added before reading the state, so that no transition is missed in between
+		signal = MMCallInterfaceAsync.state_changed
+		slot = await bus.match_signal_async(MODEM_MANAGER_SERVICE_NAME, self._dbus.object_path, signal.interface_name, signal.signal_name, callback)
+		try:
+			return await wait_for(wait(), timeout)
+		finally:
+			slot.close()
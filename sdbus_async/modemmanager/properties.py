@@ -0,0 +1,72 @@
+from functools import lru_cache
+from typing import Any, Dict, Tuple
+
+from .interfaces_bearer import MMBearerInterfaceAsync
+from .interfaces_call import MMCallInterfaceAsync
+from .interfaces_modem import MMModemInterfaceAsync, MMModemMessagingInterfaceAsync, MMModemSimpleInterfaceAsync, MMModemSignalInterfaceAsync, MMModemVoiceInterfaceAsync
+from .interfaces_root import MMInterfaceAsync
+from .interfaces_sim import MMSimInterfaceAsync
+from .interfaces_sms import MMSmsInterfaceAsync
+
+PROPERTIES_INTERFACE_NAME = 'org.freedesktop.DBus.Properties'
+
+
+def interface_name(interface: type) -> str:
+	"""Returns the D-Bus interface name implemented by an interface class or one of its subclasses."""
+	for cls in interface.__mro__:
+		for attr in vars(cls).values():
+			name = getattr(attr, 'interface_name', None)
+			if name is not None:
+				return name
+	raise TypeError(f'{interface.__name__} does not declare any D-Bus member')
+
+
+@lru_cache(maxsize=None)
+def property_names(interface: type) -> Dict[str, str]:
+	"""Maps the D-Bus property names of an interface class to its python attribute names."""
+	names: Dict[str, str] = {}
+	for attr_name, attr in vars(interface).items():
+		property_name = getattr(attr, 'property_name', None)
+		if property_name is not None:
+			names[property_name] = attr_name
+	return names
+
+
+INTERFACES: Dict[str, type] = {
+	interface_name(interface): interface
+	for interface in (
+		MMInterfaceAsync,
+		MMModemInterfaceAsync,
+		MMModemMessagingInterfaceAsync,
+		MMModemSimpleInterfaceAsync,
+		MMModemSignalInterfaceAsync,
+		MMModemVoiceInterfaceAsync,
+		MMSimInterfaceAsync,
+		MMSmsInterfaceAsync,
+		MMBearerInterfaceAsync,
+		MMCallInterfaceAsync,
+	)
+}
+
+
+def parse_properties(interface: str, properties: Dict[str, Tuple[str, Any]]) -> Dict[str, Any]:
+	"""
+	Converts an ``a{sv}`` properties dictionary, as returned by GetAll, to python attribute names and plain values.
+
+	Properties not declared by the python interface class keep their D-Bus name.
+
+	:param interface: D-Bus interface name the properties belong to.
+	:param properties: Dictionary of D-Bus property names to ``(signature, value)`` variants.
+	"""
+	cls = INTERFACES.get(interface)
+	names = property_names(cls) if cls is not None else {}
+	return {names.get(name, name): variant[1] for name, variant in properties.items()}
+
+
+def parse_interfaces(interfaces: Dict[str, Dict[str, Tuple[str, Any]]]) -> Dict[str, Dict[str, Any]]:
+	"""
+	Converts the ``a{sa{sv}}`` payload of an object, as returned by GetManagedObjects, with :py:func:`parse_properties`.
+
+	:returns: Dictionary of D-Bus interface names to dictionaries of python attribute names and values.
+	"""
+	return {interface: parse_properties(interface, properties) for interface, properties in interfaces.items()}
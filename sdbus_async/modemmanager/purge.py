@@ -0,0 +1,184 @@
+import json
+import sqlite3
+from asyncio import Semaphore, gather, get_running_loop
+from time import monotonic
+from typing import IO, Any, Awaitable, Callable, Collection, List, Optional, TypeVar, Union
+
+from .enums import MMSmsState
+from .objects import MMModemMessaging
+from .snapshots import SmsSnapshot
+
+T = TypeVar('T')
+
+# Messages still being received, stored to be sent, or being sent are left on the modem
+PURGED_STATES = frozenset((MMSmsState.MM_SMS_STATE_UNKNOWN, MMSmsState.MM_SMS_STATE_RECEIVED, MMSmsState.MM_SMS_STATE_SENT))
+
+
+def _default(value: Any) -> Any:
+	if isinstance(value, bytes):
+		return value.hex()
+	raise TypeError(f'{type(value).__name__} is not JSON serializable')
+
+
+def sms_json(sms: SmsSnapshot) -> str:
+	"""Returns a message as a JSON object of its ``object_path`` and properties, ``data`` in hexadecimal."""
+	return json.dumps({'object_path': sms.object_path, **sms.as_dict()}, default=_default, ensure_ascii=False)
+
+
+class JsonLinesSink:
+	"""Appends messages to a file, one JSON object per line as returned by :py:func:`sms_json`."""
+
+	def __init__(self, file: Union[str, IO[str]]) -> None:
+		"""
+		:param file: Path of the file, or text file object.
+		"""
+		self._owned = isinstance(file, str)
+		self.file: IO[str] = open(file, 'a', encoding='utf-8') if isinstance(file, str) else file
+
+	def write(self, messages: List[SmsSnapshot]) -> None:
+		self.file.writelines(sms_json(sms) + '\n' for sms in messages)
+		self.file.flush()
+
+	def close(self) -> None:
+		if self._owned:
+			self.file.close()
+
+	def __enter__(self) -> 'JsonLinesSink':
+		return self
+
+	def __exit__(self, *args: Any) -> None:
+		self.close()
+
+
+class SqliteSink:
+	"""
+	Inserts messages in an SQLite table, with the number, text, timestamp, state and PDU type in columns
+	and all the properties in the ``properties`` column, as returned by :py:func:`sms_json`.
+	"""
+
+	def __init__(self, database: Union[str, sqlite3.Connection], table: str = 'sms') -> None:
+		"""
+		:param database: Path of the database, or connection. A connection must allow its use by other threads, \
+			with ``check_same_thread=False``, to be written by :py:func:`purge_messages`.
+		"""
+		self._owned = isinstance(database, str)
+		# purge_messages writes from a thread of the executor of the loop
+		self.connection = sqlite3.connect(database, check_same_thread=False) if isinstance(database, str) else database
+		self.table = table
+		with self.connection:
+			self.connection.execute(
+				f'CREATE TABLE IF NOT EXISTS "{table}" '
+				'(object_path TEXT, number TEXT, text TEXT, timestamp TEXT, state INTEGER, pdu_type INTEGER, properties TEXT)'
+			)
+
+	def write(self, messages: List[SmsSnapshot]) -> None:
+		rows = [(sms.object_path, sms.number, sms.text, sms.timestamp, sms.state, sms.pdu_type, sms_json(sms)) for sms in messages]
+		with self.connection:
+			self.connection.executemany(f'INSERT INTO "{self.table}" VALUES (?, ?, ?, ?, ?, ?, ?)', rows)
+
+	def close(self) -> None:
+		if self._owned:
+			self.connection.close()
+
+	def __enter__(self) -> 'SqliteSink':
+		return self
+
+	def __exit__(self, *args: Any) -> None:
+		self.close()
+
+
+class PurgeReport:
+	"""Progress of :py:func:`purge_messages`."""
+	__slots__ = ('total', 'read', 'written', 'deleted', 'skipped', 'failed', 'started')
+
+	def __init__(self, total: int) -> None:
+		#: Messages on the modem when the purge started
+		self.total = total
+		self.read = 0
+		self.written = 0
+		self.deleted = 0
+		#: Messages left on the modem for their state
+		self.skipped = 0
+		#: Messages which could not be read or deleted, most likely deleted meanwhile
+		self.failed = 0
+		self.started = monotonic()
+
+	@property
+	def elapsed(self) -> float:
+		return monotonic() - self.started
+
+	@property
+	def throughput(self) -> float:
+		"""Messages deleted per second, or read per second when they are not deleted."""
+		elapsed = self.elapsed
+		return (self.deleted or self.read) / elapsed if elapsed > 0 else 0.0
+
+	def __repr__(self) -> str:
+		return (
+			f'{type(self).__name__}(total={self.total}, read={self.read}, written={self.written}, deleted={self.deleted}, '
+			f'skipped={self.skipped}, failed={self.failed}, throughput={self.throughput:.1f})'
+		)
+
+
+async def purge_messages(
+	messaging: MMModemMessaging,
+	sink: Optional[Any] = None,
+	delete: bool = True,
+	limit: int = 8,
+	chunk: int = 64,
+	states: Collection[int] = PURGED_STATES,
+	progress: Optional[Callable[[PurgeReport], Any]] = None,
+) -> PurgeReport:
+	"""
+	Exports the messages of a modem and deletes them, a chunk at a time.
+
+	The messages of a chunk are read with concurrent GetAll calls, written to the sink,
+	then deleted with concurrent Delete calls, so that no message is deleted before it is stored.
+
+	:param sink: Object whose ``write(messages)`` method stores a list of :py:class:`SmsSnapshot` durably, \
+		for example :py:class:`JsonLinesSink` or :py:class:`SqliteSink`. It is called in the default executor of the loop, \
+		one chunk at a time, so that the loop is not blocked meanwhile.
+	:param delete: Delete the exported messages, or only export them. ValueError is raised if set without a sink.
+	:param limit: Number of D-Bus calls in flight at most.
+	:param chunk: Number of messages written to the sink at once.
+	:param states: :py:class:`MMSmsState` values of the exported messages. \
+		Messages still being received or sent are left on the modem by default.
+	:param progress: Called with the report after each chunk.
+	"""
+	if delete and sink is None:
+		raise ValueError('Messages are only deleted once exported, pass a sink or delete=False')
+	semaphore = Semaphore(limit)
+
+	async def limited(call: Awaitable[T]) -> T:
+		async with semaphore:
+			return await call
+
+	async def read(path: str) -> SmsSnapshot:
+		return await SmsSnapshot.from_proxy(await messaging.get_sms(path))
+
+	async def remove(path: str) -> None:
+		await messaging.delete_sms(await messaging.get_sms(path))
+
+	paths = await messaging.messages
+	report = PurgeReport(len(paths))
+	for start in range(0, len(paths), chunk):
+		selected: List[SmsSnapshot] = []
+		for result in await gather(*(limited(read(path)) for path in paths[start:start + chunk]), return_exceptions=True):
+			if isinstance(result, BaseException):
+				report.failed += 1
+			elif result.state not in states:
+				report.skipped += 1
+			else:
+				selected.append(result)
+		report.read += len(selected)
+		if sink is not None and selected:
+			await get_running_loop().run_in_executor(None, sink.write, selected)
+			report.written += len(selected)
+		if delete:
+			results: List[Optional[BaseException]] = await gather(*(limited(remove(sms.object_path)) for sms in selected), return_exceptions=True)
+			failed = sum(1 for result in results if isinstance(result, BaseException))
+			report.failed += failed
+			report.deleted += len(selected) - failed
+		if progress is not None:
+			progress(report)
+	return report
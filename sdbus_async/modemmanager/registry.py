@@ -0,0 +1,280 @@
+from asyncio import Future, Queue, Task, gather, get_running_loop
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from sdbus.sd_bus_internals import SdBus, SdBusMessage, SdBusSlot
+
+from .constant import forget_constants
+from .index import SIM_INDEX_KEYS
+from .matches import match_rule
+from .objects import MODEM_INTERFACE_NAME, MODEM_MANAGER_SERVICE_NAME, SIM_INTERFACE_NAME, MMModem, MMModems
+from .properties import PROPERTIES_INTERFACE_NAME, parse_interfaces, parse_properties
+
+OBJECT_MANAGER_INTERFACE_NAME = 'org.freedesktop.DBus.ObjectManager'
+
+
+class MMModemRegistry:
+	"""
+	Always-current set of modems, maintained from the ObjectManager InterfacesAdded and InterfacesRemoved signals.
+
+	Modems are hydrated with the properties carried by GetManagedObjects and by the signals,
+	see :py:attr:`MMModem.interfaces`, and indexed by their identifiers and those of their SIM card,
+	see :py:meth:`find`. Both are kept current from the PropertiesChanged signals, matched on the path of each modem
+	and SIM card, whose Modem and SIM interfaces are read again once matched so that no change is missed.
+
+	Usage::
+
+		async with MMModemRegistry() as registry:
+			modem = await registry.wait_added()
+	"""
+
+	def __init__(self, bus: Optional[SdBus] = None) -> None:
+		"""
+		:param bus: You probably want to set default bus to system bus \
+			or pass system bus directly.
+		"""
+		self.manager = MMModems(bus)
+		self._slots: List[SdBusSlot] = []
+		self._rules: List[str] = []
+		# Modem and SIM object paths to the slot and rule of their PropertiesChanged signals
+		self._watched: Dict[str, Tuple[SdBusSlot, str]] = {}
+		# Modem object paths to the path of their SIM card, and back
+		self._sims: Dict[str, str] = {}
+		self._sim_modems: Dict[str, str] = {}
+		self._added_waiters: List['Future[MMModem]'] = []
+		self._removed_waiters: List['Future[MMModem]'] = []
+		self._subscribers: List['Queue[Tuple[bool, MMModem]]'] = []
+		self._vanished: Optional[Set[str]] = None
+		self._tasks: Set['Task[None]'] = set()
+		self._started = False
+
+	async def start(self) -> None:
+		"""
+		Subscribes to the ObjectManager signals, then loads the modems already present and indexes them once their PropertiesChanged signals are matched.
+
+		Does nothing if the registry is already started.
+		"""
+		if self._started:
+			return
+		self._started = True
+		bus = self.manager._dbus.attached_bus
+		path = self.manager._dbus.object_path
+		self._vanished = set()
+		try:
+			for member, callback in (('InterfacesAdded', self._on_interfaces_added), ('InterfacesRemoved', self._on_interfaces_removed)):
+				await self._match(path, OBJECT_MANAGER_INTERFACE_NAME, member, callback)
+			objects = await self.manager.get_managed_objects()
+			for object_path, interfaces in objects.items():
+				# Removal signals can be dispatched before this coroutine resumes with the reply
+				if object_path not in self._vanished:
+					self._interfaces_added(object_path, interfaces)
+		finally:
+			self._vanished = None
+		if self._tasks:
+			await gather(*self._tasks, return_exceptions=True)
+
+	def stop(self) -> None:
+		"""
+		Unsubscribes from the signals. The current set of modems and the index are kept.
+
+		Pending :py:meth:`wait_added` and :py:meth:`wait_removed` calls raise :py:class:`asyncio.CancelledError`.
+		"""
+		self._started = False
+		for slot in self._slots:
+			slot.close()
+		self._slots.clear()
+		self._rules.clear()
+		for slot, _ in self._watched.values():
+			slot.close()
+		self._watched.clear()
+		self._sims.clear()
+		self._sim_modems.clear()
+		for task in self._tasks:
+			task.cancel()
+		for future in self._added_waiters + self._removed_waiters:
+			future.cancel()
+		self._added_waiters.clear()
+		self._removed_waiters.clear()
+
+	@property
+	def match_rules(self) -> List[str]:
+		"""The D-Bus match rules currently installed by the registry."""
+		return self._rules + [rule for _, rule in self._watched.values()]
+
+	async def __aenter__(self) -> 'MMModemRegistry':
+		await self.start()
+		return self
+
+	async def __aexit__(self, *args: Any) -> None:
+		self.stop()
+
+	@property
+	def modems(self) -> Dict[str, MMModem]:
+		"""The current modems, keyed by object path. Shared with :py:attr:`MMModems.modems_by_path` of :py:attr:`manager`."""
+		return self.manager.modems_by_path
+
+	def __contains__(self, object_path: str) -> bool:
+		return object_path in self.modems
+
+	def __iter__(self) -> Iterator[MMModem]:
+		return iter(self.modems.values())
+
+	def __len__(self) -> int:
+		return len(self.modems)
+
+	def get(self, object_path: str) -> Optional[MMModem]:
+		return self.modems.get(object_path)
+
+	def find(self, key: str, value: Any) -> Optional[MMModem]:
+		"""
+		Returns the modem with the given identifier, for example ``find('sim_identifier', iccid)``.
+
+		:param key: One of ``equipment_identifier``, ``device_identifier``, ``primary_port``, ``sim_identifier`` or ``imsi``.
+		"""
+		return self.manager.find(key, value)
+
+	async def wait_added(self) -> MMModem:
+		"""Waits for the next modem to appear."""
+		future: 'Future[MMModem]' = get_running_loop().create_future()
+		self._added_waiters.append(future)
+		return await future
+
+	async def wait_removed(self) -> MMModem:
+		"""Waits for the next modem to vanish."""
+		future: 'Future[MMModem]' = get_running_loop().create_future()
+		self._removed_waiters.append(future)
+		return await future
+
+	async def changes(self) -> AsyncIterator[Tuple[bool, MMModem]]:
+		"""
+		Yields ``(True, modem)`` when a modem appears and ``(False, modem)`` when it vanishes.
+
+		Unlike repeated :py:meth:`wait_added` calls no change is missed between two iterations.
+		"""
+		queue: 'Queue[Tuple[bool, MMModem]]' = Queue()
+		self._subscribers.append(queue)
+		try:
+			while True:
+				yield await queue.get()
+		finally:
+			self._subscribers.remove(queue)
+
+	async def _match(self, path: Optional[str], interface: str, member: str, callback: Callable[[SdBusMessage], None]) -> None:
+		self._slots.append(await self.manager._dbus.attached_bus.match_signal_async(MODEM_MANAGER_SERVICE_NAME, path, interface, member, callback))
+		self._rules.append(match_rule(MODEM_MANAGER_SERVICE_NAME, path, interface, member))
+
+	def _on_interfaces_added(self, message: SdBusMessage) -> None:
+		object_path, interfaces = message.get_contents()
+		self._interfaces_added(object_path, interfaces)
+
+	def _on_interfaces_removed(self, message: SdBusMessage) -> None:
+		object_path, interfaces = message.get_contents()
+		self._interfaces_removed(object_path, interfaces)
+
+	def _on_properties_changed(self, message: SdBusMessage) -> None:
+		interface, changed, invalidated = message.get_contents()
+		if interface == MODEM_INTERFACE_NAME:
+			modem = self.modems.get(message.path)
+			if modem is None:
+				return
+			properties = parse_properties(interface, changed)
+			modem.interfaces.setdefault(interface, {}).update(properties)
+			if 'sim_object_path' in properties:
+				self._index(modem)
+			else:
+				self.manager.index.update(message.path, properties)
+		elif interface == SIM_INTERFACE_NAME:
+			modem_path = self._sim_modems.get(message.path)
+			if modem_path is not None:
+				properties = parse_properties(interface, changed)
+				self.manager.index.update(modem_path, {key: properties[key] for key in SIM_INDEX_KEYS if key in properties})
+
+	def _index(self, modem: MMModem) -> None:
+		task = get_running_loop().create_task(self._follow(modem))
+		self._tasks.add(task)
+		task.add_done_callback(self._index_done)
+
+	async def _follow(self, modem: MMModem) -> None:
+		"""Matches the PropertiesChanged signals of a modem and of its SIM card, then reads and indexes them."""
+		path = modem._dbus.object_path
+		await self._watch(path)
+		# Signals received before the reply were emitted before the properties were read
+		properties = modem.interfaces[MODEM_INTERFACE_NAME] = parse_properties(MODEM_INTERFACE_NAME, await modem._properties_get_all(MODEM_INTERFACE_NAME))
+		sim_path = properties.get('sim_object_path', '/')
+		old = self._forget_sim(path)
+		if old is not None and old != sim_path:
+			self._unwatch(old)
+		if sim_path != '/' and path in self.modems:
+			self._sims[path] = sim_path
+			self._sim_modems[sim_path] = path
+			await self._watch(sim_path)
+		await self.manager.index_modem(modem)
+
+	async def _watch(self, path: str) -> None:
+		if path in self._watched:
+			return
+		slot = await self.manager._dbus.attached_bus.match_signal_async(MODEM_MANAGER_SERVICE_NAME, path, PROPERTIES_INTERFACE_NAME, 'PropertiesChanged', self._on_properties_changed)
+		# The modem can vanish, or its SIM card change, while the rule is being added
+		if path in self._watched or (path not in self.modems and path not in self._sim_modems):
+			slot.close()
+			return
+		self._watched[path] = slot, match_rule(MODEM_MANAGER_SERVICE_NAME, path, PROPERTIES_INTERFACE_NAME, 'PropertiesChanged')
+
+	def _forget_sim(self, modem_path: str) -> Optional[str]:
+		sim_path = self._sims.pop(modem_path, None)
+		if sim_path is not None:
+			self._sim_modems.pop(sim_path, None)
+		return sim_path
+
+	def _unwatch(self, path: str) -> None:
+		entry = self._watched.pop(path, None)
+		if entry is not None:
+			entry[0].close()
+
+	def _index_done(self, task: 'Task[None]') -> None:
+		self._tasks.discard(task)
+		# The modem or its SIM card can vanish while being read, the removal signal takes care of the index
+		if not task.cancelled():
+			task.exception()
+
+	def _interfaces_added(self, object_path: str, interfaces: Dict[str, Dict[str, Tuple[str, Any]]]) -> None:
+		modem = self.modems.get(object_path)
+		if modem is not None:
+			if MODEM_INTERFACE_NAME in interfaces:
+				# The path was reused without the removal of the former modem being received
+				forget_constants(modem)
+			modem.interfaces.update(parse_interfaces(interfaces))
+			return
+		if MODEM_INTERFACE_NAME not in interfaces:
+			return
+		modem = MMModem(object_path=object_path, bus=self.manager._dbus.attached_bus, interfaces=parse_interfaces(interfaces))
+		self.modems[object_path] = modem
+		self._index(modem)
+		self._notify(True, modem, self._added_waiters)
+
+	def _interfaces_removed(self, object_path: str, interfaces: List[str]) -> None:
+		if self._vanished is not None and MODEM_INTERFACE_NAME in interfaces:
+			self._vanished.add(object_path)
+		modem = self.modems.get(object_path)
+		if modem is None:
+			return
+		if MODEM_INTERFACE_NAME not in interfaces:
+			modem.remove_interfaces(interfaces)
+			return
+		del self.modems[object_path]
+		# The path may be reused by another modem
+		modem.remove_interfaces(interfaces)
+		forget_constants(modem)
+		self.manager.index.discard(object_path)
+		self._unwatch(object_path)
+		sim_path = self._forget_sim(object_path)
+		if sim_path is not None:
+			self._unwatch(sim_path)
+		self._notify(False, modem, self._removed_waiters)
+
+	def _notify(self, added: bool, modem: MMModem, waiters: List['Future[MMModem]']) -> None:
+		for future in waiters:
+			if not future.done():
+				future.set_result(modem)
+		waiters.clear()
+		for queue in self._subscribers:
+			queue.put_nowait((added, modem))
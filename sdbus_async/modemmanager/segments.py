@@ -0,0 +1,153 @@
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Callable, Dict, List, NamedTuple, Tuple
+
+# GSM 03.38 default alphabet by septet value, the escape to the extension table at 0x1B left out
+GSM7_BASIC = (
+	'@£$¥èéùìòÇ\nØø\rÅå'
+	'Δ_ΦΓΛΩΠΨΣΘΞ\x00ÆæßÉ'
+	' !"#¤%&\'()*+,-./'
+	'0123456789:;<=>?'
+	'¡ABCDEFGHIJKLMNO'
+	'PQRSTUVWXYZÄÖÑÜ§'
+	'¿abcdefghijklmno'
+	'pqrstuvwxyzäöñüà'
+)
+# GSM 03.38 extension table, each character is sent as the escape followed by its septet value
+GSM7_EXTENSION = {
+	'\f': 0x0A,
+	'^': 0x14,
+	'{': 0x28,
+	'}': 0x29,
+	'\\': 0x2F,
+	'[': 0x3C,
+	'~': 0x3D,
+	']': 0x3E,
+	'|': 0x40,
+	'€': 0x65,
+}
+GSM7_ESCAPE = 0x1B
+
+GSM7 = 'gsm7'
+UCS2 = 'ucs2'
+
+# Units of a single message, and of each part of a concatenated message which carries a 6 octet header
+_SINGLE = {GSM7: 160, UCS2: 70}
+_PART = {GSM7: 153, UCS2: 67}
+
+_CODES: Dict[str, bytes] = {c: bytes((i, )) for i, c in enumerate(GSM7_BASIC) if i != GSM7_ESCAPE}
+_CODES.update((c, bytes((GSM7_ESCAPE, code))) for c, code in GSM7_EXTENSION.items())
+_NOT_GSM7 = re.compile('[^' + ''.join(re.escape(c) for c in _CODES) + ']')
+
+# Characters without a GSM 7 bit equivalent by unicode decomposition
+TRANSLITERATIONS = {
+	'‘': "'", '’': "'", '‚': "'", '‛': "'", '′': "'", '`': "'", '´': "'",
+	'“': '"', '”': '"', '„': '"', '‟': '"', '″': '"', '«': '"', '»': '"',
+	'‐': '-', '‑': '-', '‒': '-', '–': '-', '—': '-', '―': '-', '−': '-',
+	'…': '...', '•': '*', '·': '.',
+	'\u00a0': ' ', '\u2002': ' ', '\u2003': ' ', '\u2007': ' ', '\u2009': ' ', '\u200a': ' ', '\u202f': ' ', '\t': ' ',
+	'\u200b': '', '\u200c': '', '\u200d': '', '\ufeff': '',
+	'ç': 'Ç', 'œ': 'oe', 'Œ': 'OE', 'ł': 'l', 'Ł': 'L', 'đ': 'd', 'Đ': 'D', 'ð': 'd', 'þ': 'th', 'Þ': 'Th',
+	'¢': 'c', '©': '(c)', '®': '(R)', '™': 'TM', '×': 'x', '÷': '/',
+}
+
+
+class SmsPlan(NamedTuple):
+	"""The parts ModemManager splits a text message into."""
+	#: :py:data:`GSM7` or :py:data:`UCS2`
+	encoding: str
+	#: Text of each part
+	segments: Tuple[str, ...]
+	#: Septets of each part in GSM 7 bit, UTF-16 code units in UCS-2
+	units: Tuple[int, ...]
+
+	@property
+	def count(self) -> int:
+		"""Number of messages sent."""
+		return len(self.segments)
+
+	@property
+	def text(self) -> str:
+		"""The text to send, transliterated if the plan was made with ``transliterate``."""
+		return ''.join(self.segments)
+
+	@property
+	def remaining(self) -> int:
+		"""Units left in the last part before another one is needed."""
+		return (_SINGLE if self.count == 1 else _PART)[self.encoding] - self.units[-1]
+
+
+def is_gsm7(text: str) -> bool:
+	"""Whether the text can be sent in the GSM 7 bit alphabet."""
+	return _NOT_GSM7.search(text) is None
+
+
+def gsm7_septets(text: str) -> int:
+	"""Returns the septets of a text of the GSM 7 bit alphabet, two for the characters of the extension table."""
+	return len(text) + sum(text.count(c) for c in GSM7_EXTENSION)
+
+
+def encode_gsm7(text: str) -> bytes:
+	"""Returns the septets of a text, one per byte and not packed. Raises ValueError for characters outside the alphabet."""
+	try:
+		return b''.join(_CODES[c] for c in text)
+	except KeyError as e:
+		raise ValueError(f'{e.args[0]!r} is not in the GSM 7 bit alphabet') from None
+
+
+@lru_cache(maxsize=4096)
+def _transliterate(c: str) -> str:
+	if c in _CODES:
+		return c
+	if c in TRANSLITERATIONS:
+		return TRANSLITERATIONS[c]
+	# Letters with diacritics outside the alphabet lose them, others are kept and sent in UCS-2
+	base = ''.join(d for d in unicodedata.normalize('NFKD', c) if not unicodedata.combining(d))
+	return base if base and is_gsm7(base) else c
+
+
+def transliterate_gsm7(text: str) -> str:
+	"""Replaces the characters outside the GSM 7 bit alphabet by their closest equivalents, when there is one."""
+	if is_gsm7(text):
+		return text
+	return ''.join(_transliterate(c) for c in text)
+
+
+def _split(text: str, limit: int, cost: Callable[[str], int]) -> Tuple[Tuple[str, ...], Tuple[int, ...]]:
+	"""Splits a text in parts of at most ``limit`` units, without splitting escaped characters or surrogate pairs."""
+	segments: List[str] = []
+	units: List[int] = []
+	start = used = 0
+	for i, c in enumerate(text):
+		n = cost(c)
+		if used + n > limit:
+			segments.append(text[start:i])
+			units.append(used)
+			start, used = i, 0
+		used += n
+	segments.append(text[start:])
+	units.append(used)
+	return tuple(segments), tuple(units)
+
+
+def plan_sms(text: str, transliterate: bool = False) -> SmsPlan:
+	"""
+	Computes the encoding and the parts of a text message, as ModemManager sends it:
+	in the GSM 7 bit alphabet when every character is in it, in UCS-2 otherwise.
+
+	:param transliterate: Replace the characters outside the GSM 7 bit alphabet first, see :py:func:`transliterate_gsm7`.
+	"""
+	if transliterate:
+		text = transliterate_gsm7(text)
+	if is_gsm7(text):
+		encoding, units = GSM7, gsm7_septets(text)
+	else:
+		encoding, units = UCS2, len(text.encode('utf-16-le')) // 2
+	if units <= _SINGLE[encoding]:
+		return SmsPlan(encoding, (text, ), (units, ))
+	if encoding == GSM7:
+		segments, part_units = _split(text, _PART[GSM7], lambda c: 2 if c in GSM7_EXTENSION else 1)
+	else:
+		segments, part_units = _split(text, _PART[UCS2], lambda c: 2 if c > '\uffff' else 1)
+	return SmsPlan(encoding, segments, part_units)
@@ -0,0 +1,286 @@
+from asyncio import CancelledError, Future, Queue, Task, gather, get_running_loop, sleep
+from time import monotonic
+from typing import Any, Awaitable, Callable, List, Optional, Set, Tuple, TypeVar
+
+from sdbus.exceptions import DbusLimitsExceededError, DbusNoReplyError, DbusTimeoutError, SdBusUnmappedMessageError
+
+from .delivery import MMDeliveryIndex
+from .enums import MMSmsState
+from .objects import MMModemMessaging, MMSms
+from .segments import transliterate_gsm7
+
+T = TypeVar('T')
+
+# Errors of a modem busy with another command, which did not carry out the call
+TRANSIENT_ERROR_NAMES = frozenset((
+	'org.freedesktop.ModemManager1.Error.Core.Retry',
+	'org.freedesktop.ModemManager1.Error.Core.InProgress',
+))
+# Errors of a modem slow to answer, which may have carried out the call
+UNANSWERED_ERROR_NAMES = frozenset(('org.freedesktop.ModemManager1.Error.Serial.ResponseTimeout', ))
+
+
+def _error_name(error: BaseException) -> Optional[str]:
+	return error.args[0] if isinstance(error, SdBusUnmappedMessageError) and error.args else None
+
+
+def is_transient(error: BaseException) -> bool:
+	"""Whether a failed D-Bus call is worth retrying as is: the bus or the modem was busy and the call was not carried out."""
+	return isinstance(error, DbusLimitsExceededError) or _error_name(error) in TRANSIENT_ERROR_NAMES
+
+
+def is_unanswered(error: BaseException) -> bool:
+	"""Whether a D-Bus call failed for want of an answer: no reply, timeout, or a modem timeout. The call may have been carried out."""
+	return isinstance(error, (DbusNoReplyError, DbusTimeoutError)) or _error_name(error) in UNANSWERED_ERROR_NAMES
+
+
+class MMSmsSender:
+	"""
+	Sends the messages of a modem from a queue, with at most ``limit`` messages created or sent at once.
+
+	Calls failing with a transient error, see :py:func:`is_transient`, are retried with an exponential backoff.
+	Calls failing for want of an answer, see :py:func:`is_unanswered`, may have been carried out by the modem:
+	the message is sent again only if its state shows it was not, and a message created by a create call
+	without an answer is found in the messages of the modem and sent, so that none is sent twice or left behind.
+	It is told by its number, text and stored state from the messages the sender is not sending,
+	a message of the same number and text left stored by the application could be mistaken for it.
+	Each submitted message has a future resolving with its ``message_reference``, or with the error of the last attempt.
+	Leaving the ``async with`` block waits for the queued messages to be sent.
+
+	Usage::
+
+		async with MMSmsSender(modem.messaging) as sender:
+			futures = [await sender.submit(number, 'Maintenance at 2 am') for number in numbers]
+		references = [future.result() for future in futures]
+	"""
+
+	def __init__(
+		self,
+		messaging: MMModemMessaging,
+		limit: int = 4,
+		maxsize: int = 0,
+		retries: int = 3,
+		backoff: float = 0.5,
+		max_backoff: float = 30.0,
+		delete: bool = True,
+		index: Optional[MMDeliveryIndex] = None,
+		transliterate: bool = False,
+	) -> None:
+		"""
+		:param messaging: Messaging interface of the modem.
+		:param limit: Number of messages in flight at most.
+		:param maxsize: Number of queued messages at most, :py:meth:`submit` waits for room beyond. Unbounded if 0.
+		:param retries: Retries of a call failing with a transient error, or for want of an answer when it was not carried out.
+		:param backoff: Seconds before the first retry, doubled on each following one up to ``max_backoff``.
+		:param delete: Delete each message from the modem once sent, or once it failed to be sent.
+		:param index: Index the sent messages are added to, with a status report requested for each.
+		:param transliterate: Replace the characters of texts outside the GSM 7 bit alphabet by their closest equivalents, \
+			see :py:func:`transliterate_gsm7`, so that fewer parts are sent.
+		"""
+		self.messaging = messaging
+		self.limit = limit
+		self.retries = retries
+		self.backoff = backoff
+		self.max_backoff = max_backoff
+		self.delete = delete
+		self.index = index
+		self.transliterate = transliterate
+		#: Messages sent, failed to be sent, and retried calls
+		self.sent = 0
+		self.failed = 0
+		self.retried = 0
+		#: Messages which could not be deleted after sending
+		self.undeleted = 0
+		self._queue: 'Queue[Tuple[str, Optional[str], Optional[bytes], Future[int]]]' = Queue(maxsize)
+		self._workers: List['Task[None]'] = []
+		self._in_flight = 0
+		self._started: Optional[float] = None
+		# Messages created, or found after a create call without an answer, until sent and deleted
+		self._sending: Set[MMSms] = set()
+
+	def start(self) -> None:
+		"""Starts sending the queued messages."""
+		if not self._workers:
+			self._started = monotonic()
+			self._workers = [get_running_loop().create_task(self._work()) for _ in range(self.limit)]
+
+	async def stop(self) -> None:
+		"""Stops sending. Messages still queued are cancelled, messages in flight may have been sent."""
+		for worker in self._workers:
+			worker.cancel()
+		await gather(*self._workers, return_exceptions=True)
+		self._workers.clear()
+		while not self._queue.empty():
+			self._queue.get_nowait()[3].cancel()
+			self._queue.task_done()
+
+	async def submit(self, number: str, text: Optional[str] = None, data: Optional[bytes] = None) -> 'Future[int]':
+		"""
+		Queues a message, waiting for room in the queue if it is bounded.
+
+		:return: Future of the ``message_reference`` of the message.
+		"""
+		future: 'Future[int]' = get_running_loop().create_future()
+		await self._queue.put((number, text, data, future))
+		return future
+
+	async def send(self, number: str, text: Optional[str] = None, data: Optional[bytes] = None) -> int:
+		"""
+		Queues a message and waits for it to be sent, returning its ``message_reference``.
+
+		:raises RuntimeError: The sender is not started, the message would never be sent.
+		"""
+		if not self._workers:
+			raise RuntimeError('The sender is not started, use start() or async with')
+		return await (await self.submit(number, text, data))
+
+	async def join(self) -> None:
+		"""Waits for all the queued messages to be sent or to fail."""
+		await self._queue.join()
+
+	@property
+	def queued(self) -> int:
+		"""Number of messages waiting for a free slot."""
+		return self._queue.qsize()
+
+	@property
+	def in_flight(self) -> int:
+		"""Number of messages being created, sent or retried."""
+		return self._in_flight
+
+	@property
+	def throughput(self) -> float:
+		"""Messages sent per second since :py:meth:`start`."""
+		if self._started is None:
+			return 0.0
+		elapsed = monotonic() - self._started
+		return self.sent / elapsed if elapsed > 0 else 0.0
+
+	async def __aenter__(self) -> 'MMSmsSender':
+		self.start()
+		return self
+
+	async def __aexit__(self, exc_type: Optional[type], *args: Any) -> None:
+		try:
+			if exc_type is None:
+				await self.join()
+		finally:
+			await self.stop()
+
+	async def _work(self) -> None:
+		while True:
+			number, text, data, future = await self._queue.get()
+			self._in_flight += 1
+			try:
+				if not future.cancelled():
+					await self._send(number, text, data, future)
+			finally:
+				self._in_flight -= 1
+				self._queue.task_done()
+
+	async def _send(self, number: str, text: Optional[str], data: Optional[bytes], future: 'Future[int]') -> None:
+		sms: Optional[MMSms] = None
+		if text is not None and self.transliterate:
+			text = transliterate_gsm7(text)
+		try:
+			sms = await self._create(number, text, data)
+			await self._send_sms(sms)
+			reference = await sms.message_reference
+		except CancelledError:
+			future.cancel()
+			raise
+		except Exception as error:
+			self.failed += 1
+			if not future.done():
+				future.set_exception(error)
+		else:
+			self.sent += 1
+			if self.index is not None:
+				self.index.add(self.messaging._dbus.object_path, number, reference, None if self.delete else sms._dbus.object_path)
+			if not future.done():
+				future.set_result(reference)
+		if sms is not None:
+			if self.delete:
+				try:
+					await self._retry(self.messaging.delete_sms, sms)
+				except Exception:
+					self.undeleted += 1
+			self._sending.discard(sms)
+
+	async def _create(self, number: str, text: Optional[str], data: Optional[bytes]) -> MMSms:
+		attempt = 0
+		while True:
+			try:
+				sms = await self.messaging.create_sms(number, text, data, self.index is not None)
+			except Exception as error:
+				if is_unanswered(error):
+					found = await self._created(number, text)
+					if found is not None:
+						self._sending.add(found)
+						return found
+				elif not is_transient(error):
+					raise
+				if attempt >= self.retries:
+					raise
+			else:
+				self._sending.add(sms)
+				return sms
+			await self._backoff(attempt)
+			attempt += 1
+
+	async def _created(self, number: str, text: Optional[str]) -> Optional[MMSms]:
+		"""Returns a stored message of ``number`` and ``text`` the sender is not sending, ``None`` if there is none."""
+		for path in await self.messaging.messages:
+			sms = await self.messaging.get_sms(path)
+			if sms in self._sending:
+				continue
+			if await sms.state == MMSmsState.MM_SMS_STATE_STORED and await sms.number == number and (text is None or await sms.text == text):
+				return sms
+		return None
+
+	async def _send_sms(self, sms: MMSms) -> None:
+		attempt = 0
+		while True:
+			try:
+				return await sms.send()
+			except Exception as error:
+				if is_unanswered(error):
+					state = await self._settled_state(sms)
+					if state == MMSmsState.MM_SMS_STATE_SENT:
+						return
+					if state == MMSmsState.MM_SMS_STATE_SENDING:
+						# Still being sent, sending it again would send it twice
+						raise
+				elif not is_transient(error):
+					raise
+				if attempt >= self.retries:
+					raise
+			await self._backoff(attempt)
+			attempt += 1
+
+	async def _settled_state(self, sms: MMSms) -> int:
+		"""Returns the state of a message, waiting with the backoff of the retries while it is being sent."""
+		for attempt in range(self.retries):
+			state = await sms.state
+			if state != MMSmsState.MM_SMS_STATE_SENDING:
+				return state
+			await sleep(self._delay(attempt))
+		return await sms.state
+
+	async def _retry(self, method: Callable[..., Awaitable[T]], *args: Any) -> T:
+		attempt = 0
+		while True:
+			try:
+				return await method(*args)
+			except Exception as error:
+				if attempt >= self.retries or not is_transient(error):
+					raise
+			await self._backoff(attempt)
+			attempt += 1
+
+	def _delay(self, attempt: int) -> float:
+		return min(self.backoff * 2 ** attempt, self.max_backoff)
+
+	async def _backoff(self, attempt: int) -> None:
+		await sleep(self._delay(attempt))
+		self.retried += 1
@@ -0,0 +1,54 @@
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+_NESTED = frozenset(('v', 'av', 'a{sv}', 'aa{sv}'))
+
+
+def unwrap_variant(signature: str, value: Any) -> Any:
+	"""
+	Returns the plain python value of a ``(signature, value)`` variant.
+
+	Variants nested in ``v``, ``av``, ``a{sv}`` and ``aa{sv}`` values are unwrapped as well, iteratively,
+	and values of other signatures are returned as they are.
+	"""
+	root: List[Any] = [None]
+	stack: List[Tuple[Any, Any, str, Any]] = [(root, 0, signature, value)]
+	while stack:
+		target, key, signature, value = stack.pop()
+		while signature == 'v':
+			signature, value = value
+		if signature == 'a{sv}':
+			plain: Any = {}
+			items: Any = value.items()
+		elif signature == 'av':
+			plain = [None] * len(value)
+			items = enumerate(value)
+		elif signature == 'aa{sv}':
+			plain = [None] * len(value)
+			stack.extend((plain, index, 'a{sv}', item) for index, item in enumerate(value))
+			target[key] = plain
+			continue
+		else:
+			target[key] = value
+			continue
+		target[key] = plain
+		for item_key, (item_signature, item_value) in items:
+			if item_signature in _NESTED:
+				stack.append((plain, item_key, item_signature, item_value))
+			else:
+				plain[item_key] = item_value
+	return root[0]
+
+
+def unwrap_variants(properties: Dict[str, Tuple[str, Any]]) -> Dict[str, Any]:
+	"""Returns an ``a{sv}`` dictionary with plain python values instead of variants, see :py:func:`unwrap_variant`."""
+	return unwrap_variant('a{sv}', properties)
+
+
+def plain_values(name: str, signature: str = 'a{sv}') -> Callable[[Any], Awaitable[Any]]:
+	"""Coroutine method returning the D-Bus property ``name`` of the object with its variants unwrapped."""
+
+	async def get_values(self: Any) -> Any:
+		return unwrap_variant(signature, await getattr(self, name))
+
+	get_values.__doc__ = f'``{name}`` with plain values instead of variants.'
+	return get_values
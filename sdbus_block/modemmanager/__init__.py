@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from .enums import MMModemState, MMModemMode, MMModemPowerState, MMCallDirection, MMCallState, MMCallStateReason, MMModemLocationSource, MMModemLocationAssistanceDataType
+from .batch import MMBatch, MMBatchReply
+from .dispatcher import MMSignalDispatcher
+from .enums import MMModemState, MMModemMode, MMModemPowerState, MMSimType, MMSimEsimStatus, MMSimRemovability, MMCallDirection, MMCallState, MMCallStateReason, MMModemLocationSource, MMModemLocationAssistanceDataType, MMModem3gppRegistrationState, MMModemBand, MMSmsState, MMSmsPduType, MMSmsDeliveryState, MMBearerIpFamily, enum_name, flag_members, flag_names
 from .interfaces_bearer import MMBearerInterface
 from .interfaces_call import MMCallInterface
 from .interfaces_modem import MMModemInterface, MMModemMessagingInterface, MMModemSignalInterface, MMModemsInterface, MMModemVoiceInterface
@@ -10,19 +12,44 @@ from .interfaces_sms import MMSmsInterface
 from .interfaces_3gpp import MMModem3gppInterface
 from .interfaces_simple import MMModemSimpleInterface
 from .interfaces_time import MMModemTimeInterface
+from .index import MMModemIndex
+from .matches import match_rule
+from .loops import bus_loop, close_bus_loop
+from .properties import parse_interfaces, parse_properties
 
-from .objects import MM, MMBearer, MMCall, MMModem, MMModems, MMModemMessaging, MMModemSignal, MMModemSimple, MMModemVoice, MMSim, MMSms, MMModemLocation, MMModem3gpp, MMModemTime
+from .objects import CallStateTransition, MM, MMBearer, MMCall, MMModem, MMModems, MMModemMessaging, MMModemSignal, MMModemSimple, MMModemVoice, MMSim, MMSms, MMModemLocation, MMModem3gpp, MMModemTime
+from .segments import GSM7, UCS2, SmsPlan, encode_gsm7, gsm7_septets, is_gsm7, plan_sms, transliterate_gsm7
+from .signal_records import SIGNAL_RECORDS, CdmaSignal, EvdoSignal, GsmSignal, LteSignal, Nr5gSignal, SignalRecord, UmtsSignal
+from .snapshots import BearerSnapshot, CallSnapshot, ModemSnapshot, SimSnapshot, SmsSnapshot
+from .variants import unwrap_variant, unwrap_variants
 
 __all__ = (
+	# .batch
+	'MMBatch',
+	'MMBatchReply',
+	# .dispatcher
+	'MMSignalDispatcher',
 	# .enums
 	'MMModemState',
 	'MMModemMode',
 	'MMModemPowerState',
+	'MMSimType',
+	'MMSimEsimStatus',
+	'MMSimRemovability',
 	'MMCallDirection',
 	'MMCallState',
 	'MMCallStateReason',
 	'MMModemLocationSource',
 	'MMModemLocationAssistanceDataType',
+	'MMModem3gppRegistrationState',
+	'MMModemBand',
+	'MMSmsState',
+	'MMSmsPduType',
+	'MMSmsDeliveryState',
+	'MMBearerIpFamily',
+	'enum_name',
+	'flag_members',
+	'flag_names',
 	# .interfaces_bearer
 	'MMBearerInterface',
 	# .interfaces_call
@@ -44,7 +71,18 @@ __all__ = (
 	'MMModem3gppInterface',
 	# .MMModemTimeInterface
 	'MMModemTimeInterface',
+	# .index
+	'MMModemIndex',
+	# .matches
+	'match_rule',
+	# .loops
+	'bus_loop',
+	'close_bus_loop',
+	# .properties
+	'parse_interfaces',
+	'parse_properties',
 	# .objects
+	'CallStateTransition',
 	'MM',
 	'MMModems',
 	'MMModem',
@@ -59,4 +97,31 @@ __all__ = (
 	'MMModemLocation',
 	'MMModem3gpp',
 	'MMModemTime',
+	# .segments
+	'plan_sms',
+	'SmsPlan',
+	'GSM7',
+	'UCS2',
+	'is_gsm7',
+	'gsm7_septets',
+	'encode_gsm7',
+	'transliterate_gsm7',
+	# .signal_records
+	'SIGNAL_RECORDS',
+	'SignalRecord',
+	'CdmaSignal',
+	'EvdoSignal',
+	'GsmSignal',
+	'UmtsSignal',
+	'LteSignal',
+	'Nr5gSignal',
+	# .snapshots
+	'ModemSnapshot',
+	'SimSnapshot',
+	'BearerSnapshot',
+	'SmsSnapshot',
+	'CallSnapshot',
+	# .variants
+	'unwrap_variant',
+	'unwrap_variants',
 )
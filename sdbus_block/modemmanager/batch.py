@@ -0,0 +1,122 @@
+from asyncio import Future, gather
+from inspect import signature
+from typing import Any, List, Optional, Tuple
+
+from sdbus import DbusInterfaceCommon
+from sdbus.dbus_proxy_sync_method import DbusMethodSync
+from sdbus.dbus_proxy_sync_property import DbusPropertySync
+from sdbus.sd_bus_internals import SdBusMessage
+
+from .loops import bus_loop
+
+
+def _member(proxy: DbusInterfaceCommon, name: str) -> Any:
+	for cls in type(proxy).__mro__:
+		member = vars(cls).get(name)
+		if isinstance(member, (DbusPropertySync, DbusMethodSync)):
+			return member
+	raise AttributeError(f'{type(proxy).__name__} has no D-Bus property or method {name!r}')
+
+
+class MMBatchReply:
+	"""Reply to a call queued in a :py:class:`MMBatch`, available once the batch has been waited for."""
+	__slots__ = ('_future', '_is_property')
+
+	def __init__(self, is_property: bool) -> None:
+		self._future: Optional['Future[SdBusMessage]'] = None
+		self._is_property = is_property
+
+	def done(self) -> bool:
+		return self._future is not None
+
+	def result(self) -> Any:
+		"""Returns the property value or the method result, or raises the D-Bus error of the call."""
+		if self._future is None:
+			raise RuntimeError('The batch of this reply has not been waited for')
+		contents = self._future.result().get_contents()
+		return contents[1] if self._is_property else contents
+
+
+class MMBatch:
+	"""
+	Sends D-Bus calls back to back, without waiting for each reply, then waits for all the replies at once.
+
+	Calls are queued by :py:meth:`get` and :py:meth:`call` and sent by :py:meth:`wait`, or when leaving the ``with`` block.
+	The bus must not be used by an asyncio event loop of the application. The replies are dispatched by the private
+	loop of the bus, closed by :py:func:`close_bus_loop`.
+
+	Usage::
+
+		with modem.batch() as batch:
+			state = batch.get('state')
+			quality = batch.get('signal_quality')
+			sim_id = batch.get('sim_identifier', proxy=sim)
+		print(state.result(), quality.result(), sim_id.result())
+	"""
+
+	def __init__(self, proxy: DbusInterfaceCommon) -> None:
+		"""
+		:param proxy: Default proxy object of the calls. Proxies passed to :py:meth:`get` and :py:meth:`call` \
+			must be attached to the same bus.
+		"""
+		self.proxy = proxy
+		self._queued: List[Tuple[SdBusMessage, MMBatchReply]] = []
+
+	def get(self, name: str, proxy: Optional[DbusInterfaceCommon] = None) -> MMBatchReply:
+		"""
+		Queues the read of a property.
+
+		:param name: Python attribute name of the property, for example ``'signal_quality'``.
+		"""
+		proxy = proxy if proxy is not None else self.proxy
+		member = _member(proxy, name)
+		if not isinstance(member, DbusPropertySync):
+			raise TypeError(f'{name!r} is not a D-Bus property')
+		message = proxy._dbus.attached_bus.new_property_get_message(proxy._dbus.service_name, proxy._dbus.object_path, member.interface_name, member.property_name)
+		return self._queue(message, True)
+
+	def call(self, name: str, *args: Any, proxy: Optional[DbusInterfaceCommon] = None, **kwargs: Any) -> MMBatchReply:
+		"""
+		Queues a method call.
+
+		:param name: Python attribute name of the method, for example ``'list_bearers'``.
+		"""
+		proxy = proxy if proxy is not None else self.proxy
+		member = _member(proxy, name)
+		if not isinstance(member, DbusMethodSync):
+			raise TypeError(f'{name!r} is not a D-Bus method')
+		arguments = signature(member.original_method).bind(proxy, *args, **kwargs)
+		arguments.apply_defaults()
+		args = arguments.args[1:]
+		message = proxy._dbus.attached_bus.new_method_call_message(proxy._dbus.service_name, proxy._dbus.object_path, member.interface_name, member.method_name)
+		if args:
+			message.append_data(member.input_signature, *args)
+		return self._queue(message, False)
+
+	def wait(self) -> None:
+		"""Sends the queued calls and waits for all their replies. Errors are raised by :py:meth:`MMBatchReply.result`."""
+		queued, self._queued = self._queued, []
+		if not queued:
+			return
+		bus = self.proxy._dbus.attached_bus
+		loop = bus_loop(bus)
+
+		async def send() -> List['Future[SdBusMessage]']:
+			futures = [bus.call_async(message) for message, _ in queued]
+			await gather(*futures, return_exceptions=True)
+			return futures
+
+		for future, (_, reply) in zip(loop.run_until_complete(send()), queued):
+			reply._future = future
+
+	def _queue(self, message: SdBusMessage, is_property: bool) -> MMBatchReply:
+		reply = MMBatchReply(is_property)
+		self._queued.append((message, reply))
+		return reply
+
+	def __enter__(self) -> 'MMBatch':
+		return self
+
+	def __exit__(self, exc_type: Optional[type], *args: Any) -> None:
+		if exc_type is None:
+			self.wait()
@@ -0,0 +1,39 @@
+from typing import Any, Callable, Optional, TypeVar
+
+from sdbus import DbusPropertyConstFlag
+from sdbus.dbus_proxy_sync_property import DbusPropertySync
+
+T = TypeVar('T')
+
+
+class DbusConstantPropertySync(DbusPropertySync[T]):
+	"""D-Bus property that never changes for the lifetime of the object path, cached by each proxy object."""
+
+	def __get__(self, obj: Any, obj_class: Optional[type] = None) -> Any:
+		if obj is None:
+			return self
+		values = obj.__dict__.setdefault('_dbus_constants', {})
+		key = (self.interface_name, self.property_name)
+		try:
+			return values[key]
+		except KeyError:
+			value = values[key] = super().__get__(obj, obj_class)
+			return value
+
+
+def forget_constants(proxy: Any) -> None:
+	"""Drops the constant properties cached by a proxy object, once its object path is removed, as ModemManager reuses paths."""
+	proxy.__dict__.pop('_dbus_constants', None)
+
+
+def dbus_property_constant(
+	property_signature: str = '',
+	flags: int = 0,
+	property_name: Optional[str] = None,
+) -> Callable[[Callable[[Any], T]], DbusPropertySync[T]]:
+	"""Declares a property like :py:func:`sdbus.dbus_property`, flagged constant and read once per proxy object."""
+
+	def property_decorator(function: Callable[[Any], T]) -> DbusPropertySync[T]:
+		return DbusConstantPropertySync(property_name, property_signature, function, None, flags | DbusPropertyConstFlag)
+
+	return property_decorator
@@ -0,0 +1,180 @@
+from asyncio import sleep
+from collections import deque
+from selectors import EVENT_READ, DefaultSelector
+from typing import Any, Callable, Deque, List, Optional, Tuple
+
+from sdbus import DbusInterfaceCommon, get_default_bus
+from sdbus.sd_bus_internals import SdBus, SdBusMessage, SdBusSlot
+
+from .interfaces_call import MMCallInterface
+from .interfaces_modem import MMModemInterface, MMModemMessagingInterface, MMModemVoiceInterface
+from .loops import bus_loop
+from .matches import match_rule
+from .objects import MODEM_MANAGER_SERVICE_NAME
+from .properties import interface_name, parse_properties
+
+PROPERTIES_INTERFACE_NAME = 'org.freedesktop.DBus.Properties'
+
+
+class MMSignalDispatcher:
+	"""
+	Runs callbacks on the signals of ModemManager objects, without an asyncio event loop in the application.
+
+	Signals are read when :py:meth:`process` is called, which :py:meth:`run` and :py:meth:`run_once` do when
+	the bus file descriptor is readable. Applications with their own ``selectors`` or ``poll`` loop can register
+	:py:meth:`fileno` for reading and call :py:meth:`process` when it is ready, and after their own blocking calls on the bus,
+	which can read signals ahead of the dispatcher. Matches are installed and signals dispatched by the private loop of
+	the bus, closed by :py:func:`close_bus_loop`.
+
+	Usage::
+
+		with MMSignalDispatcher() as dispatcher:
+			dispatcher.on_state_changed(modem, lambda old, new, reason: print(old, new))
+			dispatcher.run()
+	"""
+
+	def __init__(self, bus: Optional[SdBus] = None) -> None:
+		"""
+		:param bus: You probably want to set default bus to system bus \
+			or pass system bus directly.
+		"""
+		self.bus = bus if bus is not None else get_default_bus()
+		self._matches: List[Tuple[SdBusSlot, str]] = []
+		# Callbacks run once the private loop of the bus returns, so that they can use the bus themselves
+		self._received: Deque[Tuple[Callable[[SdBusMessage], Any], SdBusMessage]] = deque()
+		self._running = False
+
+	def fileno(self) -> int:
+		"""File descriptor of the bus, to poll for reading."""
+		return self.bus.get_fd()
+
+	def add_match(self, object_path: Optional[str], interface: str, member: str, callback: Callable[[SdBusMessage], Any]) -> SdBusSlot:
+		"""
+		Runs ``callback`` with the message of each matching signal. Closing the returned slot removes the match.
+
+		:param object_path: Path of the object emitting the signal, any object if ``None``.
+		"""
+
+		async def match() -> SdBusSlot:
+			return await self.bus.match_signal_async(MODEM_MANAGER_SERVICE_NAME, object_path, interface, member, lambda message: self._received.append((callback, message)))
+
+		slot = bus_loop(self.bus).run_until_complete(match())
+		self._matches.append((slot, match_rule(MODEM_MANAGER_SERVICE_NAME, object_path, interface, member)))
+		return slot
+
+	def remove_match(self, slot: SdBusSlot) -> None:
+		"""Removes a match returned by :py:meth:`add_match` or an ``on_*`` method."""
+		slot.close()
+		self._matches = [(s, rule) for s, rule in self._matches if s is not slot]
+
+	def on_properties_changed(self, proxy: DbusInterfaceCommon, callback: Callable[[str, Any, List[str]], Any]) -> SdBusSlot:
+		"""Runs ``callback(interface, changed, invalidated)``, ``changed`` as returned by :py:func:`parse_properties`."""
+
+		def dispatch(message: SdBusMessage) -> None:
+			interface, changed, invalidated = message.get_contents()
+			callback(interface, parse_properties(interface, changed), invalidated)
+
+		return self.add_match(proxy._dbus.object_path, PROPERTIES_INTERFACE_NAME, 'PropertiesChanged', dispatch)
+
+	def on_state_changed(self, modem: DbusInterfaceCommon, callback: Callable[[int, int, int], Any]) -> SdBusSlot:
+		"""Runs ``callback(old, new, reason)`` when the state of the modem changes."""
+		return self._on(modem, MMModemInterface, 'StateChanged', callback)
+
+	def on_sms_added(self, modem: DbusInterfaceCommon, callback: Callable[[str, bool], Any]) -> SdBusSlot:
+		"""Runs ``callback(sms_path, received)`` when an SMS is received or created on the modem."""
+		return self._on(modem, MMModemMessagingInterface, 'Added', callback)
+
+	def on_sms_deleted(self, modem: DbusInterfaceCommon, callback: Callable[[str], Any]) -> SdBusSlot:
+		"""Runs ``callback(sms_path)`` when an SMS of the modem is deleted."""
+		return self._on(modem, MMModemMessagingInterface, 'Deleted', callback)
+
+	def on_call_added(self, modem: DbusInterfaceCommon, callback: Callable[[str], Any]) -> SdBusSlot:
+		"""Runs ``callback(call_path)`` when a call is received or created on the modem."""
+		return self._on(modem, MMModemVoiceInterface, 'CallAdded', callback)
+
+	def on_call_deleted(self, modem: DbusInterfaceCommon, callback: Callable[[str], Any]) -> SdBusSlot:
+		"""Runs ``callback(call_path)`` when a call of the modem is deleted."""
+		return self._on(modem, MMModemVoiceInterface, 'CallDeleted', callback)
+
+	def on_call_state_changed(self, call: DbusInterfaceCommon, callback: Callable[[int, int, int], Any]) -> SdBusSlot:
+		"""Runs ``callback(old, new, reason)`` when the state of the call changes."""
+		return self._on(call, MMCallInterface, 'StateChanged', callback)
+
+	def process(self) -> int:
+		"""
+		Reads the pending signals and runs their callbacks, until no signal is left.
+
+		Blocking calls of the callbacks read the signals arriving meanwhile ahead of the dispatcher, so the bus is
+		processed again after them: these signals are queued by sd-bus and the file descriptor is not readable for them.
+		An exception raised by a callback propagates, the callbacks of the following signals run on the next call.
+
+		:return: Number of callbacks run.
+		"""
+
+		async def process() -> None:
+			self.bus.process()
+			# Signal callbacks are scheduled on the loop by the bus
+			await sleep(0)
+
+		dispatched = 0
+		while True:
+			bus_loop(self.bus).run_until_complete(process())
+			if not self._received:
+				return dispatched
+			while self._received:
+				callback, message = self._received.popleft()
+				dispatched += 1
+				callback(message)
+
+	def run_once(self, timeout: Optional[float] = None) -> bool:
+		"""
+		Runs the callbacks of the pending signals, or waits for signals for up to ``timeout`` seconds, forever if ``None``,
+		and runs their callbacks.
+
+		:return: Whether callbacks ran or the bus was readable before the timeout.
+		"""
+		if self.process():
+			return True
+		with DefaultSelector() as selector:
+			selector.register(self.fileno(), EVENT_READ)
+			ready = bool(selector.select(timeout))
+		if ready:
+			self.process()
+		return ready
+
+	def run(self) -> None:
+		"""Runs callbacks until :py:meth:`stop` is called, typically by a callback."""
+		self._running = True
+		try:
+			self.process()
+			with DefaultSelector() as selector:
+				selector.register(self.fileno(), EVENT_READ)
+				while self._running:
+					selector.select()
+					self.process()
+		finally:
+			self._running = False
+
+	def stop(self) -> None:
+		"""Makes :py:meth:`run` return after the current callbacks."""
+		self._running = False
+
+	@property
+	def match_rules(self) -> List[str]:
+		"""The D-Bus match rules installed by the dispatcher, path-scoped unless added with no ``object_path``."""
+		return [rule for _, rule in self._matches]
+
+	def close(self) -> None:
+		"""Removes all matches of the dispatcher."""
+		for slot, _ in self._matches:
+			slot.close()
+		self._matches.clear()
+
+	def __enter__(self) -> 'MMSignalDispatcher':
+		return self
+
+	def __exit__(self, *args: Any) -> None:
+		self.close()
+
+	def _on(self, proxy: DbusInterfaceCommon, interface: type, member: str, callback: Callable[..., Any]) -> SdBusSlot:
+		return self.add_match(proxy._dbus.object_path, interface_name(interface), member, lambda message: callback(*message.parse_to_tuple()))
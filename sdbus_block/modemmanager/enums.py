@@ -1,4 +1,6 @@
-from enum import IntEnum, IntFlag
+from enum import Enum, IntEnum, IntFlag
+from functools import lru_cache
+from typing import Optional, Tuple, Type
 
 
 class MMModemState(IntEnum):
@@ -164,6 +166,42 @@ class MMModemPowerState(IntEnum):
 	MM_MODEM_POWER_STATE_ON = 3
 
 
+class MMSimType(IntEnum):
+	"""Type of SIM card.
+
+	* MM_SIM_TYPE_UNKNOWN		SIM type is not known.
+	* MM_SIM_TYPE_PHYSICAL		SIM is a physical SIM.
+	* MM_SIM_TYPE_ESIM		SIM is an ESIM.
+	"""
+	MM_SIM_TYPE_UNKNOWN = 0
+	MM_SIM_TYPE_PHYSICAL = 1
+	MM_SIM_TYPE_ESIM = 2
+
+
+class MMSimEsimStatus(IntEnum):
+	"""Status of the profiles of an ESIM.
+
+	* MM_SIM_ESIM_STATUS_UNKNOWN		ESIM status unknown.
+	* MM_SIM_ESIM_STATUS_NO_PROFILES		ESIM without profiles.
+	* MM_SIM_ESIM_STATUS_WITH_PROFILES		ESIM with at least one profile.
+	"""
+	MM_SIM_ESIM_STATUS_UNKNOWN = 0
+	MM_SIM_ESIM_STATUS_NO_PROFILES = 1
+	MM_SIM_ESIM_STATUS_WITH_PROFILES = 2
+
+
+class MMSimRemovability(IntEnum):
+	"""Removability of a SIM card.
+
+	* MM_SIM_REMOVABILITY_UNKNOWN		SIM removability not known.
+	* MM_SIM_REMOVABILITY_REMOVABLE		SIM is a removable card.
+	* MM_SIM_REMOVABILITY_NOT_REMOVABLE		SIM is not removable.
+	"""
+	MM_SIM_REMOVABILITY_UNKNOWN = 0
+	MM_SIM_REMOVABILITY_REMOVABLE = 1
+	MM_SIM_REMOVABILITY_NOT_REMOVABLE = 2
+
+
 class MMCallDirection(IntEnum):
 	"""Direction of the call.
 
@@ -237,14 +275,7 @@ class MMModemCapability(IntEnum):
 
 	@staticmethod
 	def names(value) -> list:
-		names = []
-		if MMModemCapability.MM_MODEM_CAPABILITY_ANY != value:
-			for capability in MMModemCapability:
-				if capability & value and capability != MMModemCapability.MM_MODEM_CAPABILITY_ANY:
-					names.append(capability.name)
-		else:
-			names.append(MMModemCapability.MM_MODEM_CAPABILITY_ANY.name)
-		return names
+		return list(flag_names(MMModemCapability, value))
 
 
 class MMModemLocationSource(IntEnum):
@@ -283,3 +314,325 @@ class MMModemLocationAssistanceDataType(IntEnum):
     """
 	MM_MODEM_LOCATION_ASSISTANCE_DATA_TYPE_NONE = 0
 	MM_MODEM_LOCATION_ASSISTANCE_DATA_TYPE_XTRA = 1 << 0
+
+
+class MMModemBand(IntEnum):
+	"""
+	Radio bands supported by the device when connecting to a mobile network.
+
+	* MM_MODEM_BAND_UNKNOWN: Unknown or invalid band.
+	* MM_MODEM_BAND_EGSM ... MM_MODEM_BAND_G810: GSM/GPRS/EDGE and UMTS bands of the original enumeration.
+	* MM_MODEM_BAND_EUTRAN_<n>: E-UTRAN (LTE) band n, value 30 + n.
+	* MM_MODEM_BAND_CDMA_BC<n>: CDMA band class n, value 128 + n.
+	* MM_MODEM_BAND_ANY: For certain operations, allow the modem to select a band automatically.
+	* MM_MODEM_BAND_UTRAN_<n>: UMTS band n beyond the original enumeration, value 200 + n.
+	* MM_MODEM_BAND_NGRAN_<n>: NG-RAN (5G NR) band n, value 300 + n.
+	"""
+	MM_MODEM_BAND_UNKNOWN = 0
+	MM_MODEM_BAND_EGSM = 1
+	MM_MODEM_BAND_DCS = 2
+	MM_MODEM_BAND_PCS = 3
+	MM_MODEM_BAND_G850 = 4
+	MM_MODEM_BAND_UTRAN_1 = 5
+	MM_MODEM_BAND_UTRAN_3 = 6
+	MM_MODEM_BAND_UTRAN_4 = 7
+	MM_MODEM_BAND_UTRAN_6 = 8
+	MM_MODEM_BAND_UTRAN_5 = 9
+	MM_MODEM_BAND_UTRAN_8 = 10
+	MM_MODEM_BAND_UTRAN_9 = 11
+	MM_MODEM_BAND_UTRAN_2 = 12
+	MM_MODEM_BAND_UTRAN_7 = 13
+	MM_MODEM_BAND_G450 = 14
+	MM_MODEM_BAND_G480 = 15
+	MM_MODEM_BAND_G750 = 16
+	MM_MODEM_BAND_G380 = 17
+	MM_MODEM_BAND_G410 = 18
+	MM_MODEM_BAND_G710 = 19
+	MM_MODEM_BAND_G810 = 20
+	MM_MODEM_BAND_EUTRAN_1 = 31
+	MM_MODEM_BAND_EUTRAN_2 = 32
+	MM_MODEM_BAND_EUTRAN_3 = 33
+	MM_MODEM_BAND_EUTRAN_4 = 34
+	MM_MODEM_BAND_EUTRAN_5 = 35
+	MM_MODEM_BAND_EUTRAN_6 = 36
+	MM_MODEM_BAND_EUTRAN_7 = 37
+	MM_MODEM_BAND_EUTRAN_8 = 38
+	MM_MODEM_BAND_EUTRAN_9 = 39
+	MM_MODEM_BAND_EUTRAN_10 = 40
+	MM_MODEM_BAND_EUTRAN_11 = 41
+	MM_MODEM_BAND_EUTRAN_12 = 42
+	MM_MODEM_BAND_EUTRAN_13 = 43
+	MM_MODEM_BAND_EUTRAN_14 = 44
+	MM_MODEM_BAND_EUTRAN_15 = 45
+	MM_MODEM_BAND_EUTRAN_16 = 46
+	MM_MODEM_BAND_EUTRAN_17 = 47
+	MM_MODEM_BAND_EUTRAN_18 = 48
+	MM_MODEM_BAND_EUTRAN_19 = 49
+	MM_MODEM_BAND_EUTRAN_20 = 50
+	MM_MODEM_BAND_EUTRAN_21 = 51
+	MM_MODEM_BAND_EUTRAN_22 = 52
+	MM_MODEM_BAND_EUTRAN_23 = 53
+	MM_MODEM_BAND_EUTRAN_24 = 54
+	MM_MODEM_BAND_EUTRAN_25 = 55
+	MM_MODEM_BAND_EUTRAN_26 = 56
+	MM_MODEM_BAND_EUTRAN_27 = 57
+	MM_MODEM_BAND_EUTRAN_28 = 58
+	MM_MODEM_BAND_EUTRAN_29 = 59
+	MM_MODEM_BAND_EUTRAN_30 = 60
+	MM_MODEM_BAND_EUTRAN_31 = 61
+	MM_MODEM_BAND_EUTRAN_32 = 62
+	MM_MODEM_BAND_EUTRAN_33 = 63
+	MM_MODEM_BAND_EUTRAN_34 = 64
+	MM_MODEM_BAND_EUTRAN_35 = 65
+	MM_MODEM_BAND_EUTRAN_36 = 66
+	MM_MODEM_BAND_EUTRAN_37 = 67
+	MM_MODEM_BAND_EUTRAN_38 = 68
+	MM_MODEM_BAND_EUTRAN_39 = 69
+	MM_MODEM_BAND_EUTRAN_40 = 70
+	MM_MODEM_BAND_EUTRAN_41 = 71
+	MM_MODEM_BAND_EUTRAN_42 = 72
+	MM_MODEM_BAND_EUTRAN_43 = 73
+	MM_MODEM_BAND_EUTRAN_44 = 74
+	MM_MODEM_BAND_EUTRAN_45 = 75
+	MM_MODEM_BAND_EUTRAN_46 = 76
+	MM_MODEM_BAND_EUTRAN_47 = 77
+	MM_MODEM_BAND_EUTRAN_48 = 78
+	MM_MODEM_BAND_EUTRAN_49 = 79
+	MM_MODEM_BAND_EUTRAN_50 = 80
+	MM_MODEM_BAND_EUTRAN_51 = 81
+	MM_MODEM_BAND_EUTRAN_52 = 82
+	MM_MODEM_BAND_EUTRAN_53 = 83
+	MM_MODEM_BAND_EUTRAN_54 = 84
+	MM_MODEM_BAND_EUTRAN_55 = 85
+	MM_MODEM_BAND_EUTRAN_56 = 86
+	MM_MODEM_BAND_EUTRAN_57 = 87
+	MM_MODEM_BAND_EUTRAN_58 = 88
+	MM_MODEM_BAND_EUTRAN_59 = 89
+	MM_MODEM_BAND_EUTRAN_60 = 90
+	MM_MODEM_BAND_EUTRAN_61 = 91
+	MM_MODEM_BAND_EUTRAN_62 = 92
+	MM_MODEM_BAND_EUTRAN_63 = 93
+	MM_MODEM_BAND_EUTRAN_64 = 94
+	MM_MODEM_BAND_EUTRAN_65 = 95
+	MM_MODEM_BAND_EUTRAN_66 = 96
+	MM_MODEM_BAND_EUTRAN_67 = 97
+	MM_MODEM_BAND_EUTRAN_68 = 98
+	MM_MODEM_BAND_EUTRAN_69 = 99
+	MM_MODEM_BAND_EUTRAN_70 = 100
+	MM_MODEM_BAND_EUTRAN_71 = 101
+	MM_MODEM_BAND_CDMA_BC0 = 128
+	MM_MODEM_BAND_CDMA_BC1 = 129
+	MM_MODEM_BAND_CDMA_BC2 = 130
+	MM_MODEM_BAND_CDMA_BC3 = 131
+	MM_MODEM_BAND_CDMA_BC4 = 132
+	MM_MODEM_BAND_CDMA_BC5 = 133
+	MM_MODEM_BAND_CDMA_BC6 = 134
+	MM_MODEM_BAND_CDMA_BC7 = 135
+	MM_MODEM_BAND_CDMA_BC8 = 136
+	MM_MODEM_BAND_CDMA_BC9 = 137
+	MM_MODEM_BAND_CDMA_BC10 = 138
+	MM_MODEM_BAND_CDMA_BC11 = 139
+	MM_MODEM_BAND_CDMA_BC12 = 140
+	MM_MODEM_BAND_CDMA_BC13 = 141
+	MM_MODEM_BAND_CDMA_BC14 = 142
+	MM_MODEM_BAND_CDMA_BC15 = 143
+	MM_MODEM_BAND_CDMA_BC16 = 144
+	MM_MODEM_BAND_CDMA_BC17 = 145
+	MM_MODEM_BAND_CDMA_BC18 = 146
+	MM_MODEM_BAND_CDMA_BC19 = 147
+	MM_MODEM_BAND_ANY = 256
+	MM_MODEM_BAND_UTRAN_10 = 210
+	MM_MODEM_BAND_UTRAN_11 = 211
+	MM_MODEM_BAND_UTRAN_12 = 212
+	MM_MODEM_BAND_UTRAN_13 = 213
+	MM_MODEM_BAND_UTRAN_14 = 214
+	MM_MODEM_BAND_UTRAN_19 = 219
+	MM_MODEM_BAND_UTRAN_20 = 220
+	MM_MODEM_BAND_UTRAN_21 = 221
+	MM_MODEM_BAND_UTRAN_22 = 222
+	MM_MODEM_BAND_UTRAN_25 = 225
+	MM_MODEM_BAND_UTRAN_26 = 226
+	MM_MODEM_BAND_UTRAN_32 = 232
+	MM_MODEM_BAND_NGRAN_1 = 301
+	MM_MODEM_BAND_NGRAN_2 = 302
+	MM_MODEM_BAND_NGRAN_3 = 303
+	MM_MODEM_BAND_NGRAN_5 = 305
+	MM_MODEM_BAND_NGRAN_7 = 307
+	MM_MODEM_BAND_NGRAN_8 = 308
+	MM_MODEM_BAND_NGRAN_12 = 312
+	MM_MODEM_BAND_NGRAN_13 = 313
+	MM_MODEM_BAND_NGRAN_14 = 314
+	MM_MODEM_BAND_NGRAN_18 = 318
+	MM_MODEM_BAND_NGRAN_20 = 320
+	MM_MODEM_BAND_NGRAN_25 = 325
+	MM_MODEM_BAND_NGRAN_26 = 326
+	MM_MODEM_BAND_NGRAN_28 = 328
+	MM_MODEM_BAND_NGRAN_29 = 329
+	MM_MODEM_BAND_NGRAN_30 = 330
+	MM_MODEM_BAND_NGRAN_34 = 334
+	MM_MODEM_BAND_NGRAN_38 = 338
+	MM_MODEM_BAND_NGRAN_39 = 339
+	MM_MODEM_BAND_NGRAN_40 = 340
+	MM_MODEM_BAND_NGRAN_41 = 341
+	MM_MODEM_BAND_NGRAN_48 = 348
+	MM_MODEM_BAND_NGRAN_50 = 350
+	MM_MODEM_BAND_NGRAN_51 = 351
+	MM_MODEM_BAND_NGRAN_53 = 353
+	MM_MODEM_BAND_NGRAN_65 = 365
+	MM_MODEM_BAND_NGRAN_66 = 366
+	MM_MODEM_BAND_NGRAN_70 = 370
+	MM_MODEM_BAND_NGRAN_71 = 371
+	MM_MODEM_BAND_NGRAN_74 = 374
+	MM_MODEM_BAND_NGRAN_75 = 375
+	MM_MODEM_BAND_NGRAN_76 = 376
+	MM_MODEM_BAND_NGRAN_77 = 377
+	MM_MODEM_BAND_NGRAN_78 = 378
+	MM_MODEM_BAND_NGRAN_79 = 379
+	MM_MODEM_BAND_NGRAN_80 = 380
+	MM_MODEM_BAND_NGRAN_81 = 381
+	MM_MODEM_BAND_NGRAN_82 = 382
+	MM_MODEM_BAND_NGRAN_83 = 383
+	MM_MODEM_BAND_NGRAN_84 = 384
+	MM_MODEM_BAND_NGRAN_86 = 386
+	MM_MODEM_BAND_NGRAN_89 = 389
+	MM_MODEM_BAND_NGRAN_90 = 390
+	MM_MODEM_BAND_NGRAN_91 = 391
+	MM_MODEM_BAND_NGRAN_92 = 392
+	MM_MODEM_BAND_NGRAN_93 = 393
+	MM_MODEM_BAND_NGRAN_94 = 394
+	MM_MODEM_BAND_NGRAN_95 = 395
+	MM_MODEM_BAND_NGRAN_257 = 557
+	MM_MODEM_BAND_NGRAN_258 = 558
+	MM_MODEM_BAND_NGRAN_260 = 560
+	MM_MODEM_BAND_NGRAN_261 = 561
+
+
+class MMSmsState(IntEnum):
+	"""State of a given SMS.
+
+	* MM_SMS_STATE_UNKNOWN: State unknown or not reportable.
+	* MM_SMS_STATE_STORED: The message has been neither received nor yet sent.
+	* MM_SMS_STATE_RECEIVING: The message is being received but is not yet complete.
+	* MM_SMS_STATE_RECEIVED: The message has been completely received.
+	* MM_SMS_STATE_SENDING: The message is queued for delivery.
+	* MM_SMS_STATE_SENT: The message was successfully sent.
+	"""
+	MM_SMS_STATE_UNKNOWN = 0
+	MM_SMS_STATE_STORED = 1
+	MM_SMS_STATE_RECEIVING = 2
+	MM_SMS_STATE_RECEIVED = 3
+	MM_SMS_STATE_SENDING = 4
+	MM_SMS_STATE_SENT = 5
+
+
+class MMSmsPduType(IntEnum):
+	"""Type of PDUs used in the SMS.
+
+	* MM_SMS_PDU_TYPE_UNKNOWN: Unknown type.
+	* MM_SMS_PDU_TYPE_DELIVER: 3GPP Mobile-Terminated (MT) message.
+	* MM_SMS_PDU_TYPE_SUBMIT: 3GPP Mobile-Originated (MO) message.
+	* MM_SMS_PDU_TYPE_STATUS_REPORT: 3GPP status report (MT).
+	* MM_SMS_PDU_TYPE_CDMA_DELIVER: 3GPP2 Mobile-Terminated (MT) message.
+	* MM_SMS_PDU_TYPE_CDMA_SUBMIT: 3GPP2 Mobile-Originated (MO) message.
+	* MM_SMS_PDU_TYPE_CDMA_CANCELLATION: 3GPP2 Cancellation (MO) message.
+	* MM_SMS_PDU_TYPE_CDMA_DELIVERY_ACKNOWLEDGEMENT: 3GPP2 Delivery Acknowledgement (MT) message.
+	* MM_SMS_PDU_TYPE_CDMA_USER_ACKNOWLEDGEMENT: 3GPP2 User Acknowledgement (MT or MO) message.
+	* MM_SMS_PDU_TYPE_CDMA_READ_ACKNOWLEDGEMENT: 3GPP2 Read Acknowledgement (MT or MO) message.
+	"""
+	MM_SMS_PDU_TYPE_UNKNOWN = 0
+	MM_SMS_PDU_TYPE_DELIVER = 1
+	MM_SMS_PDU_TYPE_SUBMIT = 2
+	MM_SMS_PDU_TYPE_STATUS_REPORT = 3
+	MM_SMS_PDU_TYPE_CDMA_DELIVER = 4
+	MM_SMS_PDU_TYPE_CDMA_SUBMIT = 5
+	MM_SMS_PDU_TYPE_CDMA_CANCELLATION = 6
+	MM_SMS_PDU_TYPE_CDMA_DELIVERY_ACKNOWLEDGEMENT = 7
+	MM_SMS_PDU_TYPE_CDMA_USER_ACKNOWLEDGEMENT = 8
+	MM_SMS_PDU_TYPE_CDMA_READ_ACKNOWLEDGEMENT = 9
+
+
+class MMSmsDeliveryState(IntEnum):
+	"""Known SMS delivery states as defined in 3GPP TS 03.40, reported by status reports.
+
+	Values below 0x20 complete the delivery, from 0x20 the service center is still trying to deliver the message,
+	from 0x40 the delivery failed. The 3GPP2 states, from 0x200, are not listed.
+
+	* MM_SMS_DELIVERY_STATE_COMPLETED_RECEIVED: Delivery completed, message received by the SME.
+	* MM_SMS_DELIVERY_STATE_COMPLETED_FORWARDED_UNCONFIRMED: Forwarded by the SC to the SME but unable to confirm delivery.
+	* MM_SMS_DELIVERY_STATE_COMPLETED_REPLACED_BY_SC: Message replaced by the SC.
+	* MM_SMS_DELIVERY_STATE_TEMPORARY_ERROR_*: Temporary error, the SC still tries to transfer the message.
+	* MM_SMS_DELIVERY_STATE_ERROR_*: Permanent error, the SC is not making any more transfer attempts.
+	* MM_SMS_DELIVERY_STATE_TEMPORARY_FATAL_ERROR_*: Temporary error, the SC is not making any more transfer attempts.
+	* MM_SMS_DELIVERY_STATE_UNKNOWN: Unknown state.
+	"""
+	MM_SMS_DELIVERY_STATE_COMPLETED_RECEIVED = 0x00
+	MM_SMS_DELIVERY_STATE_COMPLETED_FORWARDED_UNCONFIRMED = 0x01
+	MM_SMS_DELIVERY_STATE_COMPLETED_REPLACED_BY_SC = 0x02
+	MM_SMS_DELIVERY_STATE_TEMPORARY_ERROR_CONGESTION = 0x20
+	MM_SMS_DELIVERY_STATE_TEMPORARY_ERROR_SME_BUSY = 0x21
+	MM_SMS_DELIVERY_STATE_TEMPORARY_ERROR_NO_RESPONSE_FROM_SME = 0x22
+	MM_SMS_DELIVERY_STATE_TEMPORARY_ERROR_SERVICE_REJECTED = 0x23
+	MM_SMS_DELIVERY_STATE_TEMPORARY_ERROR_QOS_NOT_AVAILABLE = 0x24
+	MM_SMS_DELIVERY_STATE_TEMPORARY_ERROR_IN_SME = 0x25
+	MM_SMS_DELIVERY_STATE_ERROR_REMOTE_PROCEDURE = 0x40
+	MM_SMS_DELIVERY_STATE_ERROR_INCOMPATIBLE_DESTINATION = 0x41
+	MM_SMS_DELIVERY_STATE_ERROR_CONNECTION_REJECTED = 0x42
+	MM_SMS_DELIVERY_STATE_ERROR_NOT_OBTAINABLE = 0x43
+	MM_SMS_DELIVERY_STATE_ERROR_QOS_NOT_AVAILABLE = 0x44
+	MM_SMS_DELIVERY_STATE_ERROR_NO_INTERWORKING_AVAILABLE = 0x45
+	MM_SMS_DELIVERY_STATE_ERROR_VALIDITY_PERIOD_EXPIRED = 0x46
+	MM_SMS_DELIVERY_STATE_ERROR_DELETED_BY_ORIGINATING_SME = 0x47
+	MM_SMS_DELIVERY_STATE_ERROR_DELETED_BY_SC_ADMINISTRATION = 0x48
+	MM_SMS_DELIVERY_STATE_ERROR_MESSAGE_DOES_NOT_EXIST = 0x49
+	MM_SMS_DELIVERY_STATE_TEMPORARY_FATAL_ERROR_CONGESTION = 0x60
+	MM_SMS_DELIVERY_STATE_TEMPORARY_FATAL_ERROR_SME_BUSY = 0x61
+	MM_SMS_DELIVERY_STATE_TEMPORARY_FATAL_ERROR_NO_RESPONSE_FROM_SME = 0x62
+	MM_SMS_DELIVERY_STATE_TEMPORARY_FATAL_ERROR_SERVICE_REJECTED = 0x63
+	MM_SMS_DELIVERY_STATE_TEMPORARY_FATAL_ERROR_QOS_NOT_AVAILABLE = 0x64
+	MM_SMS_DELIVERY_STATE_TEMPORARY_FATAL_ERROR_IN_SME = 0x65
+	MM_SMS_DELIVERY_STATE_UNKNOWN = 0x100
+
+
+class MMBearerIpFamily(IntFlag):
+	"""Type of IP family to be used in a given Bearer.
+
+	* MM_BEARER_IP_FAMILY_NONE: None or unknown.
+	* MM_BEARER_IP_FAMILY_IPV4: IPv4.
+	* MM_BEARER_IP_FAMILY_IPV6: IPv6.
+	* MM_BEARER_IP_FAMILY_IPV4V6: IPv4 and IPv6.
+	* MM_BEARER_IP_FAMILY_NON_IP: Non-IP Bearer. Since 1.20.
+	* MM_BEARER_IP_FAMILY_ANY: Mask specifying all IP families.
+	"""
+	MM_BEARER_IP_FAMILY_NONE = 0
+	MM_BEARER_IP_FAMILY_IPV4 = 1 << 0
+	MM_BEARER_IP_FAMILY_IPV6 = 1 << 1
+	MM_BEARER_IP_FAMILY_IPV4V6 = 1 << 2
+	MM_BEARER_IP_FAMILY_NON_IP = 1 << 3
+	MM_BEARER_IP_FAMILY_ANY = 0xFFFFFFFF
+
+
+@lru_cache(maxsize=1024)
+def enum_name(enum: Type[Enum], value: int) -> Optional[str]:
+	"""Returns the name of the member of ``enum`` for ``value``, memoized. Raises ValueError for unknown values."""
+	return enum(value).name
+
+
+@lru_cache(maxsize=1024)
+def flag_members(enum: Type[Enum], value: int) -> Tuple[Enum, ...]:
+	"""
+	Decomposes a bitmask into the single-bit members of ``enum`` it sets, memoized.
+
+	A value equal to a multi-bit member, such as the ``ANY`` masks, decodes to that member alone, and zero to no member.
+	"""
+	# Iterating an IntFlag skips its multi-bit members since python 3.11, the mapping of names lists them all
+	members = tuple(dict.fromkeys(enum.__members__.values()))
+	for member in members:
+		if member.value == value and value & (value - 1):
+			return (member, )
+	return tuple(member for member in members if member.value and not member.value & (member.value - 1) and member.value & value)
+
+
+@lru_cache(maxsize=1024)
+def flag_names(enum: Type[Enum], value: int) -> Tuple[str, ...]:
+	"""Names of the members returned by :py:func:`flag_members`, memoized."""
+	return tuple(member.name for member in flag_members(enum, value))
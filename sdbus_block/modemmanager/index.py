@@ -0,0 +1,66 @@
+from typing import Any, Dict, Iterator, Mapping, Optional
+
+MODEM_INDEX_KEYS = ('equipment_identifier', 'device_identifier', 'primary_port')
+"""Properties of the Modem interface kept in :py:class:`MMModemIndex`."""
+
+SIM_INDEX_KEYS = ('sim_identifier', 'imsi')
+"""Properties of the SIM interface kept in :py:class:`MMModemIndex`."""
+
+INDEX_KEYS = MODEM_INDEX_KEYS + SIM_INDEX_KEYS
+
+
+class MMModemIndex:
+	"""
+	Maps the identifiers of the modems, and of their SIM cards, to modem object paths.
+
+	Lookups are dictionary lookups. The index is updated incrementally with :py:meth:`update` and :py:meth:`discard`,
+	empty values are not indexed.
+	"""
+
+	def __init__(self) -> None:
+		self._paths: Dict[str, Dict[Any, str]] = {key: {} for key in INDEX_KEYS}
+		self._values: Dict[str, Dict[str, Any]] = {}
+
+	def update(self, object_path: str, values: Mapping[str, Any]) -> None:
+		"""
+		Indexes the modem under new identifier values, replacing the previous ones.
+
+		:param object_path: Object path of the modem.
+		:param values: Python attribute names to values. Names not in :py:data:`INDEX_KEYS` are ignored.
+		"""
+		current = self._values.setdefault(object_path, {})
+		for key in INDEX_KEYS:
+			if key not in values:
+				continue
+			paths = self._paths[key]
+			old = current.pop(key, None)
+			if old is not None and paths.get(old) == object_path:
+				del paths[old]
+			value = values[key]
+			if value:
+				current[key] = value
+				paths[value] = object_path
+
+	def discard(self, object_path: str) -> None:
+		"""Removes all the identifiers of a modem."""
+		for key, value in self._values.pop(object_path, {}).items():
+			if self._paths[key].get(value) == object_path:
+				del self._paths[key][value]
+
+	def find(self, key: str, value: Any) -> Optional[str]:
+		"""
+		Returns the object path of the modem with the given identifier, if any.
+
+		:param key: One of :py:data:`INDEX_KEYS`, for example ``'equipment_identifier'`` for the IMEI.
+		"""
+		return self._paths[key].get(value)
+
+	def values(self, object_path: str) -> Dict[str, Any]:
+		"""Returns the indexed identifiers of a modem."""
+		return dict(self._values.get(object_path, {}))
+
+	def __contains__(self, object_path: str) -> bool:
+		return object_path in self._values
+
+	def __iter__(self) -> Iterator[str]:
+		return iter(self._values)
@@ -87,7 +87,15 @@ class MMBearerInterface(DbusInterfaceCommon, interface_name='org.freedesktop.Mod
 		"""
 		raise NotImplementedError
 
+	@dbus_property(property_signature='a{sv}')
+	def ip6_config(self) -> Dict[str, Tuple[str, Any]]:
+		raise NotImplementedError
+
 	@dbus_property(property_signature='a{sv}')
 	def stats(self) -> Dict[str, Tuple[str, Any]]:
 		"""If the modem supports it, this property will show statistics associated to the bearer."""
 		raise NotImplementedError
+
+	@dbus_property(property_signature='a{sv}')
+	def properties(self) -> Dict[str, Tuple[str, Any]]:
+		raise NotImplementedError
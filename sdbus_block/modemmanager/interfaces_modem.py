@@ -2,7 +2,8 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from sdbus import DbusInterfaceCommon, DbusObjectManagerInterface, dbus_method, dbus_property
 
-from .enums import MMModemPowerState, MMModemState, MMModemStateFailedReason, MMModemAccessTechnology, MMModemCapability
+from .constant import dbus_property_constant
+from .enums import MMModemPowerState, MMModemState, MMModemStateFailedReason, MMModemAccessTechnology, MMModemCapability, enum_name, flag_names
 
 
 class MMModemsInterface(DbusObjectManagerInterface):
@@ -55,27 +56,27 @@ class MMModemInterface(DbusInterfaceCommon, interface_name='org.freedesktop.Mode
 		"""
 		raise NotImplementedError
 
-	@dbus_property('s')
+	@dbus_property_constant('s')
 	def manufacturer(self) -> str:
 		"""The equipment manufacturer, as reported by the modem."""
 		raise NotImplementedError
 
-	@dbus_property('s')
+	@dbus_property_constant('s')
 	def model(self) -> str:
 		"""The equipment model, as reported by the modem."""
 		raise NotImplementedError
 
-	@dbus_property('s', property_name='Revision')
+	@dbus_property_constant('s', property_name='Revision')
 	def revision(self) -> str:
 		"""The revision identification of the software, as reported by the modem."""
 		raise NotImplementedError
 
-	@dbus_property('s')
+	@dbus_property_constant('s')
 	def hardware_revision(self) -> str:
 		"""The revision identification of the hardware, as reported by the modem."""
 		raise NotImplementedError
 
-	@dbus_property('s')
+	@dbus_property_constant('s')
 	def device_identifier(self) -> str:
 		"""
 		A best-effort device identifier based on various device information like model name, firmware revision, 
@@ -91,7 +92,7 @@ class MMModemInterface(DbusInterfaceCommon, interface_name='org.freedesktop.Mode
 		"""The name of the primary port using to control the modem."""
 		raise NotImplementedError
 
-	@dbus_property('s')
+	@dbus_property_constant('s')
 	def equipment_identifier(self) -> str:
 		"""
 		The identity of the device.
@@ -113,7 +114,7 @@ class MMModemInterface(DbusInterfaceCommon, interface_name='org.freedesktop.Mode
 
 	@property
 	def state_text(self) -> str:
-		return MMModemState(self.state).name
+		return enum_name(MMModemState, self.state)
 
 	@dbus_property('u')
 	def state_failed_reason(self):
@@ -125,7 +126,7 @@ class MMModemInterface(DbusInterfaceCommon, interface_name='org.freedesktop.Mode
 
 	@property
 	def state_failed_reason_text(self) -> str:
-		return MMModemStateFailedReason(self.state_failed_reason).name
+		return enum_name(MMModemStateFailedReason, self.state_failed_reason)
 
 	@dbus_property('ub')
 	def signal_quality(self):
@@ -147,7 +148,7 @@ class MMModemInterface(DbusInterfaceCommon, interface_name='org.freedesktop.Mode
 
 	@property
 	def power_state_text(self):
-		return MMModemPowerState(self.power_state).name
+		return enum_name(MMModemPowerState, self.power_state)
 
 	@dbus_property('u')
 	def access_technologies(self):
@@ -159,7 +160,7 @@ class MMModemInterface(DbusInterfaceCommon, interface_name='org.freedesktop.Mode
 
 	@property
 	def access_technologies_text(self) -> Optional[str]:
-		return MMModemAccessTechnology(self.access_technologies).name
+		return enum_name(MMModemAccessTechnology, self.access_technologies)
 
 	@dbus_property('u', property_name='CurrentCapabilities')
 	def current_capabilities(self) -> int:
@@ -167,7 +168,7 @@ class MMModemInterface(DbusInterfaceCommon, interface_name='org.freedesktop.Mode
 
 	@property
 	def current_capabilities_text(self) -> Tuple[str]:
-		return tuple(MMModemCapability.names(self.current_capabilities))
+		return flag_names(MMModemCapability, self.current_capabilities)
 
 	@dbus_method(result_signature='aa{sv}')
 	def get_cell_info(self) -> List[Dict[str, Tuple[str, Any]]]:
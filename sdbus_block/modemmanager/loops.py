@@ -0,0 +1,31 @@
+from asyncio import AbstractEventLoop, new_event_loop
+from typing import Dict
+
+from sdbus.sd_bus_internals import SdBus
+
+# sd-bus replies to asynchronous calls and signals are dispatched by an event loop, which sdbus binds to the bus on first use.
+# Bus objects cannot be weakly referenced, and the loop holds its bus as a reader anyway.
+_loops: Dict[SdBus, AbstractEventLoop] = {}
+
+
+def bus_loop(bus: SdBus) -> AbstractEventLoop:
+	"""
+	Returns the private event loop dispatching the asynchronous calls and signals of a bus,
+	used by :py:class:`MMBatch` and :py:class:`MMSignalDispatcher`. It is kept until :py:func:`close_bus_loop`.
+	"""
+	loop = _loops.get(bus)
+	if loop is None:
+		loop = _loops[bus] = new_event_loop()
+	return loop
+
+
+def close_bus_loop(bus: SdBus) -> None:
+	"""
+	Closes the private event loop of a bus, if any, and releases both of them.
+
+	sdbus binds a bus to the first loop it dispatches, so the bus can no longer be used by batches or dispatchers.
+	Call it when done with the bus.
+	"""
+	loop = _loops.pop(bus, None)
+	if loop is not None:
+		loop.close()
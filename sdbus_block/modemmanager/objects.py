@@ -1,8 +1,13 @@
-from typing import Dict, List, Optional, Any
+from time import monotonic
+from typing import TYPE_CHECKING, Dict, Iterable, List, NamedTuple, Optional, Any, Tuple, Type, TypeVar
+from weakref import WeakValueDictionary
 
+from sdbus import get_default_bus
 from sdbus.sd_bus_internals import SdBus
 
-from .enums import MMCallDirection, MMCallState, MMCallStateReason, MMModemLocationSource
+from .batch import MMBatch
+from .constant import forget_constants
+from .enums import MMCallDirection, MMCallState, MMCallStateReason, MMModemLocationSource, enum_name, flag_members
 from .interfaces_bearer import MMBearerInterface
 from .interfaces_call import MMCallInterface
 from .interfaces_modem import MMModemInterface, MMModemMessagingInterface, MMModemSignalInterface, MMModemsInterface, MMModemVoiceInterface
@@ -13,8 +18,39 @@ from .interfaces_3gpp import MMModem3gppInterface
 from .interfaces_simple import MMModemSimpleInterface
 from .interfaces_time import MMModemTimeInterface
 from .interfaces_location import MMModemLocationInterface
+from .index import MODEM_INDEX_KEYS, MMModemIndex
+from .properties import interface_name, parse_interfaces, parse_properties, property_names
+from .signal_records import SIGNAL_RECORDS, SignalRecord
+from .variants import plain_values, unwrap_variant, unwrap_variants
+
+if TYPE_CHECKING:
+	from .dispatcher import MMSignalDispatcher
 
 MODEM_MANAGER_SERVICE_NAME = 'org.freedesktop.ModemManager1'
+MODEM_INTERFACE_NAME = 'org.freedesktop.ModemManager1.Modem'
+SIM_INTERFACE_NAME = 'org.freedesktop.ModemManager1.Sim'
+
+T = TypeVar('T')
+
+_proxies: Dict[SdBus, 'WeakValueDictionary[Tuple[type, str], Any]'] = {}
+
+
+def _proxy(proxy_class: Type[T], object_path: str, bus: Optional[SdBus] = None) -> T:
+	"""Returns the live proxy of the object path on the bus, creating it if there is none."""
+	proxies = _proxies.setdefault(bus if bus is not None else get_default_bus(), WeakValueDictionary())
+	proxy = proxies.get((proxy_class, object_path))
+	if proxy is None:
+		proxy = proxies[proxy_class, object_path] = proxy_class(object_path=object_path, bus=bus)
+	return proxy
+
+
+def _evict(proxy_class: type, object_path: str, bus: Optional[SdBus] = None) -> None:
+	"""Forgets the proxy of a deleted object, so that a new proxy is created if the path is reused."""
+	proxies = _proxies.get(bus if bus is not None else get_default_bus())
+	if proxies is not None:
+		proxy = proxies.pop((proxy_class, object_path), None)
+		if proxy is not None:
+			forget_constants(proxy)
 
 
 class MM(MMInterface):
@@ -53,22 +89,45 @@ class MMModemMessaging(MMModemMessagingInterface):
 	def __init__(self, object_path: str, bus: Optional[SdBus] = None) -> None:
 		super().__init__(MODEM_MANAGER_SERVICE_NAME, object_path, bus)
 
-	def create_sms(self, number: str, text: str = None, data: bytes = None) -> MMSms:
-		"""Creates a new message object."""
+	def create_sms(self, number: str, text: str = None, data: bytes = None, delivery_report_request: bool = False) -> MMSms:
+		"""
+		Creates a new message object.
+
+		:param delivery_report_request: Request a status report of the delivery of the message.
+		"""
 		args = {"number": ("s", number)}
 		if text:
 			args["text"] = ("s", text)
 		elif data:
 			args["data"] = ("ay", data)
+		if delivery_report_request:
+			args["delivery-report-request"] = ("b", True)
 
-		return MMSms(self.create(properties=args))
+		return self.get_sms(self.create(properties=args))
 
 	def delete_sms(self, sms: MMSms) -> None:
 		"""Delete an SMS message."""
 		self.delete(sms._dbus.object_path)
+		_evict(MMSms, sms._dbus.object_path, self._dbus.attached_bus)
+
+	def get_sms(self, object_path: str) -> MMSms:
+		"""
+		Returns the message object of the given path. The same proxy is returned while it is alive,
+		until the message is deleted with :py:meth:`delete_sms`.
+		"""
+		return _proxy(MMSms, object_path, self._dbus.attached_bus)
+
+	def get_messages(self) -> List[MMSms]:
+		return [self.get_sms(path) for path in self.messages]
 
 
 class MMModemSignal(MMModemSignalInterface):
+	cdma_values = plain_values('cdma')
+	evdo_values = plain_values('evdo')
+	gsm_values = plain_values('gsm')
+	umts_values = plain_values('umts')
+	lte_values = plain_values('lte')
+	nr5g_values = plain_values('nr5g')
 
 	def __init__(self, object_path: str, bus: Optional[SdBus] = None) -> None:
 		"""
@@ -77,70 +136,268 @@ class MMModemSignal(MMModemSignalInterface):
 		"""
 		super().__init__(MODEM_MANAGER_SERVICE_NAME, object_path, bus)
 
+	def get_record(self, technology: str) -> SignalRecord:
+		"""
+		Reads the signal of one access technology into a record.
+
+		:param technology: Property name of the access technology, for example ``'lte'``.
+		"""
+		return SIGNAL_RECORDS[technology].decode(getattr(self, technology))
+
+	def get_records(self) -> Dict[str, SignalRecord]:
+		"""Reads the signal of all access technologies with one GetAll call, omitting technologies without values."""
+		names = property_names(MMModemSignalInterface)
+		records: Dict[str, SignalRecord] = {}
+		for dbus_name, (_, values) in self._properties_get_all(interface_name(MMModemSignalInterface)).items():
+			technology = names.get(dbus_name)
+			if values and technology in SIGNAL_RECORDS:
+				records[technology] = SIGNAL_RECORDS[technology].decode(values)
+		return records
+
 
 class MMModemSimple(MMModemSimpleInterface):
 
 	def __init__(self, object_path: str, bus: Optional[SdBus] = None) -> None:
 		super().__init__(MODEM_MANAGER_SERVICE_NAME, object_path, bus)
 
+	def get_status_values(self) -> Dict[str, Any]:
+		"""``get_status`` with plain values instead of variants."""
+		return unwrap_variants(self.get_status())
+
 
 class MMModemVoice(MMModemVoiceInterface):
 
 	def __init__(self, object_path: str, bus: Optional[SdBus] = None) -> None:
 		super().__init__(MODEM_MANAGER_SERVICE_NAME, object_path, bus)
 
-	def get_calls(self):
-		return [MMCall(path) for path in self.call_object_paths]
+	def get_call(self, object_path: str) -> 'MMCall':
+		"""
+		Returns the call object of the given path. The same proxy is returned while it is alive,
+		until the call is deleted with :py:meth:`remove_call`.
+		"""
+		return _proxy(MMCall, object_path, self._dbus.attached_bus)
+
+	def remove_call(self, call: 'MMCall') -> None:
+		"""Delete a call, hanging it up if it is active."""
+		self.delete_call(call._dbus.object_path)
+		_evict(MMCall, call._dbus.object_path, self._dbus.attached_bus)
+
+	def get_calls(self) -> List['MMCall']:
+		return [self.get_call(path) for path in self.call_object_paths]
+
+
+class MMModem3gpp(MMModem3gppInterface):
+
+	def __init__(self, object_path: str, bus: Optional[SdBus] = None) -> None:
+		super().__init__(MODEM_MANAGER_SERVICE_NAME, object_path, bus)
+
+
+class MMModemTime(MMModemTimeInterface):
+	network_timezone_values = plain_values('network_timezone')
+
+	def __init__(self, object_path: str, bus: Optional[SdBus] = None) -> None:
+		super().__init__(MODEM_MANAGER_SERVICE_NAME, object_path, bus)
+
+
+class MMModemLocation(MMModemLocationInterface):
+
+	def __init__(self, object_path: str, bus: Optional[SdBus] = None) -> None:
+		super().__init__(MODEM_MANAGER_SERVICE_NAME, object_path, bus)
+
+	def configure(self, sources_to_enable: list[MMModemLocationSource], enable_signaling: bool = False):
+		bitmask = 0
+		for src in sources_to_enable:
+			bitmask |= src
+		super().setup(bitmask, enable_signaling)
+
+	@property
+	def enabled_list(self) -> List[MMModemLocationSource]:
+		bitmask = super().enabled
+		return list(flag_members(MMModemLocationSource, bitmask))
+
+	@property
+	def capabilities_list(self) -> List[MMModemLocationSource]:
+		bitmask = super().capabilities
+		return list(flag_members(MMModemLocationSource, bitmask))
+
+	@property
+	def source_map(self) -> dict[MMModemLocationSource, Any]:
+		"""
+        Returns dictionary of parsed get_location call, where keys are MMModemLocationSource
+        """
+
+		src_map: dict[MMModemLocationSource, Any] = {}
+		for k, v in super().get_location().items():
+			# get the enum corresponding to bit k
+			src_map[MMModemLocationSource(k)] = unwrap_variant(*v)
+
+		return src_map
+
+
+class _ModemInterface:
+	"""
+	Sub-interface proxy of :py:class:`MMModem`, created on first access.
+
+	``None`` when the interfaces exported by the modem are known and do not include it.
+	"""
+
+	def __init__(self, proxy_class: type) -> None:
+		self.proxy_class = proxy_class
+		self.interface_name = interface_name(proxy_class)
+
+	def __set_name__(self, owner: type, name: str) -> None:
+		self.name = name
+
+	def __get__(self, modem: Optional['MMModem'], owner: Optional[type] = None) -> Any:
+		if modem is None:
+			return self
+		if modem.interfaces and self.interface_name not in modem.interfaces:
+			return None
+		proxy = self.proxy_class(object_path=modem._dbus.object_path, bus=modem._dbus.attached_bus)
+		modem.__dict__[self.name] = proxy
+		return proxy
 
 
 class MMModem(MMModemInterface):
+	messaging = _ModemInterface(MMModemMessaging)
+	location = _ModemInterface(MMModemLocation)
+	simple = _ModemInterface(MMModemSimple)
+	signal = _ModemInterface(MMModemSignal)
+	voice = _ModemInterface(MMModemVoice)
+	modem3gpp = _ModemInterface(MMModem3gpp)
+	time = _ModemInterface(MMModemTime)
 
 	def __init__(
 		self,
 		object_path: str,
 		bus: Optional[SdBus] = None,
+		interfaces: Optional[Dict[str, Dict[str, Any]]] = None,
 	) -> None:
 		"""
 		:param bus: You probably want to set default bus to system bus \
 			or pass system bus directly.
+		:param interfaces: Interfaces exported by the modem and their properties, if already known to the caller, \
+			as returned by :py:func:`parse_interfaces`. Sub-interface proxies of interfaces not listed are ``None``.
 		"""
 		super().__init__(MODEM_MANAGER_SERVICE_NAME, object_path, bus)
-		self.messaging = MMModemMessaging(object_path=object_path, bus=bus)
-		self.location = MMModemLocation(object_path=object_path, bus=bus)
-		self.simple = MMModemSimple(object_path=object_path, bus=bus)
-		self.signal = MMModemSignal(object_path=object_path, bus=bus)
-		self.voice = MMModemVoice(object_path=object_path, bus=bus)
-		self.modem3gpp = MMModem3gpp(object_path=object_path, bus=bus)
-		self.time = MMModemTime(object_path=object_path, bus=bus)
 		self.sim: Optional[MMSim] = None
 		self.bearers: List[MMBearer] = []
+		self.interfaces: Dict[str, Dict[str, Any]] = interfaces if interfaces is not None else {}
+
+	def set_interfaces(self, interfaces: Dict[str, Dict[str, Any]]) -> None:
+		"""Replaces :py:attr:`interfaces`, dropping the sub-interface proxies of interfaces no longer exported."""
+		self.interfaces = interfaces
+		self.remove_interfaces([name for name in self._interface_attributes() if name not in interfaces])
+
+	def remove_interfaces(self, names: Iterable[str]) -> None:
+		"""Forgets interfaces the modem stopped exporting, with their properties and sub-interface proxies."""
+		attributes = self._interface_attributes()
+		for name in names:
+			self.interfaces.pop(name, None)
+			if name in attributes:
+				self.__dict__.pop(attributes[name], None)
+
+	@classmethod
+	def _interface_attributes(cls) -> Dict[str, str]:
+		return {attr.interface_name: attr.name for attr in vars(cls).values() if isinstance(attr, _ModemInterface)}
+
+	def batch(self) -> MMBatch:
+		"""Returns a :py:class:`MMBatch` of calls to this modem, which can also queue calls to other objects."""
+		return MMBatch(self)
+
+	def get_cell_info_values(self) -> List[Dict[str, Any]]:
+		"""``get_cell_info`` with plain values instead of variants."""
+		return unwrap_variant('aa{sv}', self.get_cell_info())
 
 	def set_sim(self, object_path: str):
-		self.sim = MMSim(object_path=object_path)
+		self.sim = _proxy(MMSim, object_path, self._dbus.attached_bus)
 
 	def set_bearers(self, object_paths: List[str]):
-		for p in object_paths:
-			b = MMBearer(p)
-			self.bearers.append(b)
+		self.bearers = [_proxy(MMBearer, p, self._dbus.attached_bus) for p in object_paths]
 
 
 class MMModems(MMModemsInterface):
-	modems: List[MMModem] = []
 
 	def __init__(self, bus: Optional[SdBus] = None) -> None:
 		super().__init__(service_name=MODEM_MANAGER_SERVICE_NAME, object_path='/org/freedesktop/ModemManager1', bus=bus)
+		self.modems_by_path: Dict[str, MMModem] = {}
+		self.index = MMModemIndex()
+
+	@property
+	def modems(self) -> List[MMModem]:
+		"""The currently known modems, see :py:meth:`get_modems`."""
+		return list(self.modems_by_path.values())
+
+	def get_modems(self, hydrate: bool = False) -> List[MMModem]:
+		"""
+		Refreshes the known modems. Proxies of the modems still present are reused and vanished ones are dropped.
 
-	def get_modems(self) -> List[MMModem]:
-		self.modems = []
-		for k, v in self.get_managed_objects().items():
-			m: MMModem = MMModem(object_path=k)
-			self.modems.append(m)
+		:param hydrate: Keep the properties returned by GetManagedObjects in :py:attr:`MMModem.interfaces`, \
+			so that they can be read without another D-Bus call per property. \
+			The names of the exported interfaces are recorded either way.
+		"""
+		objects = self.get_managed_objects()
+		for path in [p for p in self.modems_by_path if MODEM_INTERFACE_NAME not in objects.get(p, ())]:
+			forget_constants(self.modems_by_path.pop(path))
+			self.index.discard(path)
+		for k, v in objects.items():
+			if MODEM_INTERFACE_NAME not in v:
+				continue
+			interfaces = parse_interfaces(v) if hydrate else {name: {} for name in v}
+			m = self.modems_by_path.get(k)
+			if m is None:
+				self.modems_by_path[k] = MMModem(object_path=k, bus=self._dbus.attached_bus, interfaces=interfaces)
+			else:
+				m.set_interfaces(interfaces)
+			if hydrate:
+				self.index.update(k, interfaces[MODEM_INTERFACE_NAME])
 		return self.modems
 
+	def get(self, object_path: str) -> Optional[MMModem]:
+		"""Returns the known modem of the given object path, if any."""
+		return self.modems_by_path.get(object_path)
+
+	def build_index(self) -> None:
+		"""Refreshes the modems with their properties and indexes them, with the identifiers of their SIM cards."""
+		self.get_modems(hydrate=True)
+		for m in self.modems:
+			self.index_modem(m)
+
+	def index_modem(self, modem: MMModem) -> None:
+		"""
+		Indexes a modem under its identifiers and those of its SIM card, reading the properties not already known.
+
+		Sets :py:attr:`MMModem.sim` and hydrates the Modem interface properties of the modem.
+		"""
+		properties = modem.interfaces.get(MODEM_INTERFACE_NAME)
+		if not properties:
+			properties = modem.interfaces[MODEM_INTERFACE_NAME] = parse_properties(MODEM_INTERFACE_NAME, modem._properties_get_all(MODEM_INTERFACE_NAME))
+		values = {key: properties.get(key) for key in MODEM_INDEX_KEYS}
+		sim_path = properties.get('sim_object_path')
+		if sim_path and sim_path != '/':
+			modem.sim = _proxy(MMSim, sim_path, self._dbus.attached_bus)
+			values.update(parse_properties(SIM_INTERFACE_NAME, modem.sim._properties_get_all(SIM_INTERFACE_NAME)))
+		else:
+			modem.sim = None
+			values.update(sim_identifier=None, imsi=None)
+		if modem._dbus.object_path in self.modems_by_path:
+			self.index.update(modem._dbus.object_path, values)
+
+	def find(self, key: str, value: Any) -> Optional[MMModem]:
+		"""
+		Returns the modem with the given identifier, for example ``find('equipment_identifier', imei)``.
+
+		The index is filled by :py:meth:`build_index`, the Modem interface identifiers also by ``get_modems(hydrate=True)``.
+
+		:param key: One of ``equipment_identifier``, ``device_identifier``, ``primary_port``, ``sim_identifier`` or ``imsi``.
+		"""
+		object_path = self.index.find(key, value)
+		return self.modems_by_path.get(object_path) if object_path is not None else None
+
 	def get_first(self) -> Optional[MMModem]:
-		if len(self.modems) <= 0:
+		if not self.modems_by_path:
 			self.get_modems()
-		return self.modems[0] if len(self.modems) >= 1 else None
+		return next(iter(self.modems_by_path.values()), None)
 
 
 class MMSim(MMSimInterface):
@@ -158,6 +415,10 @@ class MMSim(MMSimInterface):
 
 
 class MMBearer(MMBearerInterface):
+	ip4_config_values = plain_values('ip4_config')
+	ip6_config_values = plain_values('ip6_config')
+	stats_values = plain_values('stats')
+	properties_values = plain_values('properties')
 
 	def __init__(
 		self,
@@ -171,7 +432,16 @@ class MMBearer(MMBearerInterface):
 		super().__init__(MODEM_MANAGER_SERVICE_NAME, object_path, bus)
 
 
+class CallStateTransition(NamedTuple):
+	"""A StateChanged signal of a call, with the :py:func:`time.monotonic` time it was received at."""
+	old: int
+	new: int
+	reason: int
+	timestamp: float
+
+
 class MMCall(MMCallInterface):
+	audio_format_values = plain_values('audio_format')
 
 	def __init__(
 		self,
@@ -187,74 +457,65 @@ class MMCall(MMCallInterface):
 	@property
 	def state_text(self) -> str:
 		"""A MMCallState name, describing the state of the call."""
-		return MMCallState(self.state).name
+		return enum_name(MMCallState, self.state)
 
 	@property
 	def state_reason_text(self) -> str:
 		"""A MMCallStateReason name, describing why the state is changed."""
-		return MMCallStateReason(self.state_reason).name
+		return enum_name(MMCallStateReason, self.state_reason)
 
 	@property
 	def direction_text(self) -> str:
 		"""A MMCallDirection name, describing the direction of the call."""
-		return MMCallDirection(self.direction).name
-
-
-class MMModem3gpp(MMModem3gppInterface):
-
-	def __init__(self, object_path: str, bus: Optional[SdBus] = None) -> None:
-		super().__init__(MODEM_MANAGER_SERVICE_NAME, object_path, bus)
-
-
-class MMModemTime(MMModemTimeInterface):
+		return enum_name(MMCallDirection, self.direction)
 
-	def __init__(self, object_path: str, bus: Optional[SdBus] = None) -> None:
-		super().__init__(MODEM_MANAGER_SERVICE_NAME, object_path, bus)
-
-
-class MMModemLocation(MMModemLocationInterface):
-
-	def __init__(self, object_path: str, bus: Optional[SdBus] = None) -> None:
-		super().__init__(MODEM_MANAGER_SERVICE_NAME, object_path, bus)
-
-	def configure(self, sources_to_enable: list[MMModemLocationSource], enable_signaling: bool = False):
-		bitmask = 0
-		for src in sources_to_enable:
-			bitmask |= src
-		super().setup(bitmask, enable_signaling)
-
-	@property
-	def enabled_list(self) -> List[MMModemLocationSource]:
-		bitmask = super().enabled
-		return [src for src in MMModemLocationSource if src & bitmask]
-
-	@property
-	def capabilities_list(self) -> List[MMModemLocationSource]:
-		bitmask = super().capabilities
-		return [src for src in MMModemLocationSource if src & bitmask]
-
-	@property
-	def source_map(self) -> dict[MMModemLocationSource, Any]:
+	def wait_for_state(
+		self,
+		states: Iterable[int],
+		timeout: Optional[float] = None,
+		history: Optional[List[CallStateTransition]] = None,
+		dispatcher: Optional['MMSignalDispatcher'] = None,
+	) -> int:
 		"""
-        Returns dictionary of parsed get_location call, where keys are MMModemLocationSource
-        """
-
-		def build_dict(raw_dict):
-			new_dict: dict[str, Any] = {}
-			for k, v in raw_dict.items():
-				val = v
-				if isinstance(v, tuple):
-					val = v[1]
-				new_dict[k] = build_dict(val) if isinstance(val, dict) else val
-			return new_dict
-
-		src_map: dict[MMModemLocationSource, Any] = {}
-		for k, v in super().get_location().items():
-			# get the enum corresponding to bit k
-			key = MMModemLocationSource(k)
-			value = v
-			if isinstance(v, tuple):
-				value = v[1]
-			src_map[key] = build_dict(value) if isinstance(value, dict) else value
+		Waits for the call to reach one of ``states``, :py:class:`MMCallState` values, from its StateChanged signals.
 
-		return src_map
+		:param timeout: Seconds to wait, forever if ``None``. :py:class:`TimeoutError` is raised after it.
+		:param history: List to which the transitions received while waiting are appended.
+		:param dispatcher: Dispatcher running the callbacks of the application while waiting, \
+			a private one on the bus of the call if ``None``.
+		:return: The state reached, which is the current state if it is already one of ``states``.
+		"""
+		# The dispatcher module imports this one
+		from .dispatcher import MMSignalDispatcher
+
+		wanted = set(states)
+		reached: List[int] = []
+
+		def state_changed(old: int, new: int, reason: int) -> None:
+			if history is not None and not reached:
+				history.append(CallStateTransition(old, new, reason, monotonic()))
+			if not reached and new in wanted:
+				reached.append(new)
+
+		own = dispatcher is None
+		if dispatcher is None:
+			dispatcher = MMSignalDispatcher(self._dbus.attached_bus)
+		# The match is added before reading the state, so that no transition is missed in between
+		slot = dispatcher.on_call_state_changed(self, state_changed)
+		try:
+			state = self.state
+			if state in wanted:
+				return state
+			deadline = None if timeout is None else monotonic() + timeout
+			# Transitions read along with the state are queued by sd-bus, and run_once returns once they are dispatched
+			while not reached:
+				remaining = None if deadline is None else deadline - monotonic()
+				if remaining is not None and remaining <= 0:
+					raise TimeoutError(f'Call {self._dbus.object_path} did not reach any of the states {sorted(wanted)}')
+				dispatcher.run_once(remaining)
+			return reached[0]
+		finally:
+			if own:
+				dispatcher.close()
+			else:
+				dispatcher.remove_match(slot)
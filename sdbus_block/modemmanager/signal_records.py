@@ -0,0 +1,122 @@
+from array import array
+from itertools import zip_longest
+from math import nan
+from typing import Any, Dict, Optional, Tuple, Type, TypeVar
+
+R = TypeVar('R', bound='SignalRecord')
+
+
+class SignalRecord:
+	"""
+	Extended signal values of one access technology, decoded from the ``a{sv}`` dictionary of :py:class:`MMModemSignal`.
+
+	Attributes are the dictionary keys with dashes replaced by underscores, ``None`` for values the modem did not report.
+	"""
+	__slots__: Tuple[str, ...] = ()
+	#: D-Bus dictionary keys, in slot order
+	keys: Tuple[str, ...] = ()
+	_index: Dict[str, int] = {}
+	_blank = array('d')
+
+	def __init_subclass__(cls) -> None:
+		super().__init_subclass__()
+		cls._index = {key: index for index, key in enumerate(cls.keys)}
+		cls._blank = array('d', (nan, ) * len(cls.keys))
+
+	def __init__(self, *values: Optional[float]) -> None:
+		"""Takes the values in slot order, ``None`` for the missing trailing ones."""
+		if len(values) > len(type(self).__slots__):
+			raise TypeError(f'{type(self).__name__} takes at most {len(type(self).__slots__)} values')
+		for name, value in zip_longest(type(self).__slots__, values):
+			setattr(self, name, value)
+
+	@classmethod
+	def decode(cls: Type[R], values: Dict[str, Tuple[str, Any]]) -> R:
+		"""Decodes the dictionary of a signal property, ignoring keys the record does not know."""
+		fields: list = [None] * len(cls.keys)
+		index = cls._index
+		for key, (_, value) in values.items():
+			slot = index.get(key)
+			if slot is not None:
+				fields[slot] = value
+		return cls(*fields)
+
+	@classmethod
+	def decode_row(cls, values: Dict[str, Tuple[str, Any]], row: Optional['array[float]'] = None, offset: int = 0) -> 'array[float]':
+		"""
+		Decodes the dictionary of a signal property into a row of doubles in :py:attr:`keys` order, ``nan`` for missing values.
+
+		:param row: Array to write the values to, for example a preallocated buffer of samples. A new array by default.
+		:param offset: Position of the row in ``row``.
+		"""
+		if row is None:
+			row = array('d', cls._blank)
+		else:
+			row[offset:offset + len(cls._blank)] = cls._blank
+		index = cls._index
+		for key, (_, value) in values.items():
+			slot = index.get(key)
+			if slot is not None:
+				row[offset + slot] = value
+		return row
+
+	def as_dict(self) -> Dict[str, Optional[float]]:
+		"""Returns the values by attribute name."""
+		return {name: getattr(self, name) for name in type(self).__slots__}
+
+	def __eq__(self, other: object) -> bool:
+		if type(other) is not type(self):
+			return NotImplemented
+		return self.as_dict() == other.as_dict()  # type: ignore[attr-defined]
+
+	__hash__ = None  # type: ignore[assignment]
+
+	def __repr__(self) -> str:
+		return f'{type(self).__name__}({self.as_dict()!r})'
+
+
+class CdmaSignal(SignalRecord):
+	"""Signal of the CDMA1x access technology."""
+	__slots__ = ('rssi', 'ecio', 'error_rate')
+	keys = ('rssi', 'ecio', 'error-rate')
+
+
+class EvdoSignal(SignalRecord):
+	"""Signal of the CDMA EV-DO access technology."""
+	__slots__ = ('rssi', 'ecio', 'sinr', 'io', 'error_rate')
+	keys = ('rssi', 'ecio', 'sinr', 'io', 'error-rate')
+
+
+class GsmSignal(SignalRecord):
+	"""Signal of the GSM/GPRS access technology."""
+	__slots__ = ('rssi', 'error_rate')
+	keys = ('rssi', 'error-rate')
+
+
+class UmtsSignal(SignalRecord):
+	"""Signal of the UMTS (WCDMA) access technology."""
+	__slots__ = ('rssi', 'rscp', 'ecio', 'error_rate')
+	keys = ('rssi', 'rscp', 'ecio', 'error-rate')
+
+
+class LteSignal(SignalRecord):
+	"""Signal of the LTE access technology."""
+	__slots__ = ('rssi', 'rsrq', 'rsrp', 'snr', 'error_rate')
+	keys = ('rssi', 'rsrq', 'rsrp', 'snr', 'error-rate')
+
+
+class Nr5gSignal(SignalRecord):
+	"""Signal of the 5G access technology."""
+	__slots__ = ('rsrq', 'rsrp', 'snr', 'error_rate')
+	keys = ('rsrq', 'rsrp', 'snr', 'error-rate')
+
+
+#: Record classes by :py:class:`MMModemSignal` property name
+SIGNAL_RECORDS: Dict[str, Type[SignalRecord]] = {
+	'cdma': CdmaSignal,
+	'evdo': EvdoSignal,
+	'gsm': GsmSignal,
+	'umts': UmtsSignal,
+	'lte': LteSignal,
+	'nr5g': Nr5gSignal,
+}
@@ -0,0 +1,148 @@
+from typing import Any, Dict, Tuple, Type, TypeVar
+
+from sdbus import DbusInterfaceCommon
+
+from .enums import MMBearerIpFamily, MMCallDirection, MMCallState, MMCallStateReason, MMModemAccessTechnology, MMModemBand, MMModemCapability, MMModemMode, MMModemPowerState, MMModemState, MMModemStateFailedReason, MMSimEsimStatus, MMSimRemovability, MMSimType, MMSmsDeliveryState, MMSmsPduType, MMSmsState
+from .interfaces_bearer import MMBearerInterface
+from .interfaces_call import MMCallInterface
+from .interfaces_modem import MMModemInterface
+from .interfaces_sim import MMSimInterface
+from .interfaces_sms import MMSmsInterface
+from .properties import interface_name, parse_properties, property_names
+
+S = TypeVar('S', bound='Snapshot')
+
+
+def _slots(interface: type) -> Tuple[str, ...]:
+	return tuple(property_names(interface).values())
+
+
+def _convert(enum: type, value: Any) -> Any:
+	"""Converts an enumerated value, or each value of a list or tuple of them, keeping values that are not members."""
+	if isinstance(value, (list, tuple)):
+		return type(value)(_convert(enum, item) for item in value)
+	try:
+		return enum(value)
+	except ValueError:
+		return value
+
+
+class Snapshot:
+	"""
+	Immutable set of the properties of one interface of an object, as read by a single GetAll.
+
+	Attributes are the python property names of the interface class, ``None`` for properties the service did not return.
+	Enumerated values, alone or in lists and tuples, are converted to the enums of :py:mod:`.enums` when they are
+	valid members. Snapshots compare equal when their class, object path and values are equal, and can be pickled.
+	"""
+	__slots__ = ('object_path', )
+	_interface: type = DbusInterfaceCommon
+	_enums: Dict[str, type] = {}
+
+	def __init__(self, object_path: str, properties: Dict[str, Any]) -> None:
+		"""
+		:param object_path: Object path the properties were read from.
+		:param properties: Python property names to values, as returned by :py:func:`parse_properties`.
+		"""
+		object.__setattr__(self, 'object_path', object_path)
+		for name in type(self).__slots__:
+			value = properties.get(name)
+			enum = self._enums.get(name)
+			if enum is not None and value is not None:
+				value = _convert(enum, value)
+			object.__setattr__(self, name, value)
+
+	@classmethod
+	def from_proxy(cls: Type[S], proxy: DbusInterfaceCommon) -> S:
+		"""Reads the properties of a proxy object with one GetAll call."""
+		name = interface_name(cls._interface)
+		return cls(proxy._dbus.object_path, parse_properties(name, proxy._properties_get_all(name)))
+
+	def as_dict(self) -> Dict[str, Any]:
+		"""Returns the properties by python property name."""
+		return {name: getattr(self, name) for name in type(self).__slots__}
+
+	def __setattr__(self, name: str, value: Any) -> None:
+		raise AttributeError(f'{type(self).__name__} is immutable')
+
+	def __delattr__(self, name: str) -> None:
+		raise AttributeError(f'{type(self).__name__} is immutable')
+
+	def __reduce__(self) -> Tuple[type, Tuple[str, Dict[str, Any]]]:
+		return type(self), (self.object_path, self.as_dict())
+
+	def __eq__(self, other: object) -> bool:
+		if type(other) is not type(self):
+			return NotImplemented
+		return self.object_path == other.object_path and self.as_dict() == other.as_dict()  # type: ignore[attr-defined]
+
+	__hash__ = None  # type: ignore[assignment]
+
+	def __repr__(self) -> str:
+		return f'{type(self).__name__}({self.object_path!r}, {self.as_dict()!r})'
+
+
+class ModemSnapshot(Snapshot):
+	"""
+	Properties of the :py:class:`MMModemInterface` interface of a modem.
+
+	Combinations of capabilities are not members of :py:class:`MMModemCapability` and are kept as integers.
+	"""
+	__slots__ = _slots(MMModemInterface)
+	_interface = MMModemInterface
+	_enums = {
+		'supported_capabilities': MMModemCapability,
+		'current_capabilities': MMModemCapability,
+		'state': MMModemState,
+		'state_failed_reason': MMModemStateFailedReason,
+		'access_technologies': MMModemAccessTechnology,
+		'power_state': MMModemPowerState,
+		'supported_modes': MMModemMode,
+		'current_modes': MMModemMode,
+		'supported_bands': MMModemBand,
+		'current_bands': MMModemBand,
+		'supported_ip_families': MMBearerIpFamily,
+	}
+
+
+class SimSnapshot(Snapshot):
+	"""Properties of a SIM card."""
+	__slots__ = _slots(MMSimInterface)
+	_interface = MMSimInterface
+	_enums = {
+		'sim_type': MMSimType,
+		'esim_status': MMSimEsimStatus,
+		'removability': MMSimRemovability,
+	}
+
+
+class BearerSnapshot(Snapshot):
+	"""
+	Properties of a bearer.
+
+	The IP family and the other settings of the bearer are variants of its ``properties`` dictionary, kept as read.
+	"""
+	__slots__ = _slots(MMBearerInterface)
+	_interface = MMBearerInterface
+
+
+class SmsSnapshot(Snapshot):
+	"""Properties of an SMS message."""
+	__slots__ = _slots(MMSmsInterface)
+	_interface = MMSmsInterface
+	_enums = {
+		'state': MMSmsState,
+		'pdu_type': MMSmsPduType,
+		'delivery_state': MMSmsDeliveryState,
+	}
+
+
+class CallSnapshot(Snapshot):
+	"""Properties of a call."""
+	__slots__ = _slots(MMCallInterface)
+	_interface = MMCallInterface
+	_enums = {
+		'state': MMCallState,
+		'state_reason': MMCallStateReason,
+		'direction': MMCallDirection,
+	}
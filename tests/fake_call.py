@@ -0,0 +1,45 @@
+"""Call of a fake ModemManager on the session bus, run by the tests in a subprocess as blocking calls hold the GIL."""
+import sys
+from asyncio import get_running_loop, run
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sdbus import dbus_property_async_override, sd_bus_open_user  # noqa: E402
+
+from sdbus_async.modemmanager.interfaces_call import MMCallInterfaceAsync  # noqa: E402
+from sdbus_async.modemmanager.objects import MODEM_MANAGER_SERVICE_NAME  # noqa: E402
+
+CALL_PATH = '/org/freedesktop/ModemManager1/Call/1'
+
+
+class FakeCall(MMCallInterfaceAsync):
+	"""Call moving to the next state each time its ``state`` is read, the StateChanged signal sent before the reply of the old state."""
+
+	def __init__(self) -> None:
+		super().__init__()
+		self.current = 0
+
+	@dbus_property_async_override()
+	def state(self) -> int:
+		self.change()
+		return self.current - 1
+
+	def change(self) -> None:
+		self.current += 1
+		self.state_changed.emit((self.current - 1, self.current, 0))
+
+
+async def main() -> None:
+	bus = sd_bus_open_user()
+	call = FakeCall()
+	call.export_to_dbus(CALL_PATH, bus)
+	await bus.request_name_async(MODEM_MANAGER_SERVICE_NAME, 0)
+	print('ready', flush=True)
+	# Each line read changes the state
+	while await get_running_loop().run_in_executor(None, sys.stdin.readline):
+		call.change()
+
+
+if __name__ == '__main__':
+	run(main())
@@ -0,0 +1,200 @@
+"""
+Fake ModemManager service, exported on the session bus of the tests.
+
+Run as a script, it exports modem 0 with an SMS and a call in a subprocess, as blocking calls hold the GIL.
+"""
+import sys
+from asyncio import get_running_loop, run
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterator
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sdbus import DbusObjectManagerInterfaceAsync, dbus_method_async_override, dbus_property_async_override, sd_bus_open_user  # noqa: E402
+from sdbus.dbus_proxy_async_property import DbusPropertyAsync  # noqa: E402
+from sdbus.exceptions import DbusInvalidArgsError  # noqa: E402
+from sdbus.sd_bus_internals import SdBus  # noqa: E402
+
+from sdbus_async.modemmanager.interfaces_call import MMCallInterfaceAsync  # noqa: E402
+from sdbus_async.modemmanager.interfaces_modem import MMModemInterfaceAsync, MMModemMessagingInterfaceAsync, MMModemVoiceInterfaceAsync  # noqa: E402
+from sdbus_async.modemmanager.interfaces_sim import MMSimInterfaceAsync  # noqa: E402
+from sdbus_async.modemmanager.interfaces_sms import MMSmsInterfaceAsync  # noqa: E402
+from sdbus_async.modemmanager.objects import MODEM_MANAGER_SERVICE_NAME  # noqa: E402
+
+MANAGER_PATH = '/org/freedesktop/ModemManager1'
+MODEM_PATH = '/org/freedesktop/ModemManager1/Modem/{}'
+SIM_PATH = '/org/freedesktop/ModemManager1/SIM/{}'
+SMS_PATH = '/org/freedesktop/ModemManager1/SMS/{}'
+CALL_PATH = '/org/freedesktop/ModemManager1/Call/{}'
+
+
+def _types(signature: str) -> Iterator[str]:
+	"""Splits a D-Bus signature into its complete types."""
+	start = depth = 0
+	for index, code in enumerate(signature):
+		if code in '({':
+			depth += 1
+		elif code in ')}':
+			depth -= 1
+		if depth == 0 and code != 'a':
+			yield signature[start:index + 1]
+			start = index + 1
+
+
+def default(signature: str) -> Any:
+	"""Returns a zero value of a D-Bus type."""
+	if signature == 'ay':
+		return b''
+	if signature.startswith('a{'):
+		return {}
+	if signature.startswith('a'):
+		return []
+	if signature.startswith('('):
+		return tuple(default(member) for member in _types(signature[1:-1]))
+	return {'s': '', 'o': '/', 'b': False, 'd': 0.0, 'v': ('s', '')}.get(signature, 0)
+
+
+def _getter(name: str, signature: str) -> Any:
+
+	def getter(self: Any) -> Any:
+		self.gets[name] += 1
+		return self.values.get(name, default(signature))
+
+	getter.__name__ = name
+	return dbus_property_async_override()(getter)
+
+
+@lru_cache(maxsize=None)
+def fake(*interfaces: type) -> type:
+	"""
+	Builds a service class of the interfaces whose properties are read from its ``values`` dictionary,
+	counting the reads of each property in ``gets``.
+	"""
+	namespace: Dict[str, Any] = {}
+	for interface in interfaces:
+		for cls in interface.__mro__:
+			for name, member in vars(cls).items():
+				if isinstance(member, DbusPropertyAsync) and name not in namespace:
+					namespace[name] = _getter(name, member.property_signature)
+
+	def __init__(self: Any, **values: Any) -> None:
+		super(service, self).__init__()
+		self.values = values
+		self.gets: 'Counter[str]' = Counter()
+
+	namespace['__init__'] = __init__
+	service = type('Fake' + ''.join(interface.__name__ for interface in interfaces), interfaces, namespace)
+	return service
+
+
+def change(service: Any, name: str, value: Any) -> None:
+	"""Sets a property of a service object and emits its PropertiesChanged signal."""
+	service.values[name] = value
+	member = getattr(type(service), name)
+	service.properties_changed.emit((member.interface_name, {member.property_name: (member.property_signature, value)}, []))
+
+
+class FakeMessaging(MMModemMessagingInterfaceAsync):
+	"""Messaging interface deleting the messages of its :py:class:`FakeModemManager`."""
+	manager: 'FakeModemManager'
+
+	@dbus_method_async_override()
+	async def delete(self, path: str) -> None:
+		self.manager.remove(path)
+		change(self, 'messages', [message for message in self.values.get('messages', []) if message != path])
+		self.deleted.emit(path)
+
+
+class FakeVoice(MMModemVoiceInterfaceAsync):
+	"""Voice interface deleting the calls of its :py:class:`FakeModemManager`."""
+	manager: 'FakeModemManager'
+
+	@dbus_method_async_override()
+	async def delete_call(self, path: str) -> None:
+		self.manager.remove(path)
+		change(self, 'call_object_paths', [call for call in self.values.get('call_object_paths', []) if call != path])
+		self.call_deleted.emit(path)
+
+
+FakeSim = fake(MMSimInterfaceAsync)
+FakeSms = fake(MMSmsInterfaceAsync)
+FakeCall = fake(MMCallInterfaceAsync)
+
+
+class FakeModemManager(DbusObjectManagerInterfaceAsync):
+	"""ObjectManager of the fake modems."""
+
+	def __init__(self, bus: SdBus) -> None:
+		super().__init__()
+		self.bus = bus
+		self.objects: Dict[str, Any] = {}
+		self.handles: Dict[str, Any] = {}
+		self.export_to_dbus(MANAGER_PATH, bus)
+
+	async def start(self) -> None:
+		await self.bus.request_name_async(MODEM_MANAGER_SERVICE_NAME, 0)
+
+	def add_modem(self, index: int, messaging: bool = False, voice: bool = False, **values: Any) -> Any:
+		"""Exports a modem, with the Messaging and Voice interfaces or not, announced by the InterfacesAdded signal."""
+		interfaces = (MMModemInterfaceAsync, ) + ((FakeMessaging, ) if messaging else ()) + ((FakeVoice, ) if voice else ())
+		modem = fake(*interfaces)(**values)
+		modem.manager = self
+		self.objects[MODEM_PATH.format(index)] = modem
+		self.handles[MODEM_PATH.format(index)] = self.export_with_manager(MODEM_PATH.format(index), modem, self.bus)
+		return modem
+
+	def add_sim(self, index: int, **values: Any) -> Any:
+		"""Exports a SIM card."""
+		sim = FakeSim(**values)
+		self.objects[SIM_PATH.format(index)] = sim
+		sim.export_to_dbus(SIM_PATH.format(index), self.bus)
+		return sim
+
+	def add_sms(self, modem: Any, index: int, received: bool = False, **values: Any) -> Any:
+		"""Exports a message of a modem, announced by its Added signal."""
+		sms = FakeSms(**values)
+		self.objects[SMS_PATH.format(index)] = sms
+		self.handles[SMS_PATH.format(index)] = sms.export_to_dbus(SMS_PATH.format(index), self.bus)
+		change(modem, 'messages', modem.values.get('messages', []) + [SMS_PATH.format(index)])
+		modem.added.emit((SMS_PATH.format(index), received))
+		return sms
+
+	def add_call(self, modem: Any, index: int, **values: Any) -> Any:
+		"""Exports a call of a modem, announced by its CallAdded signal."""
+		call = FakeCall(**values)
+		self.objects[CALL_PATH.format(index)] = call
+		self.handles[CALL_PATH.format(index)] = call.export_to_dbus(CALL_PATH.format(index), self.bus)
+		change(modem, 'call_object_paths', modem.values.get('call_object_paths', []) + [CALL_PATH.format(index)])
+		modem.call_added.emit(CALL_PATH.format(index))
+		return call
+
+	def remove(self, path: str) -> None:
+		"""Unexports a message or a call."""
+		if path not in self.objects:
+			raise DbusInvalidArgsError(f'No object at {path}')
+		del self.objects[path]
+		self.handles.pop(path).stop()
+
+	def remove_modem(self, index: int) -> None:
+		"""Removes a modem, announced by the InterfacesRemoved signal."""
+		del self.objects[MODEM_PATH.format(index)]
+		self.handles.pop(MODEM_PATH.format(index)).stop()
+
+
+async def main() -> None:
+	bus = sd_bus_open_user()
+	service = FakeModemManager(bus)
+	modem = service.add_modem(0, messaging=True, voice=True)
+	service.add_sms(modem, 0)
+	service.add_call(modem, 0)
+	await service.start()
+	print('ready', flush=True)
+	# Serves until the standard input is closed
+	while await get_running_loop().run_in_executor(None, sys.stdin.readline):
+		pass
+
+
+if __name__ == '__main__':
+	run(main())
@@ -0,0 +1,69 @@
+import sys
+from pathlib import Path
+from subprocess import PIPE, Popen
+
+from sdbus import sd_bus_open_user
+from sdbus.exceptions import SdBusBaseError
+from sdbus.unittest import IsolatedDbusTestCase
+
+from sdbus_block.modemmanager import MMBatch, MMModem, MMModemMessaging, bus_loop, close_bus_loop
+
+from .fake_modem_manager import MODEM_PATH, SMS_PATH
+
+
+class TestBatch(IsolatedDbusTestCase):
+
+	def setUp(self) -> None:
+		super().setUp()
+		self.service = Popen((sys.executable, str(Path(__file__).with_name('fake_modem_manager.py'))), stdin=PIPE, stdout=PIPE, text=True)
+		self.addCleanup(self.service.wait)
+		self.addCleanup(self.service.stdin.close)
+		self.assertEqual(self.service.stdout.readline(), 'ready\n')
+		self.bus = sd_bus_open_user()
+		self.addCleanup(close_bus_loop, self.bus)
+		self.modem = MMModem(MODEM_PATH.format(0), self.bus)
+
+	def test_replies_collected_on_exit(self) -> None:
+		messaging = MMModemMessaging(MODEM_PATH.format(0), self.bus)
+		with self.modem.batch() as batch:
+			state = batch.get('state')
+			messages = batch.get('messages', proxy=messaging)
+			self.assertFalse(state.done())
+			with self.assertRaises(RuntimeError):
+				state.result()
+		self.assertTrue(state.done())
+		self.assertEqual(state.result(), 0)
+		self.assertEqual(messages.result(), [SMS_PATH.format(0)])
+
+	def test_errors_raised_by_their_reply(self) -> None:
+		batch = MMBatch(self.modem)
+		missing = batch.get('state', proxy=MMModem(MODEM_PATH.format(9), self.bus))
+		deleted = batch.call('delete', path=SMS_PATH.format(0), proxy=MMModemMessaging(MODEM_PATH.format(0), self.bus))
+		state = batch.get('state')
+		batch.wait()
+		with self.assertRaises(SdBusBaseError):
+			missing.result()
+		self.assertEqual(deleted.result(), None)
+		self.assertEqual(state.result(), 0)
+		with self.modem.batch() as batch:
+			deleted = batch.call('delete', SMS_PATH.format(0), proxy=MMModemMessaging(MODEM_PATH.format(0), self.bus))
+		with self.assertRaises(SdBusBaseError):
+			deleted.result()
+
+	def test_members_checked_when_queued(self) -> None:
+		batch = MMBatch(self.modem)
+		with self.assertRaises(TypeError):
+			batch.get('enable')
+		with self.assertRaises(TypeError):
+			batch.call('state')
+		with self.assertRaises(AttributeError):
+			batch.get('missing')
+		with self.assertRaises(TypeError):
+			batch.call('enable', True, False)
+
+	def test_loop_closed_with_bus(self) -> None:
+		loop = bus_loop(self.bus)
+		self.assertIs(bus_loop(self.bus), loop)
+		close_bus_loop(self.bus)
+		self.assertTrue(loop.is_closed())
+		close_bus_loop(self.bus)
@@ -0,0 +1,61 @@
+from typing import Any, Callable, Optional
+
+from sdbus import dbus_property_async_override
+from sdbus.unittest import IsolatedDbusTestCase
+
+from sdbus_async.modemmanager import MMModem, MMPropertyCache
+from sdbus_async.modemmanager.interfaces_modem import MMModemInterfaceAsync
+from sdbus_async.modemmanager.objects import MODEM_INTERFACE_NAME, MODEM_MANAGER_SERVICE_NAME
+
+from .fake_modem_manager import MODEM_PATH, change, fake
+
+
+class RacingModem(fake(MMModemInterfaceAsync)):  # type: ignore[misc]
+	"""Modem running ``during_get_all`` while it replies to GetAll, before the values of the reply are sent."""
+	during_get_all: Optional[Callable[[], Any]] = None
+
+	@dbus_property_async_override()
+	def unlock_required(self) -> int:
+		if self.during_get_all is not None:
+			self.during_get_all()
+		return 0
+
+
+class TestPropertyCache(IsolatedDbusTestCase):
+
+	async def asyncSetUp(self) -> None:
+		await super().asyncSetUp()
+		self.service = RacingModem(state=8, signal_quality=(40, True))
+		self.service.export_to_dbus(MODEM_PATH.format(0), self.bus)
+		await self.bus.request_name_async(MODEM_MANAGER_SERVICE_NAME, 0)
+		self.cache = MMPropertyCache(MMModem(MODEM_PATH.format(0), self.bus))
+
+	async def test_warmed_with_get_all(self) -> None:
+		async with self.cache:
+			self.assertEqual(self.cache.values['state'], 8)
+			gets = self.service.gets['state']
+			self.assertEqual(await self.cache.get('state'), 8)
+			self.assertEqual(self.service.gets['state'], gets)
+
+	async def test_changes_signalled_during_warm_up_kept(self) -> None:
+		self.service.during_get_all = lambda: change(self.service, 'state', 9)
+		async with self.cache:
+			self.assertEqual(self.cache.values['state'], 9)
+
+	async def test_invalidations_signalled_during_warm_up_kept(self) -> None:
+		self.service.during_get_all = lambda: self.service.properties_changed.emit((MODEM_INTERFACE_NAME, {}, ['SignalQuality']))
+		async with self.cache:
+			self.assertNotIn('signal_quality', self.cache)
+			self.assertIn('state', self.cache)
+
+	async def test_invalidate_during_warm_up_kept(self) -> None:
+		self.service.during_get_all = lambda: self.cache.invalidate('signal_quality')
+		async with self.cache:
+			self.assertNotIn('signal_quality', self.cache)
+			self.service.values['signal_quality'] = (50, True)
+			self.assertEqual(await self.cache.get('signal_quality'), (50, True))
+
+	async def test_invalidate_all_during_warm_up_kept(self) -> None:
+		self.service.during_get_all = lambda: self.cache.invalidate()
+		async with self.cache:
+			self.assertEqual(self.cache.values, {})
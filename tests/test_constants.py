@@ -0,0 +1,50 @@
+from sdbus.unittest import IsolatedDbusTestCase
+
+from sdbus_async.modemmanager import MMModem, MMModemRegistry, MMModems, MMSim
+
+from .fake_modem_manager import MODEM_PATH, SIM_PATH, FakeModemManager
+
+
+class TestConstants(IsolatedDbusTestCase):
+
+	async def asyncSetUp(self) -> None:
+		await super().asyncSetUp()
+		self.service = FakeModemManager(self.bus)
+		self.modem = self.service.add_modem(0, manufacturer='Quectel')
+		await self.service.start()
+
+	async def test_read_once_per_proxy(self) -> None:
+		modem = MMModem(MODEM_PATH.format(0), self.bus)
+		gets = self.modem.gets['manufacturer']
+		self.assertEqual(await modem.manufacturer, 'Quectel')
+		self.modem.values['manufacturer'] = 'Sierra'
+		self.assertEqual(await modem.manufacturer, 'Quectel')
+		self.assertEqual(self.modem.gets['manufacturer'], gets + 1)
+		self.assertEqual(await MMModem(MODEM_PATH.format(0), self.bus).manufacturer, 'Sierra')
+
+	async def test_forgotten_when_modem_vanishes(self) -> None:
+		manager = MMModems(self.bus)
+		modem, = await manager.get_modems()
+		self.assertEqual(await modem.manufacturer, 'Quectel')
+		self.service.remove_modem(0)
+		self.assertEqual(await manager.get_modems(), [])
+		# ModemManager reuses the path
+		self.service.add_modem(0, manufacturer='Sierra')
+		self.assertEqual(await modem.manufacturer, 'Sierra')
+
+	async def test_forgotten_when_registry_removes_modem(self) -> None:
+		async with MMModemRegistry(self.bus) as registry:
+			modem = registry.get(MODEM_PATH.format(0))
+			self.assertEqual(await modem.manufacturer, 'Quectel')
+			self.service.remove_modem(0)
+			self.assertIs(await registry.wait_removed(), modem)
+			self.service.add_modem(0, manufacturer='Sierra')
+			self.assertEqual(await (await registry.wait_added()).manufacturer, 'Sierra')
+			self.assertEqual(await modem.manufacturer, 'Sierra')
+
+	async def test_sim_identifier_not_cached(self) -> None:
+		service = self.service.add_sim(0, sim_identifier='8900')
+		sim = MMSim(SIM_PATH.format(0), self.bus)
+		self.assertEqual(await sim.sim_identifier, '8900')
+		service.values['sim_identifier'] = '8901'
+		self.assertEqual(await sim.sim_identifier, '8901')
@@ -0,0 +1,71 @@
+from asyncio import run
+from datetime import datetime, timezone
+from time import time
+from unittest import TestCase
+
+from sdbus_async.modemmanager import MMDeliveryIndex, PropertiesChanged, normalize_number
+from sdbus_async.modemmanager.delivery import SMS_INTERFACE_NAME
+
+MODEM = '/org/freedesktop/ModemManager1/Modem/0'
+SMS = '/org/freedesktop/ModemManager1/SMS/3'
+
+
+class TestDeliveryIndex(TestCase):
+
+	def test_report(self) -> None:
+		index = MMDeliveryIndex()
+		sent_at = round(time()) - 30
+		discharged = datetime.fromtimestamp(sent_at + 12, timezone.utc).isoformat()
+		record = index.add(MODEM, '+33 6 12 34 56 78', 42, sent_at=sent_at)
+		self.assertIsNone(index.report(MODEM, 43, '+33612345678', 0))
+		self.assertIsNone(index.report('/org/freedesktop/ModemManager1/Modem/1', 42, '+33612345678', 0))
+		# Temporary failure, the service center keeps trying
+		self.assertIs(index.report(MODEM, 42, '+33612345678', 0x30), record)
+		self.assertFalse(record.done)
+		self.assertIsNone(record.latency)
+		self.assertIs(index.report(MODEM, 42, '33612345678', 0x00, discharged), record)
+		self.assertTrue(record.done and record.delivered)
+		self.assertEqual(record.latency, 12.0)
+		latency = index.latency(MODEM)
+		self.assertEqual((latency.delivered, latency.failed, latency.mean, latency.percentile(95)), (1, 0, 12.0, 12.0))
+		# Repeated reports are counted once
+		index.report(MODEM, 42, '+33612345678', 0x00, discharged)
+		self.assertEqual(latency.delivered, 1)
+
+	def test_failed(self) -> None:
+		index = MMDeliveryIndex()
+		record = index.add(MODEM, '+123', 7)
+		index.report(MODEM, 7, '+123', 0x41)
+		self.assertTrue(record.done)
+		self.assertFalse(record.delivered)
+		self.assertEqual(index.latency(MODEM).failed, 1)
+
+	def test_reference_reused(self) -> None:
+		index = MMDeliveryIndex()
+		index.add(MODEM, '+123', 7, SMS)
+		record = index.add(MODEM, '+123', 7)
+		self.assertEqual(len(index), 1)
+		self.assertIs(index.get(MODEM, 7, '123'), record)
+		self.assertIsNone(index.get_by_path(SMS))
+
+	def test_expire(self) -> None:
+		index = MMDeliveryIndex(maxsize=3, max_age=100.0)
+		now = time()
+		for reference in range(5):
+			index.add(MODEM, '+123', reference, sent_at=now - 10 + reference)
+		self.assertEqual([record.message_reference for record in index], [2, 3, 4])
+		self.assertEqual(index.expire(now=now + 92.5), 1)
+		self.assertEqual([record.message_reference for record in index], [3, 4])
+		self.assertEqual(index.expire(now=now + 1000), 2)
+		self.assertEqual(len(index), 0)
+
+	def test_handle_properties_changed(self) -> None:
+		index = MMDeliveryIndex()
+		record = index.add(MODEM, '+123', 7, SMS)
+		event = PropertiesChanged(SMS, MODEM, SMS_INTERFACE_NAME, {'delivery_state': 0x00, 'discharge_timestamp': ''}, [])
+		self.assertIs(run(index.handle(event)), record)
+		self.assertTrue(record.delivered)
+		self.assertIsNone(run(index.handle(PropertiesChanged(SMS, MODEM, SMS_INTERFACE_NAME, {'state': 5}, []))))
+
+	def test_normalize_number(self) -> None:
+		self.assertEqual(normalize_number('+1 (555) 010-9999'), '15550109999')
@@ -0,0 +1,62 @@
+import sys
+from pathlib import Path
+from selectors import EVENT_READ, DefaultSelector
+from subprocess import PIPE, Popen
+from time import monotonic
+from typing import List, Tuple
+
+from sdbus import sd_bus_open_user
+from sdbus.unittest import IsolatedDbusTestCase
+
+from sdbus_block.modemmanager import MMCall, MMSignalDispatcher
+
+from .fake_call import CALL_PATH
+
+
+class TestDispatcher(IsolatedDbusTestCase):
+
+	def setUp(self) -> None:
+		super().setUp()
+		self.service = Popen((sys.executable, str(Path(__file__).with_name('fake_call.py'))), stdin=PIPE, stdout=PIPE, text=True)
+		self.addCleanup(self.service.wait)
+		self.addCleanup(self.service.stdin.close)
+		self.assertEqual(self.service.stdout.readline(), 'ready\n')
+		self.call = MMCall(CALL_PATH, sd_bus_open_user())
+
+	def change_state(self) -> None:
+		self.service.stdin.write('\n')
+		self.service.stdin.flush()
+
+	def test_signals_read_by_blocking_callback(self) -> None:
+		seen: List[Tuple[int, int, int]] = []
+
+		def state_changed(old: int, new: int, reason: int) -> None:
+			seen.append((old, new, reason))
+			if len(seen) == 1:
+				# Reads the next StateChanged signal ahead of the dispatcher
+				self.call.state
+
+		with MMSignalDispatcher(self.call._dbus.attached_bus) as dispatcher:
+			dispatcher.on_call_state_changed(self.call, state_changed)
+			self.change_state()
+			with DefaultSelector() as selector:
+				selector.register(dispatcher.fileno(), EVENT_READ)
+				self.assertTrue(selector.select(5))
+			self.assertEqual(dispatcher.process(), 2)
+		self.assertEqual(seen, [(0, 1, 0), (1, 2, 0)])
+
+	def test_run_once_returns_after_queued_signals(self) -> None:
+		with MMSignalDispatcher(self.call._dbus.attached_bus) as dispatcher:
+			seen: List[int] = []
+			dispatcher.on_call_state_changed(self.call, lambda old, new, reason: seen.append(new))
+			# The signal of the change is read along with the reply
+			self.assertEqual(self.call.state, 0)
+			started = monotonic()
+			self.assertTrue(dispatcher.run_once(5))
+			self.assertEqual(seen, [1])
+			self.assertLess(monotonic() - started, 1)
+
+	def test_wait_for_state_reached_while_reading_state(self) -> None:
+		started = monotonic()
+		self.assertEqual(self.call.wait_for_state([1], timeout=5), 1)
+		self.assertLess(monotonic() - started, 1)
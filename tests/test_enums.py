@@ -0,0 +1,42 @@
+from unittest import TestCase
+
+from sdbus_async.modemmanager import MMBearerIpFamily, MMModemMode, MMModemState, enum_name, flag_members, flag_names
+from sdbus_async.modemmanager.enums import MMModemAccessTechnology, MMModemCapability
+
+IPV4 = MMBearerIpFamily.MM_BEARER_IP_FAMILY_IPV4
+IPV6 = MMBearerIpFamily.MM_BEARER_IP_FAMILY_IPV6
+
+
+class TestEnums(TestCase):
+
+	def test_enum_name(self) -> None:
+		self.assertEqual(enum_name(MMModemState, 8), 'MM_MODEM_STATE_REGISTERED')
+		self.assertEqual(enum_name(MMModemState, -1), 'MM_MODEM_STATE_FAILED')
+		with self.assertRaises(ValueError):
+			enum_name(MMModemState, 99)
+
+	def test_flag_members(self) -> None:
+		self.assertEqual(flag_members(MMBearerIpFamily, IPV4 | IPV6), (IPV4, IPV6))
+		self.assertEqual(flag_members(MMBearerIpFamily, IPV6), (IPV6, ))
+		# Unknown bits are ignored
+		self.assertEqual(flag_members(MMBearerIpFamily, IPV4 | 1 << 20), (IPV4, ))
+		self.assertEqual(flag_members(MMModemCapability, 12), (MMModemCapability.MM_MODEM_CAPABILITY_GSM_UMTS, MMModemCapability.MM_MODEM_CAPABILITY_LTE))
+
+	def test_any_masks(self) -> None:
+		self.assertEqual(flag_names(MMBearerIpFamily, 0xFFFFFFFF), ('MM_BEARER_IP_FAMILY_ANY', ))
+		self.assertEqual(flag_names(MMModemMode, 0xFFFFFFFF), ('MM_MODEM_MODE_ANY', ))
+		self.assertEqual(flag_names(MMModemAccessTechnology, 0xFFFFFFFF), ('MM_MODEM_ACCESS_TECHNOLOGY_ANY', ))
+		self.assertEqual(flag_members(MMModemCapability, 0xFFFFFFFF), (MMModemCapability.MM_MODEM_CAPABILITY_ANY, ))
+
+	def test_zero(self) -> None:
+		self.assertEqual(flag_members(MMBearerIpFamily, 0), ())
+		self.assertEqual(flag_names(MMModemMode, 0), ())
+		self.assertEqual(MMModemCapability.names(0), [])
+
+	def test_flag_names(self) -> None:
+		self.assertEqual(flag_names(MMModemMode, 12), ('MM_MODEM_MODE_3G', 'MM_MODEM_MODE_4G'))
+		self.assertEqual(MMModemCapability.names(8), ['MM_MODEM_CAPABILITY_LTE'])
+
+	def test_caches_bounded(self) -> None:
+		for function in (enum_name, flag_members, flag_names):
+			self.assertIsNotNone(function.cache_info().maxsize)
@@ -0,0 +1,274 @@
+from asyncio import create_task, gather, get_running_loop, run, sleep, wait_for
+from types import SimpleNamespace
+from typing import List, Optional
+from unittest import TestCase
+
+from sdbus.exceptions import DbusLimitsExceededError
+from sdbus.unittest import IsolatedDbusTestCase
+
+from sdbus_async.modemmanager import CallAdded, Event, MMEventHub, MMEventSubscription, ModemAdded, ModemStateChanged, OverflowPolicy, PropertiesChanged, SmsAdded, coalesce_key
+
+from .fake_modem_manager import MODEM_PATH, SMS_PATH, FakeModemManager
+
+MODEM = '/org/freedesktop/ModemManager1/Modem/0'
+MODEM_INTERFACE = 'org.freedesktop.ModemManager1.Modem'
+
+
+def changed(**properties: object) -> PropertiesChanged:
+	return PropertiesChanged(MODEM, MODEM, MODEM_INTERFACE, properties, [])
+
+
+def subscription(**options: object) -> MMEventSubscription:
+	return MMEventSubscription(SimpleNamespace(_subscriptions=[]), **options)  # type: ignore[arg-type]
+
+
+def drain(subscription: MMEventSubscription) -> List[Event]:
+
+	async def main() -> List[Event]:
+		return [await subscription.get() for _ in range(len(subscription))]
+
+	return run(main())
+
+
+class TestCoalesce(TestCase):
+
+	def test_coalesce_key(self) -> None:
+		self.assertEqual(coalesce_key(changed(state=8)), coalesce_key(changed(signal_quality=(70, True))))
+		self.assertNotEqual(coalesce_key(changed(state=8)), coalesce_key(ModemStateChanged(MODEM, MODEM, 7, 8, 0)))
+		self.assertIsNone(coalesce_key(CallAdded(MODEM, MODEM, '/org/freedesktop/ModemManager1/Call/1')))
+
+	def test_merge(self) -> None:
+		events = subscription(policy=OverflowPolicy.COALESCE)
+		events.put(changed(state=7, power_state=3))
+		events.put(ModemStateChanged(MODEM, MODEM, 6, 7, 0))
+		events.put(changed(state=8))
+		events.put(ModemStateChanged(MODEM, MODEM, 7, 8, 1))
+		self.assertEqual(drain(events), [changed(state=8, power_state=3), ModemStateChanged(MODEM, MODEM, 6, 8, 1)])
+		self.assertEqual(events.coalesced, 2)
+
+	def test_drops_events_that_cannot_be_merged_first(self) -> None:
+		events = subscription(maxsize=3, policy=OverflowPolicy.COALESCE)
+		call_added = [CallAdded(MODEM, MODEM, f'/org/freedesktop/ModemManager1/Call/{n}') for n in range(3)]
+		events.put(changed(state=7))
+		events.put(call_added[0])
+		events.put(call_added[1])
+		events.put(call_added[2])
+		self.assertEqual(drain(events), [changed(state=7), call_added[1], call_added[2]])
+		self.assertEqual(events.dropped, 1)
+		# Merged into the queued change, even in a full queue
+		events.put(changed(state=7))
+		events.put(call_added[0])
+		events.put(call_added[1])
+		events.put(changed(state=8))
+		self.assertEqual(drain(events), [changed(state=8), call_added[0], call_added[1]])
+
+
+class TestOverflow(TestCase):
+
+	def test_bounded_by_default(self) -> None:
+		events = subscription()
+		self.assertEqual(events.policy, OverflowPolicy.DROP_OLDEST)
+		for state in range(events.maxsize + 1):
+			events.put(changed(state=state))
+		self.assertEqual(len(events), events.maxsize)
+		self.assertEqual(drain(events)[0], changed(state=1))
+		self.assertEqual(events.dropped, 1)
+
+	def test_unbounded(self) -> None:
+		events = subscription(maxsize=1, policy=OverflowPolicy.UNBOUNDED)
+		events.put(changed(state=7))
+		events.put(changed(state=8))
+		self.assertEqual(len(events), 2)
+		self.assertEqual(events.overflowed, 1)
+
+
+class TestDebounce(TestCase):
+
+	def test_quiet_window(self) -> None:
+
+		async def main() -> None:
+			events = subscription(debounce=0.05)
+			events.put(changed(state=7))
+			await sleep(0.02)
+			events.put(changed(state=8, power_state=3))
+			events.put(ModemStateChanged(MODEM, MODEM, 7, 8, 0))
+			self.assertEqual(len(events), 1)
+			self.assertEqual(await events.get(), ModemStateChanged(MODEM, MODEM, 7, 8, 0))
+			await sleep(0.04)
+			self.assertEqual(len(events), 0)
+			self.assertEqual(await events.get(), changed(state=8, power_state=3))
+			self.assertEqual(events.debounced, 1)
+
+		run(main())
+
+	def test_max_latency(self) -> None:
+
+		async def main() -> None:
+			events = subscription(debounce=0.2, max_latency=0.3)
+			started = get_running_loop().time()
+			for state in range(3):
+				events.put(changed(state=state))
+				await sleep(0.1)
+			self.assertEqual(await events.get(), changed(state=2))
+			# Released by max_latency, before the quiet window after the last change
+			self.assertLess(get_running_loop().time() - started, 0.38)
+
+		run(main())
+
+	def test_close_releases_held(self) -> None:
+
+		async def main() -> None:
+			events = subscription(debounce=10)
+			events.put(changed(state=7))
+			events.close()
+			self.assertEqual(len(events), 1)
+			self.assertEqual(await events.get(), changed(state=7))
+
+		run(main())
+
+
+class FakeSlot:
+
+	def __init__(self, bus: 'FakeBus', path: Optional[str]) -> None:
+		self.bus = bus
+		self.path = path
+
+	def close(self) -> None:
+		self.bus.paths.remove(self.path)
+
+
+class FakeBus:
+	"""Bus refusing match rules beyond ``limit``."""
+
+	def __init__(self, limit: int) -> None:
+		self.limit = limit
+		self.paths: List[Optional[str]] = []
+
+	async def match_signal_async(self, sender: str, path: Optional[str], interface: Optional[str], member: Optional[str], callback: object) -> FakeSlot:
+		if len(self.paths) >= self.limit:
+			raise DbusLimitsExceededError('The maximum number of match rules has been reached')
+		self.paths.append(path)
+		return FakeSlot(self, path)
+
+
+class TestScopedHub(TestCase):
+
+	def add_modems(self, hub: MMEventHub, count: int) -> None:
+
+		async def main() -> None:
+			for n in range(count):
+				await hub.add_modem(f'/org/freedesktop/ModemManager1/Modem/{n}')
+
+		run(main())
+
+	def test_scoped(self) -> None:
+		bus = FakeBus(limit=8)
+		hub = MMEventHub(bus, modems=(), max_rules=4)  # type: ignore[arg-type]
+		self.add_modems(hub, 4)
+		self.assertEqual(bus.paths, [f'/org/freedesktop/ModemManager1/Modem/{n}' for n in range(4)])
+		self.assertEqual(len(hub.match_rules), 4)
+
+	def test_max_rules(self) -> None:
+		bus = FakeBus(limit=8)
+		hub = MMEventHub(bus, modems=(), max_rules=4)  # type: ignore[arg-type]
+		self.add_modems(hub, 6)
+		self.assertEqual(bus.paths, [None])
+		self.assertEqual(hub.match_rules, ["type='signal',sender='org.freedesktop.ModemManager1'"])
+		self.assertEqual(hub.errors, [])
+
+	def test_refused_rule(self) -> None:
+		bus = FakeBus(limit=2)
+		hub = MMEventHub(bus, modems=(), max_rules=4)  # type: ignore[arg-type]
+		self.add_modems(hub, 3)
+		self.assertEqual(bus.paths, [None])
+		# The rule of the third modem, then the rule of every signal before the others were removed
+		self.assertEqual(len(hub.errors), 2)
+		self.assertIsInstance(hub.errors[0], DbusLimitsExceededError)
+
+	def test_received_counts_filtered_signals(self) -> None:
+		hub = MMEventHub(FakeBus(limit=8), modems=(MODEM, ))  # type: ignore[arg-type]
+		events = hub.subscribe()
+		hub._on_signal(SimpleNamespace(path='/org/freedesktop/ModemManager1/Modem/1'))  # type: ignore[arg-type]
+		self.assertEqual(hub.received, 1)
+		self.assertEqual(len(events), 0)
+
+class TestClose(TestCase):
+
+	def test_concurrent_gets_woken(self) -> None:
+
+		async def main() -> None:
+			events = subscription()
+			getters = [get_running_loop().create_task(events.get()) for _ in range(2)]
+			await sleep(0)
+			events.put(changed(state=7))
+			events.put(changed(state=8))
+			self.assertEqual(await wait_for(gather(*getters), 1), [changed(state=7), changed(state=8)])
+
+		run(main())
+
+	def test_close_ends_iteration(self) -> None:
+
+		async def main() -> None:
+			events = subscription()
+
+			async def read() -> List[Event]:
+				return [event async for event in events]
+
+			reader = get_running_loop().create_task(read())
+			waiter = get_running_loop().create_task(events.get())
+			await sleep(0)
+			events.close()
+			self.assertEqual(await wait_for(reader, 1), [])
+			with self.assertRaises(StopAsyncIteration):
+				await wait_for(waiter, 1)
+
+		run(main())
+
+
+class TestHub(IsolatedDbusTestCase):
+
+	async def asyncSetUp(self) -> None:
+		await super().asyncSetUp()
+		self.service = FakeModemManager(self.bus)
+		self.modem = self.service.add_modem(0, messaging=True)
+		await self.service.start()
+		self.hub = MMEventHub(self.bus)
+		await self.hub.start()
+		self.addCleanup(self.hub.stop)
+
+	async def test_filtered_by_kind(self) -> None:
+		events = self.hub.events(kinds=(ModemStateChanged, ModemAdded))
+		task = create_task(wait_for(events.__anext__(), 1))
+		await sleep(0)
+		self.modem.state_changed.emit((7, 8, 0))
+		self.assertEqual(await task, ModemStateChanged(MODEM_PATH.format(0), MODEM_PATH.format(0), 7, 8, 0))
+		task = create_task(wait_for(events.__anext__(), 1))
+		self.service.add_modem(1)
+		event = await task
+		self.assertIsInstance(event, ModemAdded)
+		self.assertEqual(event.modem_path, MODEM_PATH.format(1))
+
+	async def test_sms_events_carry_modem_path(self) -> None:
+		events = self.hub.events(modems=[MODEM_PATH.format(0)], kinds=(SmsAdded, PropertiesChanged))
+		task = create_task(wait_for(events.__anext__(), 1))
+		await sleep(0)
+		sms = self.service.add_sms(self.modem, 0, received=True)
+		# The Messages property change comes first
+		self.assertIsInstance(await task, PropertiesChanged)
+		self.assertEqual(await wait_for(events.__anext__(), 1), SmsAdded(MODEM_PATH.format(0), MODEM_PATH.format(0), SMS_PATH.format(0), True))
+		task = create_task(wait_for(events.__anext__(), 1))
+		sms.properties_changed.emit(('org.freedesktop.ModemManager1.Sms', {'State': ('u', 3)}, []))
+		event = await task
+		self.assertEqual((event.object_path, event.modem_path), (SMS_PATH.format(0), MODEM_PATH.format(0)))
+
+	async def test_stop_ends_events(self) -> None:
+
+		async def read() -> List[Event]:
+			return [event async for event in self.hub.events()]
+
+		task = create_task(read())
+		await sleep(0)
+		self.modem.state_changed.emit((7, 8, 0))
+		await sleep(0.1)
+		self.hub.stop()
+		self.assertEqual(await wait_for(task, 1), [ModemStateChanged(MODEM_PATH.format(0), MODEM_PATH.format(0), 7, 8, 0)])
@@ -0,0 +1,39 @@
+from asyncio import wait_for
+
+from sdbus.unittest import IsolatedDbusTestCase
+
+from sdbus_async.modemmanager import MMModemMessaging, MMSmsState
+
+from .fake_modem_manager import MODEM_PATH, SMS_PATH, FakeModemManager
+
+RECEIVED = MMSmsState.MM_SMS_STATE_RECEIVED
+
+
+class TestInbox(IsolatedDbusTestCase):
+
+	async def asyncSetUp(self) -> None:
+		await super().asyncSetUp()
+		self.service = FakeModemManager(self.bus)
+		self.modem = self.service.add_modem(0, messaging=True)
+		await self.service.start()
+		self.messaging = MMModemMessaging(MODEM_PATH.format(0), self.bus)
+
+	async def test_existing_messages(self) -> None:
+		self.service.add_sms(self.modem, 0, received=True, state=RECEIVED, text='first')
+		inbox = self.messaging.inbox(existing=True)
+		sms = await wait_for(inbox.__anext__(), 1)
+		self.assertEqual((sms.object_path, sms.text), (SMS_PATH.format(0), 'first'))
+		await inbox.aclose()
+
+	async def test_messages_deleted_by_another_client_skipped(self) -> None:
+		self.service.add_sms(self.modem, 0, received=True, state=RECEIVED, text='first')
+		self.service.add_sms(self.modem, 1, received=True, state=RECEIVED, text='second')
+		# Unexported before its Deleted signal is emitted
+		self.service.remove(SMS_PATH.format(0))
+		inbox = self.messaging.inbox(delete=True, existing=True)
+		self.assertEqual((await wait_for(inbox.__anext__(), 1)).text, 'second')
+		# Deleted while handled, so that deleting it fails
+		self.service.remove(SMS_PATH.format(1))
+		self.service.add_sms(self.modem, 2, received=True, state=RECEIVED, text='third')
+		self.assertEqual((await wait_for(inbox.__anext__(), 1)).text, 'third')
+		await inbox.aclose()
@@ -0,0 +1,41 @@
+from unittest import TestCase
+
+from sdbus_async.modemmanager import MMModemIndex
+
+MODEM_0 = '/org/freedesktop/ModemManager1/Modem/0'
+MODEM_1 = '/org/freedesktop/ModemManager1/Modem/1'
+
+
+class TestModemIndex(TestCase):
+
+	def test_find(self) -> None:
+		index = MMModemIndex()
+		index.update(MODEM_0, {'equipment_identifier': '350000000000000', 'primary_port': 'cdc-wdm0', 'model': 'EG25'})
+		index.update(MODEM_0, {'sim_identifier': '8900', 'imsi': ''})
+		self.assertEqual(index.find('equipment_identifier', '350000000000000'), MODEM_0)
+		self.assertEqual(index.find('sim_identifier', '8900'), MODEM_0)
+		self.assertIsNone(index.find('imsi', ''))
+		self.assertEqual(index.values(MODEM_0), {'equipment_identifier': '350000000000000', 'primary_port': 'cdc-wdm0', 'sim_identifier': '8900'})
+		self.assertIn(MODEM_0, index)
+		self.assertEqual(list(index), [MODEM_0])
+
+	def test_update_replaces(self) -> None:
+		index = MMModemIndex()
+		index.update(MODEM_0, {'sim_identifier': '8900', 'imsi': '2400'})
+		# SIM card swapped
+		index.update(MODEM_0, {'sim_identifier': '8901', 'imsi': None})
+		self.assertIsNone(index.find('sim_identifier', '8900'))
+		self.assertIsNone(index.find('imsi', '2400'))
+		self.assertEqual(index.find('sim_identifier', '8901'), MODEM_0)
+
+	def test_moved_value(self) -> None:
+		index = MMModemIndex()
+		index.update(MODEM_0, {'primary_port': 'cdc-wdm0'})
+		# The port was reused by another modem before the first one was updated
+		index.update(MODEM_1, {'primary_port': 'cdc-wdm0'})
+		index.update(MODEM_0, {'primary_port': 'cdc-wdm1'})
+		self.assertEqual(index.find('primary_port', 'cdc-wdm0'), MODEM_1)
+		index.discard(MODEM_0)
+		self.assertEqual(index.find('primary_port', 'cdc-wdm0'), MODEM_1)
+		self.assertIsNone(index.find('primary_port', 'cdc-wdm1'))
+		self.assertNotIn(MODEM_0, index)
@@ -0,0 +1,78 @@
+from sdbus.exceptions import SdBusBaseError
+from sdbus.unittest import IsolatedDbusTestCase
+
+from sdbus_async.modemmanager import MMModems, MMModemState
+
+from .fake_modem_manager import MODEM_PATH, FakeModemManager
+
+
+class TestModems(IsolatedDbusTestCase):
+
+	async def asyncSetUp(self) -> None:
+		await super().asyncSetUp()
+		self.service = FakeModemManager(self.bus)
+		self.modem = self.service.add_modem(0, manufacturer='Quectel', state=8)
+		await self.service.start()
+		self.manager = MMModems(self.bus)
+
+	async def test_hydrated_properties_read_without_get(self) -> None:
+		modem, = await self.manager.get_modems(hydrate=True)
+		self.assertEqual(modem._dbus.object_path, MODEM_PATH.format(0))
+		gets = self.modem.gets.copy()
+		self.assertEqual(await modem.manufacturer, 'Quectel')
+		self.assertEqual(await modem.state, 8)
+		self.assertEqual(self.modem.gets, gets)
+		# Kept current by whoever updates the interfaces
+		modem.interfaces['org.freedesktop.ModemManager1.Modem']['state'] = 11
+		self.assertEqual(await modem.state, 11)
+		self.assertEqual(self.modem.gets, gets)
+
+	async def test_properties_read_from_bus_without_hydration(self) -> None:
+		modem, = await self.manager.get_modems()
+		gets = self.modem.gets['manufacturer']
+		self.assertEqual(await modem.manufacturer, 'Quectel')
+		self.assertEqual(self.modem.gets['manufacturer'], gets + 1)
+
+	async def test_modems_kept_per_instance_and_path(self) -> None:
+		modem, = await self.manager.get_modems()
+		self.assertIs(self.manager.get(MODEM_PATH.format(0)), modem)
+		self.assertEqual(MMModems(self.bus).modems, [])
+		self.service.add_modem(1)
+		self.assertEqual(len(await self.manager.get_modems()), 2)
+		self.assertIs(self.manager.get(MODEM_PATH.format(0)), modem)
+		self.service.remove_modem(0)
+		self.assertEqual([m._dbus.object_path for m in await self.manager.get_modems()], [MODEM_PATH.format(1)])
+		self.assertIsNone(self.manager.get(MODEM_PATH.format(0)))
+
+	async def test_sub_interfaces_created_on_first_access(self) -> None:
+		self.service.add_modem(1, messaging=True)
+		await self.manager.get_modems()
+		data, sms = self.manager.get(MODEM_PATH.format(0)), self.manager.get(MODEM_PATH.format(1))
+		self.assertIsNone(data.messaging)
+		self.assertNotIn('messaging', vars(sms))
+		self.assertIs(sms.messaging, sms.messaging)
+		self.assertEqual(sms.messaging._dbus.object_path, MODEM_PATH.format(1))
+		sms.remove_interfaces(['org.freedesktop.ModemManager1.Modem.Messaging'])
+		self.assertNotIn('messaging', vars(sms))
+		self.assertIsNone(sms.messaging)
+
+	async def test_fetch_lists_modems_first(self) -> None:
+		self.service.add_modem(1, state=9)
+		self.assertEqual(await self.manager.fetch_properties(['state', 'manufacturer'], limit=1), {
+			MODEM_PATH.format(0): {'state': 8, 'manufacturer': 'Quectel'},
+			MODEM_PATH.format(1): {'state': 9, 'manufacturer': ''},
+		})
+		snapshots = await MMModems(self.bus).fetch_snapshots()
+		self.assertEqual(sorted(snapshots), [MODEM_PATH.format(0), MODEM_PATH.format(1)])
+		self.assertIs(snapshots[MODEM_PATH.format(0)].state, MMModemState.MM_MODEM_STATE_REGISTERED)
+		self.assertEqual(snapshots[MODEM_PATH.format(0)].manufacturer, 'Quectel')
+
+	async def test_fetch_return_exceptions(self) -> None:
+		self.service.add_modem(1)
+		await self.manager.get_modems()
+		self.service.remove_modem(1)
+		with self.assertRaises(SdBusBaseError):
+			await self.manager.fetch_properties()
+		results = await self.manager.fetch_snapshots(return_exceptions=True)
+		self.assertEqual(results[MODEM_PATH.format(0)].manufacturer, 'Quectel')
+		self.assertIsInstance(results[MODEM_PATH.format(1)], SdBusBaseError)
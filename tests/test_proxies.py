@@ -0,0 +1,74 @@
+import sys
+from asyncio import sleep
+from pathlib import Path
+from subprocess import PIPE, Popen
+
+from sdbus import sd_bus_open_user
+from sdbus.unittest import IsolatedDbusTestCase
+
+from sdbus_async.modemmanager import MMModemMessaging, MMModemVoice
+from sdbus_block.modemmanager import MMModemMessaging as MMModemMessagingBlock, MMModemVoice as MMModemVoiceBlock
+
+from .fake_modem_manager import CALL_PATH, MODEM_PATH, SMS_PATH, FakeModemManager
+
+
+class TestProxies(IsolatedDbusTestCase):
+
+	async def asyncSetUp(self) -> None:
+		await super().asyncSetUp()
+		self.service = FakeModemManager(self.bus)
+		self.modem = self.service.add_modem(0, messaging=True, voice=True)
+		self.service.add_sms(self.modem, 0)
+		self.service.add_call(self.modem, 0)
+		await self.service.start()
+
+	async def test_same_proxy_until_deleted(self) -> None:
+		messaging = MMModemMessaging(MODEM_PATH.format(0), self.bus)
+		sms = await messaging.get_sms(SMS_PATH.format(0))
+		self.assertIs(await messaging.get_sms(SMS_PATH.format(0)), sms)
+		self.assertEqual(await messaging.get_messages(), [sms])
+		await messaging.delete_sms(sms)
+		self.assertIsNot(await messaging.get_sms(SMS_PATH.format(0)), sms)
+
+		voice = MMModemVoice(MODEM_PATH.format(0), self.bus)
+		call = await voice.get_call(CALL_PATH.format(0))
+		self.assertEqual(await voice.get_calls(), [call])
+		await voice.remove_call(call)
+		self.assertIsNot(await voice.get_call(CALL_PATH.format(0)), call)
+
+	async def test_evicted_by_deleted_signal(self) -> None:
+		messaging = MMModemMessaging(MODEM_PATH.format(0), self.bus)
+		sms = await messaging.get_sms(SMS_PATH.format(0))
+		# Deleted by another client
+		await self.modem.delete(SMS_PATH.format(0))
+		for _ in range(100):
+			if await messaging.get_sms(SMS_PATH.format(0)) is not sms:
+				break
+			await sleep(0.01)
+		self.assertIsNot(await messaging.get_sms(SMS_PATH.format(0)), sms)
+
+
+class TestBlockingProxies(IsolatedDbusTestCase):
+
+	def setUp(self) -> None:
+		super().setUp()
+		self.service = Popen((sys.executable, str(Path(__file__).with_name('fake_modem_manager.py'))), stdin=PIPE, stdout=PIPE, text=True)
+		self.addCleanup(self.service.wait)
+		self.addCleanup(self.service.stdin.close)
+		self.assertEqual(self.service.stdout.readline(), 'ready\n')
+		self.bus = sd_bus_open_user()
+
+	def test_same_proxy_until_deleted(self) -> None:
+		messaging = MMModemMessagingBlock(MODEM_PATH.format(0), self.bus)
+		sms = messaging.get_sms(SMS_PATH.format(0))
+		self.assertIs(messaging.get_sms(SMS_PATH.format(0)), sms)
+		self.assertEqual(messaging.get_messages(), [sms])
+		messaging.delete_sms(sms)
+		self.assertIsNot(messaging.get_sms(SMS_PATH.format(0)), sms)
+
+		voice = MMModemVoiceBlock(MODEM_PATH.format(0), self.bus)
+		call = voice.get_call(CALL_PATH.format(0))
+		self.assertEqual(voice.get_calls(), [call])
+		voice.remove_call(call)
+		self.assertIsNot(voice.get_call(CALL_PATH.format(0)), call)
+		self.assertEqual(voice.call_object_paths, [])
@@ -0,0 +1,96 @@
+import json
+import sqlite3
+from asyncio import run
+from io import StringIO
+from types import SimpleNamespace
+from typing import Any, Dict, List, Tuple
+from unittest import TestCase
+
+from sdbus_async.modemmanager import JsonLinesSink, PurgeReport, SmsSnapshot, SqliteSink, purge_messages
+from sdbus_async.modemmanager.enums import MMSmsState
+
+
+def sms(path: str, state: int, text: str = 'hello') -> SmsSnapshot:
+	return SmsSnapshot(path, {'number': '+123', 'text': text, 'timestamp': '2024-01-02T03:04:05+00', 'state': state, 'pdu_type': 1, 'data': b'\x01'})
+
+
+class FakeSms:
+
+	def __init__(self, path: str, state: int) -> None:
+		self._dbus = SimpleNamespace(object_path=path)
+		self.state = state
+
+	async def _properties_get_all(self, interface: str) -> Dict[str, Tuple[str, Any]]:
+		return {'Number': ('s', '+123'), 'Text': ('s', self._dbus.object_path), 'State': ('u', self.state)}
+
+
+class FakeMessaging:
+
+	def __init__(self, states: List[int]) -> None:
+		self.stored = {f'/sms/{i}': FakeSms(f'/sms/{i}', state) for i, state in enumerate(states)}
+
+	@property
+	async def messages(self) -> List[str]:
+		return list(self.stored)
+
+	async def get_sms(self, path: str) -> FakeSms:
+		return self.stored[path]
+
+	async def delete_sms(self, sms: FakeSms) -> None:
+		del self.stored[sms._dbus.object_path]
+
+
+class ListSink:
+
+	def __init__(self) -> None:
+		self.chunks: List[List[SmsSnapshot]] = []
+
+	def write(self, messages: List[SmsSnapshot]) -> None:
+		self.chunks.append(messages)
+
+
+class TestSinks(TestCase):
+
+	def test_json_lines(self) -> None:
+		file = StringIO()
+		with JsonLinesSink(file) as sink:
+			sink.write([sms('/sms/0', MMSmsState.MM_SMS_STATE_RECEIVED), sms('/sms/1', MMSmsState.MM_SMS_STATE_SENT, 'héllo')])
+		lines = [json.loads(line) for line in file.getvalue().splitlines()]
+		self.assertEqual([line['object_path'] for line in lines], ['/sms/0', '/sms/1'])
+		self.assertEqual(lines[1]['text'], 'héllo')
+		self.assertEqual(lines[0]['data'], '01')
+		self.assertEqual(lines[0]['state'], MMSmsState.MM_SMS_STATE_RECEIVED)
+
+	def test_sqlite(self) -> None:
+		connection = sqlite3.connect(':memory:')
+		with SqliteSink(connection, table='archive') as sink:
+			sink.write([sms('/sms/0', MMSmsState.MM_SMS_STATE_RECEIVED)])
+		rows = connection.execute('SELECT object_path, number, text, state, pdu_type, properties FROM archive').fetchall()
+		self.assertEqual(rows[0][:5], ('/sms/0', '+123', 'hello', MMSmsState.MM_SMS_STATE_RECEIVED, 1))
+		self.assertEqual(json.loads(rows[0][5])['timestamp'], '2024-01-02T03:04:05+00')
+
+
+class TestPurge(TestCase):
+
+	def test_delete_without_sink(self) -> None:
+		with self.assertRaises(ValueError):
+			run(purge_messages(FakeMessaging([MMSmsState.MM_SMS_STATE_RECEIVED])))
+
+	def test_purge(self) -> None:
+		states = [MMSmsState.MM_SMS_STATE_RECEIVED, MMSmsState.MM_SMS_STATE_STORED, MMSmsState.MM_SMS_STATE_RECEIVING, MMSmsState.MM_SMS_STATE_SENT]
+		messaging = FakeMessaging(states * 3)
+		sink = ListSink()
+		reports: List[PurgeReport] = []
+		report = run(purge_messages(messaging, sink, chunk=5, progress=reports.append))
+		self.assertEqual([len(chunk) for chunk in sink.chunks], [3, 2, 1])
+		self.assertEqual((report.total, report.read, report.written, report.deleted, report.skipped, report.failed), (12, 6, 6, 6, 6, 0))
+		self.assertEqual(len(reports), 3)
+		self.assertEqual(sorted(sms.state for sms in messaging.stored.values()), [MMSmsState.MM_SMS_STATE_STORED] * 3 + [MMSmsState.MM_SMS_STATE_RECEIVING] * 3)
+
+	def test_export_only(self) -> None:
+		messaging = FakeMessaging([MMSmsState.MM_SMS_STATE_RECEIVED])
+		sink = ListSink()
+		report = run(purge_messages(messaging, sink, delete=False))
+		self.assertEqual((report.written, report.deleted), (1, 0))
+		self.assertEqual(len(messaging.stored), 1)
+		self.assertEqual(sink.chunks[0][0].text, '/sms/0')
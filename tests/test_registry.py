@@ -0,0 +1,43 @@
+from asyncio import CancelledError, create_task, sleep, wait_for
+
+from sdbus.unittest import IsolatedDbusTestCase
+
+from sdbus_async.modemmanager import MMModemRegistry
+
+from .fake_modem_manager import SIM_PATH, FakeModemManager, change
+
+
+class TestRegistry(IsolatedDbusTestCase):
+
+	async def test_stop_cancels_waiters(self) -> None:
+		registry = MMModemRegistry(self.bus)
+		waiters = [create_task(registry.wait_added()), create_task(registry.wait_removed())]
+		await sleep(0)
+		registry.stop()
+		for waiter in waiters:
+			with self.assertRaises(CancelledError):
+				await wait_for(waiter, 1)
+
+	async def test_sim_changes_indexed(self) -> None:
+		service = FakeModemManager(self.bus)
+		sim = service.add_sim(0, sim_identifier='8900', imsi='2400')
+		service.add_modem(0, sim_object_path=SIM_PATH.format(0))
+		await service.start()
+		async with MMModemRegistry(self.bus) as registry:
+			modem = registry.find('imsi', '2400')
+			self.assertIsNotNone(modem)
+			change(sim, 'imsi', '2401')
+			for _ in range(100):
+				if registry.find('imsi', '2401') is modem:
+					break
+				await sleep(0.01)
+			self.assertIs(registry.find('imsi', '2401'), modem)
+			self.assertIsNone(registry.find('imsi', '2400'))
+
+	async def test_started_once(self) -> None:
+		service = FakeModemManager(self.bus)
+		await service.start()
+		async with MMModemRegistry(self.bus) as registry:
+			slots = list(registry._slots)
+			await registry.start()
+			self.assertEqual(registry._slots, slots)
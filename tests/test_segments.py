@@ -0,0 +1,63 @@
+from unittest import TestCase
+
+from sdbus_async.modemmanager import segments as async_segments
+from sdbus_async.modemmanager.segments import GSM7, UCS2, encode_gsm7, gsm7_septets, is_gsm7, plan_sms, transliterate_gsm7
+from sdbus_block.modemmanager import segments as block_segments
+
+
+class TestGsm7(TestCase):
+
+	def test_alphabet(self) -> None:
+		self.assertTrue(is_gsm7('Hello @£$ ÄÖÑÜ {€}'))
+		self.assertFalse(is_gsm7('Привет'))
+		self.assertFalse(is_gsm7('a’b'))
+
+	def test_septets(self) -> None:
+		self.assertEqual(gsm7_septets('abc'), 3)
+		self.assertEqual(gsm7_septets('a€[]'), 7)
+
+	def test_encode(self) -> None:
+		self.assertEqual(encode_gsm7('@A€'), bytes((0x00, 0x41, 0x1B, 0x65)))
+		with self.assertRaises(ValueError):
+			encode_gsm7('ć')
+
+	def test_transliterate(self) -> None:
+		self.assertEqual(transliterate_gsm7('“Café” – naïve…'), '"Café" - naive...')
+		self.assertEqual(transliterate_gsm7('plain text'), 'plain text')
+		# Kept when there is no equivalent
+		self.assertEqual(transliterate_gsm7('日本'), '日本')
+
+
+class TestPlan(TestCase):
+
+	def test_single(self) -> None:
+		plan = plan_sms('a' * 160)
+		self.assertEqual((plan.encoding, plan.count, plan.units, plan.remaining), (GSM7, 1, (160, ), 0))
+
+	def test_concatenated(self) -> None:
+		plan = plan_sms('a' * 161)
+		self.assertEqual((plan.encoding, plan.units, plan.remaining), (GSM7, (153, 8), 145))
+		self.assertEqual(plan.text, 'a' * 161)
+
+	def test_escape_not_split(self) -> None:
+		plan = plan_sms('a' * 152 + '€' + 'b' * 10)
+		self.assertEqual(plan.segments[0], 'a' * 152)
+		self.assertEqual(plan.units, (152, 12))
+
+	def test_ucs2(self) -> None:
+		self.assertEqual(plan_sms('ж' * 70).units, (70, ))
+		plan = plan_sms('ж' * 66 + '😀' + 'ж' * 5)
+		self.assertEqual(plan.encoding, UCS2)
+		# The surrogate pair does not fit in the first part
+		self.assertEqual(plan.segments[0], 'ж' * 66)
+		self.assertEqual(plan.units, (66, 7))
+
+	def test_transliterate(self) -> None:
+		text = '“quoted” ' * 10
+		self.assertEqual(plan_sms(text).encoding, UCS2)
+		plan = plan_sms(text, transliterate=True)
+		self.assertEqual((plan.encoding, plan.count, plan.text), (GSM7, 1, '"quoted" ' * 10))
+
+	def test_flavors(self) -> None:
+		text = 'Grüße – 10€ ' * 20
+		self.assertEqual(tuple(async_segments.plan_sms(text, True)), tuple(block_segments.plan_sms(text, True)))
@@ -0,0 +1,155 @@
+from asyncio import gather, run
+from typing import List, Sequence
+from unittest import TestCase
+
+from sdbus.exceptions import DbusNoReplyError, SdBusUnmappedMessageError
+
+from sdbus_async.modemmanager import MMSmsSender, is_transient, is_unanswered
+from sdbus_async.modemmanager.enums import MMSmsState
+
+RETRY = SdBusUnmappedMessageError('org.freedesktop.ModemManager1.Error.Core.Retry', 'busy')
+RESPONSE_TIMEOUT = SdBusUnmappedMessageError('org.freedesktop.ModemManager1.Error.Serial.ResponseTimeout', 'timeout')
+
+
+class FakeSms:
+
+	def __init__(self, path: str, number: str, text: str, errors: List[Exception], sent_anyway: bool) -> None:
+		self.path = path
+		self.current_number = number
+		self.current_text = text
+		self.current_state = MMSmsState.MM_SMS_STATE_STORED
+		self.errors = errors
+		self.sent_anyway = sent_anyway
+		self.sends = 0
+
+	async def send(self) -> None:
+		self.sends += 1
+		if self.errors:
+			if self.sent_anyway:
+				self.current_state = MMSmsState.MM_SMS_STATE_SENT
+			raise self.errors.pop(0)
+		self.current_state = MMSmsState.MM_SMS_STATE_SENT
+
+	@property
+	async def state(self) -> int:
+		return self.current_state
+
+	@property
+	async def number(self) -> str:
+		return self.current_number
+
+	@property
+	async def text(self) -> str:
+		return self.current_text
+
+	@property
+	async def message_reference(self) -> int:
+		return 7
+
+
+class FakeMessaging:
+	"""Messaging interface whose calls fail with the given errors, the calls carried out anyway if ``carried_out``."""
+
+	def __init__(self, create_errors: Sequence[Exception] = (), send_errors: Sequence[Exception] = (), carried_out: bool = False) -> None:
+		self.create_errors = list(create_errors)
+		self.send_errors = list(send_errors)
+		self.carried_out = carried_out
+		self.stored: List[FakeSms] = []
+		self.created: List[FakeSms] = []
+		self.listed = 0
+
+	@property
+	async def messages(self) -> List[str]:
+		self.listed += 1
+		return [sms.path for sms in self.stored]
+
+	async def get_sms(self, path: str) -> FakeSms:
+		return next(sms for sms in self.stored if sms.path == path)
+
+	async def create_sms(self, number: str, text: str, data: bytes, delivery_report_request: bool = False) -> FakeSms:
+		sms = FakeSms(f'/sms/{len(self.created)}', number, text, self.send_errors, self.carried_out)
+		if self.create_errors:
+			if self.carried_out:
+				self.created.append(sms)
+				self.stored.append(sms)
+			raise self.create_errors.pop(0)
+		self.created.append(sms)
+		self.stored.append(sms)
+		return sms
+
+	async def delete_sms(self, sms: FakeSms) -> None:
+		self.stored.remove(sms)
+
+
+def send(messaging: FakeMessaging) -> int:
+
+	async def main() -> int:
+		async with MMSmsSender(messaging, backoff=0) as sender:
+			return await sender.send('+123', 'hello')
+
+	return run(main())
+
+
+class TestSender(TestCase):
+
+	def test_errors(self) -> None:
+		self.assertTrue(is_transient(RETRY))
+		self.assertFalse(is_transient(RESPONSE_TIMEOUT))
+		self.assertFalse(is_transient(DbusNoReplyError()))
+		self.assertTrue(is_unanswered(RESPONSE_TIMEOUT))
+		self.assertTrue(is_unanswered(DbusNoReplyError()))
+		self.assertFalse(is_unanswered(RETRY))
+
+	def test_transient_send_retried(self) -> None:
+		messaging = FakeMessaging(send_errors=[RETRY])
+		self.assertEqual(send(messaging), 7)
+		self.assertEqual(messaging.created[0].sends, 2)
+		self.assertEqual(messaging.stored, [])
+		# The messages are only listed after a create call without an answer
+		self.assertEqual(messaging.listed, 0)
+
+	def test_unanswered_send_not_repeated(self) -> None:
+		messaging = FakeMessaging(send_errors=[DbusNoReplyError()], carried_out=True)
+		self.assertEqual(send(messaging), 7)
+		self.assertEqual(messaging.created[0].sends, 1)
+
+	def test_unanswered_send_repeated_when_not_sent(self) -> None:
+		messaging = FakeMessaging(send_errors=[RESPONSE_TIMEOUT])
+		self.assertEqual(send(messaging), 7)
+		self.assertEqual(messaging.created[0].sends, 2)
+
+	def test_unanswered_create_not_repeated(self) -> None:
+		messaging = FakeMessaging(create_errors=[DbusNoReplyError()], carried_out=True)
+		self.assertEqual(send(messaging), 7)
+		self.assertEqual(len(messaging.created), 1)
+		self.assertEqual(messaging.stored, [])
+
+	def test_unanswered_create_repeated_when_not_created(self) -> None:
+		messaging = FakeMessaging(create_errors=[DbusNoReplyError()])
+		self.assertEqual(send(messaging), 7)
+		self.assertEqual(len(messaging.created), 1)
+		self.assertEqual(messaging.stored, [])
+
+	def test_unanswered_create_does_not_take_messages_being_sent(self) -> None:
+		messaging = FakeMessaging()
+		sending = FakeSms('/sms/sending', '+123', 'hello', [], False)
+		messaging.stored.append(sending)
+
+		async def main() -> None:
+			async with MMSmsSender(messaging, backoff=0) as sender:
+				sender._sending.add(sending)  # type: ignore[arg-type]
+				messaging.create_errors.append(DbusNoReplyError())
+				self.assertEqual(await gather(sender.send('+123', 'hello'), sender.send('+456', 'hello')), [7, 7])
+
+		run(main())
+		self.assertEqual(sending.sends, 0)
+		self.assertEqual(len(messaging.created), 2)
+		self.assertEqual([sms.sends for sms in messaging.created], [1, 1])
+
+	def test_send_requires_start(self) -> None:
+
+		async def main() -> None:
+			with self.assertRaises(RuntimeError):
+				await MMSmsSender(FakeMessaging()).send('+123', 'hello')
+
+		run(main())
@@ -0,0 +1,39 @@
+from array import array
+from math import isnan
+from unittest import TestCase
+
+from sdbus_async.modemmanager import SIGNAL_RECORDS, GsmSignal, LteSignal
+
+LTE = {'rssi': ('d', -60.0), 'rsrp': ('d', -90.0), 'rsrq': ('d', -10.0), 'error-rate': ('d', 0.5), 'unknown': ('d', 1.0)}
+
+
+class TestSignalRecord(TestCase):
+
+	def test_decode(self) -> None:
+		record = LteSignal.decode(LTE)
+		self.assertEqual(record.as_dict(), {'rssi': -60.0, 'rsrq': -10.0, 'rsrp': -90.0, 'snr': None, 'error_rate': 0.5})
+		self.assertEqual(record, LteSignal(-60.0, -10.0, -90.0, None, 0.5))
+		self.assertIs(SIGNAL_RECORDS['lte'], LteSignal)
+
+	def test_missing_values_default_to_none(self) -> None:
+		record = LteSignal(-60.0)
+		self.assertEqual(record.as_dict(), {'rssi': -60.0, 'rsrq': None, 'rsrp': None, 'snr': None, 'error_rate': None})
+		self.assertEqual(LteSignal(), LteSignal.decode({}))
+		with self.assertRaises(TypeError):
+			GsmSignal(*range(len(GsmSignal.keys) + 1))
+
+	def test_decode_row(self) -> None:
+		row = LteSignal.decode_row(LTE)
+		self.assertEqual(len(row), len(LteSignal.keys))
+		self.assertEqual([row[0], row[1], row[2], row[4]], [-60.0, -10.0, -90.0, 0.5])
+		self.assertTrue(isnan(row[3]))
+
+	def test_decode_row_into_buffer(self) -> None:
+		width = len(GsmSignal.keys)
+		samples = array('d', [7.0] * (width * 3))
+		GsmSignal.decode_row({'rssi': ('d', -70.0)}, samples, width)
+		self.assertEqual(samples[:width].tolist(), [7.0] * width)
+		self.assertEqual(samples[width], -70.0)
+		# Values missing from the dictionary are reset
+		self.assertTrue(isnan(samples[width + 1]))
+		self.assertEqual(samples[2 * width:].tolist(), [7.0] * width)
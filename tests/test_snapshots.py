@@ -0,0 +1,81 @@
+from pickle import dumps, loads
+from unittest import TestCase
+
+from sdbus.unittest import IsolatedDbusTestCase
+
+from sdbus_async.modemmanager import MMBearerIpFamily, MMModem, MMModemBand, MMModemMode, MMModemState, MMSimType, ModemSnapshot, SimSnapshot
+from sdbus_async.modemmanager.enums import MMModemCapability
+
+from .fake_modem_manager import MODEM_PATH, FakeModemManager
+
+PATH = MODEM_PATH.format(0)
+LTE = MMModemCapability.MM_MODEM_CAPABILITY_LTE
+MODE_4G = MMModemMode.MM_MODEM_MODE_4G
+MODE_3G = MMModemMode.MM_MODEM_MODE_3G
+
+
+class TestSnapshots(TestCase):
+
+	def test_enums_converted(self) -> None:
+		modem = ModemSnapshot(PATH, {'state': 8, 'current_capabilities': 8, 'supported_capabilities': [8, 12], 'current_modes': (12, 8), 'supported_modes': [(4, 0)]})
+		self.assertIs(modem.state, MMModemState.MM_MODEM_STATE_REGISTERED)
+		self.assertIs(modem.current_capabilities, LTE)
+		# Combinations are not members
+		self.assertEqual(modem.supported_capabilities, [LTE, 12])
+		self.assertIs(modem.supported_capabilities[0], LTE)
+		self.assertEqual(modem.current_modes, (MODE_3G | MODE_4G, MODE_4G))
+		self.assertIsInstance(modem.current_modes[0], MMModemMode)
+		self.assertEqual(modem.supported_modes, [(MODE_3G, MMModemMode.MM_MODEM_MODE_NONE)])
+		self.assertIs(SimSnapshot('/', {'sim_type': 2}).sim_type, MMSimType.MM_SIM_TYPE_ESIM)
+
+	def test_bands_and_ip_families_converted(self) -> None:
+		modem = ModemSnapshot(PATH, {'current_bands': [31, 1], 'supported_ip_families': 3})
+		self.assertEqual(modem.current_bands, [MMModemBand.MM_MODEM_BAND_EUTRAN_1, MMModemBand.MM_MODEM_BAND_EGSM])
+		self.assertIs(type(modem.current_bands[0]), MMModemBand)
+		self.assertEqual(modem.supported_ip_families, MMBearerIpFamily.MM_BEARER_IP_FAMILY_IPV4 | MMBearerIpFamily.MM_BEARER_IP_FAMILY_IPV6)
+		self.assertIsInstance(modem.supported_ip_families, MMBearerIpFamily)
+
+	def test_unknown_values_kept(self) -> None:
+		modem = ModemSnapshot(PATH, {'state': 99})
+		self.assertEqual(modem.state, 99)
+		self.assertNotIsInstance(modem.state, MMModemState)
+		self.assertIsNone(modem.manufacturer)
+
+	def test_equality(self) -> None:
+		modem = ModemSnapshot(PATH, {'state': 8, 'manufacturer': 'Quectel'})
+		self.assertEqual(modem, ModemSnapshot(PATH, {'state': MMModemState.MM_MODEM_STATE_REGISTERED, 'manufacturer': 'Quectel'}))
+		self.assertNotEqual(modem, ModemSnapshot(PATH, {'state': 7, 'manufacturer': 'Quectel'}))
+		self.assertNotEqual(modem, ModemSnapshot(MODEM_PATH.format(1), {'state': 8, 'manufacturer': 'Quectel'}))
+		self.assertNotEqual(SimSnapshot(PATH, {}), ModemSnapshot(PATH, {}))
+		with self.assertRaises(TypeError):
+			hash(modem)
+
+	def test_immutable(self) -> None:
+		modem = ModemSnapshot(PATH, {'state': 8})
+		with self.assertRaises(AttributeError):
+			modem.state = MMModemState.MM_MODEM_STATE_FAILED  # type: ignore[misc]
+		with self.assertRaises(AttributeError):
+			del modem.state  # type: ignore[misc]
+		with self.assertRaises(AttributeError):
+			modem.__dict__
+
+	def test_pickled(self) -> None:
+		modem = ModemSnapshot(PATH, {'state': 8, 'current_modes': (12, 8), 'own_numbers': ['+123']})
+		copy = loads(dumps(modem))
+		self.assertEqual(copy, modem)
+		self.assertIs(copy.state, MMModemState.MM_MODEM_STATE_REGISTERED)
+		self.assertEqual(copy.as_dict(), modem.as_dict())
+
+
+class TestSnapshotsFromProxy(IsolatedDbusTestCase):
+
+	async def test_read_with_get_all(self) -> None:
+		service = FakeModemManager(self.bus)
+		service.add_modem(0, manufacturer='Quectel', state=8, current_modes=(12, 8))
+		await service.start()
+		modem = await ModemSnapshot.from_proxy(MMModem(PATH, self.bus))
+		self.assertEqual(modem.object_path, PATH)
+		self.assertEqual(modem.manufacturer, 'Quectel')
+		self.assertIs(modem.state, MMModemState.MM_MODEM_STATE_REGISTERED)
+		self.assertEqual(modem.current_modes, (MODE_3G | MODE_4G, MODE_4G))
+		self.assertEqual(modem.own_numbers, [])
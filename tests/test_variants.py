@@ -0,0 +1,43 @@
+from unittest import TestCase
+
+from sdbus_async.modemmanager import variants as async_variants
+from sdbus_block.modemmanager import MMBearer
+from sdbus_block.modemmanager import variants as block_variants
+
+
+class TestUnwrapVariant(TestCase):
+
+	def test_nested(self) -> None:
+		value = {
+			'method': ('u', 3),
+			'dns': ('as', ['1.1.1.1', '8.8.8.8']),
+			'nested': ('v', ('v', ('s', 'deep'))),
+			'list': ('av', [('u', 1), ('a{sv}', {'x': ('b', True)})]),
+			'profiles': ('aa{sv}', [{'apn': ('s', 'internet')}, {'apn': ('s', 'ims')}]),
+		}
+		expected = {
+			'method': 3,
+			'dns': ['1.1.1.1', '8.8.8.8'],
+			'nested': 'deep',
+			'list': [1, {'x': True}],
+			'profiles': [{'apn': 'internet'}, {'apn': 'ims'}],
+		}
+		for module in (async_variants, block_variants):
+			with self.subTest(module=module.__name__):
+				self.assertEqual(module.unwrap_variant('a{sv}', value), expected)
+				self.assertEqual(module.unwrap_variants(value), expected)
+
+	def test_plain(self) -> None:
+		self.assertEqual(async_variants.unwrap_variant('v', ('u', 7)), 7)
+		self.assertEqual(async_variants.unwrap_variant('(uu)', (1, 2)), (1, 2))
+		self.assertEqual(async_variants.unwrap_variant('a{sv}', {}), {})
+
+	def test_deep(self) -> None:
+		value = ('s', 'leaf')
+		for _ in range(10000):
+			value = ('v', value)
+		self.assertEqual(block_variants.unwrap_variant(*value), 'leaf')
+
+	def test_bearer_values(self) -> None:
+		for name in ('ip4_config_values', 'ip6_config_values', 'stats_values', 'properties_values'):
+			self.assertIsInstance(getattr(MMBearer, name), property)